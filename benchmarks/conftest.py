@@ -0,0 +1,76 @@
+"""Benchmarks for the hot binding paths.
+
+Run with pytest-benchmark, e.g.::
+
+    pytest benchmarks --benchmark-save=before
+    pytest benchmarks --benchmark-compare=0001 --benchmark-compare-fail=mean:10%
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+from typing import Any
+
+import pytest
+
+from icupy import icu
+
+SIZES = {
+    "short": 16,
+    "medium": 1024,
+    "large": 2 * 1024 * 1024,
+}
+
+_WORDS = (
+    "alpha",
+    "Beta",
+    "gamma,",
+    "42",
+    "na\xefve",
+    "Stra\xdfe",
+    "ζήτα",
+    "日本語",
+    "テキスト.",
+    "\U0001f338",
+    "3.14",
+    "ＡＢＣ",
+)
+
+
+@functools.cache
+def make_text(size: int) -> str:
+    """Return a deterministic mixed-script text of *size* characters."""
+    parts = []
+    length = 0
+    for word in itertools.cycle(_WORDS):
+        parts.append(word)
+        length += len(word) + 1
+        if length >= size:
+            break
+    return " ".join(parts)[:size]
+
+
+@functools.cache
+def make_words(count: int) -> list[str]:
+    """Return *count* short words."""
+    return [f"{word}{n}" for n, word in zip(range(count), itertools.cycle(_WORDS))]
+
+
+@pytest.fixture(params=list(SIZES))
+def text(request: pytest.FixtureRequest) -> str:
+    return make_text(SIZES[request.param])
+
+
+@pytest.fixture
+def words() -> list[str]:
+    return make_words(10000)
+
+
+def pytest_benchmark_update_json(
+    config: pytest.Config,
+    benchmarks: list[Any],
+    output_json: dict[str, Any],
+) -> None:
+    output_json["icu_version"] = icu.U_ICU_VERSION
+    output_json["unicode_version"] = icu.U_UNICODE_VERSION
@@ -0,0 +1,22 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from icupy import icu
+
+pytestmark = pytest.mark.benchmark(group="locid")
+
+
+def test_init(benchmark: BenchmarkFixture) -> None:
+    result = benchmark(icu.Locale, "en_US")
+    assert result.get_name() == "en_US"
+
+
+def test_for_language_tag(benchmark: BenchmarkFixture) -> None:
+    result = benchmark(icu.Locale.for_language_tag, "zh-Hant-TW-u-ca-chinese")
+    assert result.get_language() == "zh"
+
+
+def test_get_display_name(benchmark: BenchmarkFixture) -> None:
+    loc = icu.Locale("ja_JP")
+    result = benchmark(loc.get_display_name, icu.Locale("en"), icu.UnicodeString())
+    assert result == "Japanese (Japan)"
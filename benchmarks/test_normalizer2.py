@@ -0,0 +1,30 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from icupy import icu
+
+pytestmark = pytest.mark.benchmark(group="normalizer2")
+
+
+@pytest.fixture(scope="module")
+def n2() -> icu.Normalizer2:
+    return icu.Normalizer2.get_instance(None, "nfkc_cf", icu.UNormalization2Mode.UNORM2_COMPOSE)
+
+
+def test_normalize(benchmark: BenchmarkFixture, n2: icu.Normalizer2, text: str) -> None:
+    benchmark.extra_info["chars"] = len(text)
+    result = benchmark(n2.normalize, text)
+    assert isinstance(result, icu.UnicodeString)
+
+
+def test_is_normalized(benchmark: BenchmarkFixture, n2: icu.Normalizer2, text: str) -> None:
+    benchmark.extra_info["chars"] = len(text)
+    benchmark(n2.is_normalized, text)
+
+
+def test_normalize_many(
+    benchmark: BenchmarkFixture, n2: icu.Normalizer2, words: list[str]
+) -> None:
+    benchmark.extra_info["items"] = len(words)
+    result = benchmark(n2.normalize_many, words)
+    assert len(result) == len(words)
@@ -0,0 +1,33 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from icupy import icu
+
+pytestmark = [
+    pytest.mark.benchmark(group="numberformatter"),
+    pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 60, reason="ICU4C<60"),
+]
+
+
+@pytest.fixture(scope="module")
+def fmt() -> icu.number.LocalizedNumberFormatter:
+    return icu.number.NumberFormatter.with_locale(icu.Locale("en-US"))
+
+
+def test_format_double(
+    benchmark: BenchmarkFixture, fmt: icu.number.LocalizedNumberFormatter
+) -> None:
+    result = benchmark(lambda: str(fmt.format_double(1234567.891)))
+    assert result == "1,234,567.891"
+
+
+def test_format_double_loop(
+    benchmark: BenchmarkFixture, fmt: icu.number.LocalizedNumberFormatter
+) -> None:
+    values = [n * 1.25 for n in range(1000)]
+    benchmark.extra_info["items"] = len(values)
+
+    def _format_all() -> list[str]:
+        return [str(fmt.format_double(x)) for x in values]
+
+    assert len(benchmark(_format_all)) == len(values)
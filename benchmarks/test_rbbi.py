@@ -0,0 +1,35 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from icupy import icu
+
+pytestmark = pytest.mark.benchmark(group="rbbi")
+
+
+@pytest.fixture(scope="module")
+def bi() -> icu.BreakIterator:
+    return icu.BreakIterator.create_word_instance(icu.Locale("en"))
+
+
+def test_iterate(benchmark: BenchmarkFixture, bi: icu.BreakIterator, text: str) -> None:
+    benchmark.extra_info["chars"] = len(text)
+    src = icu.UnicodeString(text)
+
+    def _iterate() -> int:
+        bi.set_text(src)
+        return sum(1 for _ in bi)
+
+    assert benchmark(_iterate) > 0
+
+
+def test_boundaries(benchmark: BenchmarkFixture, bi: icu.BreakIterator, text: str) -> None:
+    benchmark.extra_info["chars"] = len(text)
+    result = benchmark(bi.boundaries, text)
+    assert len(result) > 1
+
+
+@pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 52, reason="ICU4C<52")
+def test_split(benchmark: BenchmarkFixture, bi: icu.BreakIterator, text: str) -> None:
+    benchmark.extra_info["chars"] = len(text)
+    result = benchmark(bi.split, text, (icu.UBRK_WORD_NUMBER, icu.UBRK_WORD_IDEO_LIMIT))
+    assert len(result) > 0
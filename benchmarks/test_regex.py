@@ -0,0 +1,30 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from icupy import icu
+
+pytestmark = pytest.mark.benchmark(group="regex")
+
+
+@pytest.fixture(scope="module")
+def pattern() -> icu.RegexPattern:
+    return icu.RegexPattern.compile(r"\p{L}+", 0)
+
+
+def test_find(benchmark: BenchmarkFixture, pattern: icu.RegexPattern, text: str) -> None:
+    benchmark.extra_info["chars"] = len(text)
+    src = icu.UnicodeString(text)
+    matcher = pattern.matcher(src)
+
+    def _find_all() -> int:
+        matcher.reset()
+        count = 0
+        while matcher.find():
+            count += 1
+        return count
+
+    assert benchmark(_find_all) > 0
+
+
+def test_compile(benchmark: BenchmarkFixture) -> None:
+    benchmark(icu.RegexPattern.compile, r"(\d{4})-(\d{2})-(\d{2})", 0)
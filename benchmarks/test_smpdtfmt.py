@@ -0,0 +1,24 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from icupy import icu
+
+pytestmark = pytest.mark.benchmark(group="smpdtfmt")
+
+
+@pytest.fixture(scope="module")
+def fmt() -> icu.SimpleDateFormat:
+    fmt = icu.SimpleDateFormat("yyyy-MM-dd'T'HH:mm:ss.SSSZ", icu.Locale("en"))
+    fmt.set_time_zone(icu.TimeZone.get_gmt())
+    return fmt
+
+
+def test_format(benchmark: BenchmarkFixture, fmt: icu.SimpleDateFormat) -> None:
+    udate = 1_700_000_000_000.0
+    result = benchmark(lambda: fmt.format(udate, icu.UnicodeString()))
+    assert result == "2023-11-14T22:13:20.000+0000"
+
+
+def test_parse(benchmark: BenchmarkFixture, fmt: icu.SimpleDateFormat) -> None:
+    result = benchmark(fmt.parse, "2023-11-14T22:13:20.000+0000")
+    assert result == 1_700_000_000_000.0
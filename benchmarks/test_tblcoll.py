@@ -0,0 +1,39 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from icupy import icu
+
+pytestmark = pytest.mark.benchmark(group="tblcoll")
+
+
+@pytest.fixture(scope="module")
+def coll() -> icu.Collator:
+    return icu.Collator.create_instance(icu.Locale("en"))
+
+
+def test_get_sort_key(benchmark: BenchmarkFixture, coll: icu.Collator, text: str) -> None:
+    benchmark.extra_info["chars"] = len(text)
+    result = benchmark(coll.get_sort_key, text)
+    assert isinstance(result, bytes)
+
+
+def test_get_sort_keys(
+    benchmark: BenchmarkFixture, coll: icu.Collator, words: list[str]
+) -> None:
+    benchmark.extra_info["items"] = len(words)
+    result = benchmark(coll.get_sort_keys, words)
+    assert len(result) == len(words)
+
+
+def test_compare(benchmark: BenchmarkFixture, coll: icu.Collator) -> None:
+    result = benchmark(coll.compare, "alpha", "Alpha")
+    assert result == icu.UCollationResult.UCOL_LESS
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_collation_sort(
+    benchmark: BenchmarkFixture, coll: icu.Collator, words: list[str], workers: int
+) -> None:
+    benchmark.extra_info["items"] = len(words)
+    result = benchmark(icu.collation_sort, words, coll, workers=workers)
+    assert len(result) == len(words)
@@ -0,0 +1,26 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from icupy import icu
+
+pytestmark = pytest.mark.benchmark(group="translit")
+
+
+@pytest.fixture(scope="module")
+def trans() -> icu.Transliterator:
+    return icu.Transliterator.create_instance(
+        "Any-Latin; Latin-ASCII", icu.UTransDirection.UTRANS_FORWARD
+    )
+
+
+def test_transliterate(
+    benchmark: BenchmarkFixture, trans: icu.Transliterator, text: str
+) -> None:
+    benchmark.extra_info["chars"] = len(text)
+
+    def _transliterate() -> icu.UnicodeString:
+        src = icu.UnicodeString(text)
+        trans.transliterate(src)
+        return src
+
+    assert len(benchmark(_transliterate)) > 0
@@ -0,0 +1,29 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from icupy import icu
+
+pytestmark = pytest.mark.benchmark(group="unistr")
+
+
+@pytest.mark.parametrize(
+    "sample",
+    ["ascii", "latin1\xe9", "bmpあ", "astral\U0001f338"],
+)
+def test_init(benchmark: BenchmarkFixture, text: str, sample: str) -> None:
+    # Cover each PEP 393 kind of str
+    src = (sample * (len(text) // len(sample) + 1))[: len(text)]
+    benchmark.extra_info["chars"] = len(src)
+    result = benchmark(icu.UnicodeString, src)
+    assert len(result) >= len(src)
+
+
+def test_str(benchmark: BenchmarkFixture, text: str) -> None:
+    benchmark.extra_info["chars"] = len(text)
+    src = icu.UnicodeString(text)
+    assert benchmark(str, src) == text
+
+
+def test_compare_with_str(benchmark: BenchmarkFixture) -> None:
+    src = icu.UnicodeString("alpha")
+    assert benchmark(src.__eq__, "alpha") is True
@@ -1,4 +1,7 @@
 #include "main.hpp"
+#include "parallel.hpp"
+#include <cmath>
+#include <memory>
 #include <optional>
 #include <pybind11/native_enum.h>
 #include <pybind11/stl.h>
@@ -255,6 +258,65 @@ order full, long, medium, short.
           },
           py::arg("date"), py::arg("append_to"), py::arg("pos_iter"));
 
+  df.def(
+      "format_many",
+      [](const DateFormat &self, const py::object &dates,
+         const std::optional<py::object> &out) -> py::object {
+        const auto udates = icupy::to_vector<UDate>(dates);
+        const auto size = udates.size();
+        if (out && py::len(*out) != size) {
+          throw py::value_error("length of out (" +
+                                std::to_string(py::len(*out)) +
+                                ") does not match the number of dates (" +
+                                std::to_string(size) + ")");
+        }
+        std::vector<UnicodeString> strings(size);
+        {
+          py::gil_scoped_release release;
+          // DateFormat::format(UDate, ...) clones the calendar for every
+          // call; clone it once and reuse it for all dates instead.
+          std::unique_ptr<Calendar> cal(self.getCalendar()->clone());
+          if (!cal) {
+            throw icupy::ICUError(U_MEMORY_ALLOCATION_ERROR);
+          }
+          FieldPosition pos(FieldPosition::DONT_CARE);
+          ErrorCode error_code;
+          for (std::size_t i = 0; i < size; ++i) {
+            cal->setTime(udates[i], error_code);
+            if (error_code.isFailure()) {
+              throw icupy::ICUError(error_code);
+            }
+            self.format(*cal, strings[i], pos);
+          }
+        }
+        if (out) {
+          for (std::size_t i = 0; i < size; ++i) {
+            (*out)[py::int_(i)] = icupy::to_pystr(strings[i]);
+          }
+          return *out;
+        }
+        py::list result(size);
+        for (std::size_t i = 0; i < size; ++i) {
+          result[i] = icupy::to_pystr(strings[i]);
+        }
+        return std::move(result);
+      },
+      py::arg("dates"), py::arg("out") = std::nullopt, R"doc(
+      Format each date in *dates* and return a list of ``str``.
+
+      *dates* is either an iterable of ``float`` in milliseconds since the
+      epoch (:class:`UDate`), or an object that supports the buffer protocol
+      with integer or floating-point items, such as :class:`array.array` or a
+      one-dimensional NumPy array. A NumPy ``datetime64[ms]`` array can be
+      passed as ``values.view("int64")``.
+
+      All dates are formatted with one copy of the calendar, with the GIL
+      released.
+
+      If *out* is given, the strings are stored into *out*, which must be a
+      mutable sequence of the same length as *dates*, and *out* is returned.
+      )doc");
+
 #if (U_ICU_VERSION_MAJOR_NUM >= 53)
   df.def(
       "get_boolean_attribute",
@@ -361,6 +423,109 @@ order full, long, medium, short.
           },
           py::arg("source"), py::arg("result"));
 
+  df.def(
+      "parse_many",
+      [](const DateFormat &self,
+         const std::vector<icupy::UnicodeStringVariant> &strings,
+         const std::optional<bool> &lenient, const std::string &errors,
+         const std::optional<int> &workers) -> py::object {
+        if (errors != "nat" && errors != "raise" && errors != "mask") {
+          throw py::value_error(
+              "errors must be 'nat', 'raise', or 'mask', not '" + errors + "'");
+        }
+        if (workers && *workers < 1) {
+          throw py::value_error("workers must be greater than 0");
+        }
+        const auto size = strings.size();
+        std::vector<int64_t> values(size, INT64_MIN);
+        std::vector<uint8_t> valid(size, 0);
+        {
+          py::gil_scoped_release release;
+          const auto num_workers = icupy::num_workers(
+              size, workers ? static_cast<std::size_t>(*workers) : 0);
+          icupy::parallel_for(
+              size, num_workers,
+              [&](std::size_t n, std::size_t begin, std::size_t end) {
+                std::unique_ptr<DateFormat> clone;
+                if (n > 0 || lenient) {
+                  clone.reset(static_cast<DateFormat *>(self.clone()));
+                  if (!clone) {
+                    throw icupy::ICUError(U_MEMORY_ALLOCATION_ERROR);
+                  }
+                  if (lenient) {
+                    clone->setLenient(*lenient);
+                  }
+                }
+                const auto &fmt = clone ? *clone : self;
+                std::unique_ptr<Calendar> cal(fmt.getCalendar()->clone());
+                if (!cal) {
+                  throw icupy::ICUError(U_MEMORY_ALLOCATION_ERROR);
+                }
+                for (auto i = begin; i < end; ++i) {
+                  const auto &text = icupy::to_unistr(strings[i]);
+                  ParsePosition pos;
+                  cal->clear();
+                  fmt.parse(text, *cal, pos);
+                  if (pos.getErrorIndex() >= 0 ||
+                      pos.getIndex() != text.length()) {
+                    continue;
+                  }
+                  ErrorCode error_code;
+                  const auto udate = cal->getTime(error_code);
+                  if (error_code.isSuccess()) {
+                    values[i] = static_cast<int64_t>(std::floor(udate));
+                    valid[i] = 1;
+                  }
+                }
+              });
+        }
+        if (errors == "raise") {
+          const auto it = std::find(valid.begin(), valid.end(), 0);
+          if (it != valid.end()) {
+            const auto i = static_cast<std::size_t>(it - valid.begin());
+            throw py::value_error(
+                "could not parse string at index " + std::to_string(i) + ": " +
+                py::repr(icupy::to_pystr(icupy::to_unistr(strings[i])))
+                    .cast<std::string>());
+          }
+        }
+        auto result = icupy::to_pyarray("q", values);
+        if (errors == "mask") {
+          return py::make_tuple(result, icupy::to_pyarray("B", valid));
+        }
+        return result;
+      },
+      py::arg("strings"), py::kw_only(), py::arg("lenient") = std::nullopt,
+      py::arg("errors") = "nat", py::arg("workers") = std::nullopt, R"doc(
+      Parse each string in *strings* and return the dates as an
+      ``array.array('q')`` of milliseconds since the epoch.
+
+      A string is parsed successfully only if it is consumed entirely. If
+      *lenient* is not ``None``, it overrides :meth:`is_lenient` for this
+      call. *errors* specifies how to handle a string that cannot be parsed:
+
+      * ``"nat"``: Store ``-2**63``, which is ``NaT`` in a NumPy
+        ``datetime64[ms]`` view of the result.
+      * ``"raise"``: Raise :class:`ValueError`.
+      * ``"mask"``: Store ``-2**63`` and return a tuple of the dates and an
+        ``array.array('B')`` in which 1 indicates a valid date.
+
+      The work is split across *workers* threads with the GIL released; each
+      thread uses its own clone of this formatter. If *workers* is ``None``,
+      the number of processors is used.
+
+      .. rubric:: Example
+
+      .. code-block:: python
+
+         import numpy as np
+         from icupy import icu
+         fmt = icu.SimpleDateFormat("yyyy-MM-dd", icu.Locale("en_US"))
+         fmt.set_time_zone(icu.TimeZone.get_gmt())
+         np.frombuffer(fmt.parse_many(["2008-07-05", "n/a"]), "M8[ms]")
+         # array(['2008-07-05T00:00:00.000', 'NaT'], dtype='datetime64[ms]')
+      )doc");
+
 #if (U_ICU_VERSION_MAJOR_NUM >= 53)
   df.def(
       "set_boolean_attribute",
@@ -0,0 +1,230 @@
+"""Cache of ICU service objects keyed by locale and options.
+
+Creating a collator, formatter, break iterator, etc. loads locale data from
+the resource bundles, which is much slower than cloning an existing
+instance. The functions in this module keep the created objects as
+prototypes in a bounded, thread-safe LRU cache and hand out clones of them:
+
+    >>> from icupy import cache
+    >>> coll = cache.collator("de")  # created and cached
+    >>> coll = cache.collator("de")  # cloned from the cached prototype
+    >>> cache.cache_info()
+    CacheInfo(hits=1, misses=1, evictions=0, maxsize=128, currsize=1)
+
+Each returned object belongs to the caller and may be modified freely.
+Immutable services, i.e., :class:`~icupy.icu.number.LocalizedNumberFormatter`,
+are shared instead of cloned.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple, TypeVar
+
+from . import icu
+
+__all__ = [
+    "Cache",
+    "CacheInfo",
+    "break_iterator",
+    "cache_clear",
+    "cache_info",
+    "collator",
+    "date_format",
+    "default_cache",
+    "number_formatter",
+    "plural_rules",
+    "transliterator",
+]
+
+T = TypeVar("T")
+
+_BREAK_ITERATOR_FACTORIES = {
+    "character": icu.BreakIterator.create_character_instance,
+    "line": icu.BreakIterator.create_line_instance,
+    "sentence": icu.BreakIterator.create_sentence_instance,
+    "title": icu.BreakIterator.create_title_instance,
+    "word": icu.BreakIterator.create_word_instance,
+}
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`Cache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _clone(obj: Any) -> Any:  # noqa: ANN401
+    return obj.clone()
+
+
+def _locale_name(locale: icu.Locale | str) -> str:
+    if isinstance(locale, icu.Locale):
+        return locale.get_name()
+    return str(locale)
+
+
+def _to_locale(locale: icu.Locale | str) -> icu.Locale:
+    if isinstance(locale, icu.Locale):
+        return locale
+    return icu.Locale(locale)
+
+
+class Cache:
+    """Bounded, thread-safe LRU cache of prototype objects.
+
+    At most *maxsize* prototypes are kept; the least recently used one is
+    evicted when a new one is added to a full cache.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            msg = f"maxsize must be greater than 0, not {maxsize}"
+            raise ValueError(msg)
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._prototypes: OrderedDict[Hashable, Any] = OrderedDict()
+        self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._prototypes)
+
+    def get(
+        self,
+        key: Hashable,
+        factory: Callable[[], T],
+        clone: Callable[[T], T] | None = _clone,
+    ) -> T:
+        """Return a copy of the prototype for *key* made by *clone*.
+
+        If *key* is not in the cache, the prototype is created by calling
+        *factory* and added to the cache. If *clone* is ``None``, the
+        prototype itself is returned; use it only for immutable objects.
+        """
+        with self._lock:
+            prototype = self._prototypes.get(key)
+            if prototype is not None:
+                self._prototypes.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if prototype is None:
+            # Create the prototype without holding the lock, since it can take
+            # a long time. If another thread wins the race, use its prototype.
+            created = factory()
+            with self._lock:
+                prototype = self._prototypes.setdefault(key, created)
+                self._prototypes.move_to_end(key)
+                while len(self._prototypes) > self._maxsize:
+                    self._prototypes.popitem(last=False)
+                    self._evictions += 1
+        return prototype if clone is None else clone(prototype)
+
+    def cache_clear(self) -> None:
+        """Remove all prototypes and reset the statistics."""
+        with self._lock:
+            self._prototypes.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of this cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._prototypes),
+            )
+
+    def break_iterator(self, locale: icu.Locale | str, type: str = "word") -> icu.BreakIterator:  # noqa: A002
+        """Return a new break iterator of *type* for *locale*.
+
+        *type* is one of ``"character"``, ``"line"``, ``"sentence"``,
+        ``"title"``, and ``"word"``.
+        """
+        factory = _BREAK_ITERATOR_FACTORIES.get(type)
+        if factory is None:
+            msg = f"unknown break iterator type: {type!r}"
+            raise ValueError(msg)
+        return self.get(
+            ("BreakIterator", _locale_name(locale), type),
+            lambda: factory(_to_locale(locale)),
+        )
+
+    def collator(self, locale: icu.Locale | str) -> icu.Collator:
+        """Return a new collator for *locale*."""
+        return self.get(
+            ("Collator", _locale_name(locale)),
+            lambda: icu.Collator.create_instance(_to_locale(locale)),
+        )
+
+    def date_format(self, locale: icu.Locale | str, skeleton: str) -> icu.DateFormat:
+        """Return a new date formatter for *locale* created from *skeleton*,
+        e.g., ``"yMMMd"``.
+        """
+        return self.get(
+            ("DateFormat", _locale_name(locale), skeleton),
+            lambda: icu.DateFormat.create_instance_for_skeleton(skeleton, _to_locale(locale)),
+        )
+
+    def number_formatter(
+        self, locale: icu.Locale | str, skeleton: str = ""
+    ) -> icu.number.LocalizedNumberFormatter:
+        """Return a number formatter for *locale* created from *skeleton*,
+        e.g., ``"compact-short"``.
+
+        The formatter is immutable and thread-safe, so the cached instance is
+        returned as it is.
+        """
+
+        def factory() -> icu.number.LocalizedNumberFormatter:
+            if skeleton:
+                fmt = icu.number.NumberFormatter.for_skeleton(skeleton)
+            else:
+                fmt = icu.number.NumberFormatter.with_()
+            return fmt.locale(_to_locale(locale))
+
+        return self.get(("NumberFormatter", _locale_name(locale), skeleton), factory, None)
+
+    def plural_rules(
+        self,
+        locale: icu.Locale | str,
+        type: icu.UPluralType = icu.UPluralType.UPLURAL_TYPE_CARDINAL,  # noqa: A002
+    ) -> icu.PluralRules:
+        """Return new plural rules of *type* for *locale*."""
+        return self.get(
+            ("PluralRules", _locale_name(locale), type),
+            lambda: icu.PluralRules.for_locale(_to_locale(locale), type),
+        )
+
+    def transliterator(
+        self,
+        id: str,  # noqa: A002
+        direction: icu.UTransDirection = icu.UTransDirection.UTRANS_FORWARD,
+    ) -> icu.Transliterator:
+        """Return a new transliterator for *id*, e.g., ``"Any-Latin"``."""
+        return self.get(
+            ("Transliterator", id, direction),
+            lambda: icu.Transliterator.create_instance(id, direction),
+        )
+
+
+default_cache = Cache()
+"""The cache used by the module-level functions."""
+
+break_iterator = default_cache.break_iterator
+cache_clear = default_cache.cache_clear
+cache_info = default_cache.cache_info
+collator = default_cache.collator
+date_format = default_cache.date_format
+number_formatter = default_cache.number_formatter
+plural_rules = default_cache.plural_rules
+transliterator = default_cache.transliterator
@@ -0,0 +1,377 @@
+"""Adapters between ICU converters and the :mod:`codecs` module.
+
+Call :func:`register` to make the ICU converters available to the
+:mod:`codecs` machinery under the ``icu:`` prefix:
+
+    >>> import icupy.codecs
+    >>> icupy.codecs.register()
+    >>> "あ".encode("icu:ibm-943_P15A-2003")
+    b'\\x82\\xa0'
+"""
+
+from __future__ import annotations
+
+import codecs
+import threading
+from typing import Any, BinaryIO
+
+from . import icu
+
+__all__ = [
+    "IncrementalDecoder",
+    "IncrementalEncoder",
+    "StreamReader",
+    "StreamWriter",
+    "register",
+    "unregister",
+]
+
+PREFIX = "icu:"
+"""Prefix of the encoding names handled by the search function."""
+
+_POOL_SIZE = 4
+
+_lock = threading.Lock()
+_prototypes: dict[str, icu.UConverter] = {}
+_pools: dict[tuple[str, bool], list[_Converter]] = {}
+_registered = False
+
+
+def _to_u_call_back(errors: str) -> tuple[Any, Any]:
+    if errors == "strict":
+        return icu.UConverterToUCallbackStop(), None
+    if errors == "ignore":
+        return icu.UConverterToUCallbackSkip(), None
+    if errors == "replace":
+        return icu.UConverterToUCallbackSubstitute(), None
+    if errors == "backslashreplace":
+        context = icu.UserContext(icu.UCNV_ESCAPE_C)
+        return icu.UConverterToUCallbackEscape(context), context
+    msg = f"unsupported error handler for decoding: {errors!r}"
+    raise ValueError(msg)
+
+
+def _from_u_call_back(errors: str) -> tuple[Any, Any]:
+    if errors == "strict":
+        return icu.UConverterFromUCallbackStop(), None
+    if errors == "ignore":
+        return icu.UConverterFromUCallbackSkip(), None
+    if errors == "replace":
+        return icu.UConverterFromUCallbackSubstitute(), None
+    if errors == "backslashreplace":
+        context = icu.UserContext(icu.UCNV_ESCAPE_C)
+        return icu.UConverterFromUCallbackEscape(context), context
+    if errors == "xmlcharrefreplace":
+        context = icu.UserContext(icu.UCNV_ESCAPE_XML_DEC)
+        return icu.UConverterFromUCallbackEscape(context), context
+    msg = f"unsupported error handler for encoding: {errors!r}"
+    raise ValueError(msg)
+
+
+def _prototype(encoding: str) -> icu.UConverter:
+    """Return the cached prototype for *encoding*.
+
+    The caller must hold ``_lock`` while it uses the prototype, since
+    :func:`unregister` closes it.
+    """
+    prototype = _prototypes.get(encoding)
+    if prototype is None:
+        prototype = _prototypes[encoding] = icu.ucnv_open(encoding)
+    return prototype
+
+
+def _open(encoding: str) -> icu.UConverter:
+    """Return a new converter cloned from the cached prototype for
+    *encoding*.
+    """
+    if hasattr(icu, "ucnv_clone"):  # ICU4C>=71
+        with _lock:
+            return icu.ucnv_clone(_prototype(encoding))
+    return icu.ucnv_open(encoding)
+
+
+class _Converter:
+    """Own an ICU converter configured for the specified error handler.
+
+    The ICU converter does not report where in the input a conversion error
+    occurs, so the :class:`UnicodeEncodeError` or :class:`UnicodeDecodeError`
+    raised for the ``"strict"`` error handler spans the whole input of the
+    failing call.
+    """
+
+    def __init__(self, encoding: str, errors: str, decode: bool) -> None:
+        self.encoding = encoding
+        self.decode = decode
+        self._converter = _open(encoding)
+        self._errors = ""
+        self._action = self._context = None
+        self.set_errors(errors)
+
+    def __del__(self) -> None:
+        converter = getattr(self, "_converter", None)
+        if converter is not None:
+            self._converter = None
+            icu.ucnv_close(converter)
+
+    def count_pending(self) -> int:
+        if self.decode:
+            return icu.ucnv_to_u_count_pending(self._converter)
+        return icu.ucnv_from_u_count_pending(self._converter)
+
+    def from_unicode(self, input: str, final: bool) -> bytes:  # noqa: A002
+        try:
+            return icu.ucnv_from_unicode(self._converter, input, final)
+        except icu.ICUError as ex:
+            self.reset()
+            raise UnicodeEncodeError(self.encoding, input, 0, len(input), str(ex)) from ex
+
+    def reset(self) -> None:
+        if self.decode:
+            icu.ucnv_reset_to_unicode(self._converter)
+        else:
+            icu.ucnv_reset_from_unicode(self._converter)
+
+    def set_errors(self, errors: str) -> None:
+        if errors == self._errors:
+            return
+        if self.decode:
+            action, context = _to_u_call_back(errors)
+            icu.ucnv_set_to_u_call_back(self._converter, action)
+        else:
+            action, context = _from_u_call_back(errors)
+            icu.ucnv_set_from_u_call_back(self._converter, action)
+        # The action and its context must outlive the converter.
+        self._action, self._context = action, context
+        self._errors = errors
+
+    def to_unicode(self, input: bytes, final: bool) -> str:  # noqa: A002
+        try:
+            return icu.ucnv_to_unicode(self._converter, input, final)
+        except icu.ICUError as ex:
+            self.reset()
+            data = bytes(input)
+            raise UnicodeDecodeError(self.encoding, data, 0, len(data), str(ex)) from ex
+
+
+def _acquire(encoding: str, errors: str, decode: bool) -> _Converter:
+    with _lock:
+        pool = _pools.get((encoding, decode))
+        converter = pool.pop() if pool else None
+    if converter is None:
+        converter = _Converter(encoding, errors, decode)
+    else:
+        converter.set_errors(errors)
+    return converter
+
+
+def _release(converter: _Converter) -> None:
+    converter.reset()
+    with _lock:
+        pool = _pools.setdefault((converter.encoding, converter.decode), [])
+        if len(pool) < _POOL_SIZE:
+            pool.append(converter)
+
+
+class IncrementalDecoder(codecs.IncrementalDecoder):
+    """Incremental decoder backed by an ICU converter.
+
+    An incomplete character sequence at the end of the input is kept in the
+    converter until the next call to :meth:`decode`. :meth:`getstate` returns
+    it as the buffered input, so the decoder supports
+    :meth:`io.TextIOWrapper.tell` and :meth:`io.TextIOWrapper.seek`. The shift
+    state of a stateful encoding, such as ISO-2022-JP, is not part of the
+    state.
+
+    Example:
+        >>> from icupy.codecs import IncrementalDecoder
+        >>> decoder = IncrementalDecoder("Shift_JIS")
+        >>> decoder.decode(b"\\x82")
+        ''
+        >>> decoder.decode(b"\\xa0", final=True)
+        'あ'
+    """
+
+    def __init__(self, encoding: str, errors: str = "strict") -> None:
+        super().__init__(errors)
+        self._converter = _Converter(encoding, errors, decode=True)
+        self._pending = b""
+
+    def decode(self, input: bytes, final: bool = False) -> str:  # noqa: A002
+        self._converter.set_errors(self.errors)
+        pending, self._pending = self._pending, b""
+        result = self._converter.to_unicode(input, final)
+        # The bytes held in the converter are the tail of the input so far.
+        n = self._converter.count_pending()
+        if n > 0:
+            self._pending = (pending[-n:] + bytes(memoryview(input)[-n:]))[-n:]
+        return result
+
+    def getstate(self) -> tuple[bytes, int]:
+        return self._pending, 0
+
+    def reset(self) -> None:
+        self._converter.reset()
+        self._pending = b""
+
+    def setstate(self, state: tuple[bytes, int]) -> None:
+        self.reset()
+        if state[0]:
+            self.decode(state[0])
+
+
+class IncrementalEncoder(codecs.IncrementalEncoder):
+    """Incremental encoder backed by an ICU converter.
+
+    Example:
+        >>> from icupy.codecs import IncrementalEncoder
+        >>> encoder = IncrementalEncoder("ISO-2022-JP")
+        >>> encoder.encode("あ") + encoder.encode("", final=True)
+        b'\\x1b$B$"\\x1b(B'
+    """
+
+    def __init__(self, encoding: str, errors: str = "strict") -> None:
+        super().__init__(errors)
+        self._converter = _Converter(encoding, errors, decode=False)
+
+    def encode(self, input: str, final: bool = False) -> bytes:  # noqa: A002
+        self._converter.set_errors(self.errors)
+        return self._converter.from_unicode(input, final)
+
+    def reset(self) -> None:
+        self._converter.reset()
+
+
+class StreamReader(codecs.StreamReader):
+    """Stream reader that decodes the byte stream with an ICU converter.
+
+    Example:
+        >>> import io
+        >>> from icupy.codecs import StreamReader
+        >>> reader = StreamReader(io.BytesIO(b"\\x82\\xa0\\x82\\xa2"), "Shift_JIS")
+        >>> reader.read()
+        'あい'
+    """
+
+    def __init__(self, stream: BinaryIO, encoding: str, errors: str = "strict") -> None:
+        super().__init__(stream, errors)
+        self._decoder = IncrementalDecoder(encoding, errors)
+
+    def decode(self, input: bytes, errors: str = "strict") -> tuple[str, int]:  # noqa: A002
+        # codecs.StreamReader keeps undecoded bytes by itself, but the
+        # converter already holds any partial sequence, so consume everything.
+        self._decoder.errors = self.errors
+        return self._decoder.decode(input), len(input)
+
+    def reset(self) -> None:
+        super().reset()
+        self._decoder.reset()
+
+
+class StreamWriter(codecs.StreamWriter):
+    """Stream writer that encodes text with an ICU converter.
+
+    Call :meth:`reset` (or close the writer's owner after calling it) to
+    flush any pending converter state, e.g., the shift sequence of
+    ISO-2022-JP.
+    """
+
+    def __init__(self, stream: BinaryIO, encoding: str, errors: str = "strict") -> None:
+        super().__init__(stream, errors)
+        self._encoder = IncrementalEncoder(encoding, errors)
+
+    def encode(self, input: str, errors: str = "strict") -> tuple[bytes, int]:  # noqa: A002
+        self._encoder.errors = self.errors
+        return self._encoder.encode(input), len(input)
+
+    def reset(self) -> None:
+        data = self._encoder.encode("", final=True)
+        if data:
+            self.stream.write(data)
+        super().reset()
+
+
+def _codec_info(encoding: str) -> codecs.CodecInfo:
+    def decode(input: bytes, errors: str = "strict") -> tuple[str, int]:  # noqa: A002
+        converter = _acquire(encoding, errors, decode=True)
+        try:
+            return converter.to_unicode(input, True), len(input)
+        finally:
+            _release(converter)
+
+    def encode(input: str, errors: str = "strict") -> tuple[bytes, int]:  # noqa: A002
+        converter = _acquire(encoding, errors, decode=False)
+        try:
+            return converter.from_unicode(input, True), len(input)
+        finally:
+            _release(converter)
+
+    def incremental_decoder(errors: str = "strict") -> IncrementalDecoder:
+        return IncrementalDecoder(encoding, errors)
+
+    def incremental_encoder(errors: str = "strict") -> IncrementalEncoder:
+        return IncrementalEncoder(encoding, errors)
+
+    def stream_reader(stream: BinaryIO, errors: str = "strict") -> StreamReader:
+        return StreamReader(stream, encoding, errors)
+
+    def stream_writer(stream: BinaryIO, errors: str = "strict") -> StreamWriter:
+        return StreamWriter(stream, encoding, errors)
+
+    return codecs.CodecInfo(
+        encode,
+        decode,
+        streamreader=stream_reader,
+        streamwriter=stream_writer,
+        incrementalencoder=incremental_encoder,
+        incrementaldecoder=incremental_decoder,
+        name=PREFIX + encoding,
+    )
+
+
+def _search(name: str) -> codecs.CodecInfo | None:
+    # Since Python 3.9, codecs.lookup() replaces non-alphanumeric characters
+    # with "_" before calling the search function. ICU ignores them when it
+    # looks up a converter name, so either form of the name is accepted.
+    for prefix in (PREFIX, "icu_"):
+        if name.startswith(prefix):
+            break
+    else:
+        return None
+    try:
+        with _lock:
+            encoding = icu.ucnv_get_name(_prototype(name[len(prefix) :]))
+    except icu.ICUError:
+        return None
+    return _codec_info(encoding)
+
+
+def register() -> None:
+    """Register the search function for the ICU converters.
+
+    After registration, any converter name prefixed with ``icu:`` can be
+    used as an encoding, e.g., ``open(path, encoding="icu:ibm-943_P15A-2003")``.
+    Calling this function more than once has no effect.
+
+    The stateless encoder and decoder reuse converters cloned from a cached
+    prototype, so converting many short strings does not reopen the
+    converter every time.
+    """
+    global _registered  # noqa: PLW0603
+    with _lock:
+        if not _registered:
+            codecs.register(_search)
+            _registered = True
+
+
+def unregister() -> None:
+    """Unregister the search function and clear the cached converters."""
+    global _registered  # noqa: PLW0603
+    with _lock:
+        if _registered:
+            codecs.unregister(_search)
+            _registered = False
+        prototypes = list(_prototypes.values())
+        _prototypes.clear()
+        _pools.clear()
+    for converter in prototypes:
+        icu.ucnv_close(converter)
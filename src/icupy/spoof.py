@@ -0,0 +1,111 @@
+"""Index of strings grouped by their confusable skeletons.
+
+Two strings are confusable if their skeletons are identical, so a
+:class:`ConfusableIndex` finds the existing strings that are confusable with
+a new one by a single dictionary lookup instead of comparing every pair with
+:func:`~icupy.icu.uspoof_are_confusable_unicode_string`:
+
+    >>> from icupy.spoof import ConfusableIndex
+    >>> index = ConfusableIndex(["paypal", "example"])
+    >>> index.find("p\\u0430ypal")  # CYRILLIC SMALL LETTER A
+    ['paypal']
+    >>> "paypa1" in index  # "1" is confusable with "l"
+    True
+    >>> "paypa" in index
+    False
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from . import icu
+
+__all__ = [
+    "ConfusableIndex",
+]
+
+
+class ConfusableIndex:
+    """Set of strings grouped by their skeletons.
+
+    If *checker* is ``None``, a new :class:`~icupy.icu.USpoofChecker` opened
+    with the default settings is used and closed with the index. Otherwise,
+    *checker* must outlive the index.
+    """
+
+    def __init__(
+        self,
+        strings: Iterable[str | icu.UnicodeString] = (),
+        checker: icu.USpoofChecker | None = None,
+        *,
+        workers: int | None = None,
+    ) -> None:
+        self._owns_checker = checker is None
+        self._checker = icu.uspoof_open() if checker is None else checker
+        self._groups: dict[str, dict[str, None]] = {}
+        self._size = 0
+        self.update(strings, workers=workers)
+
+    def __del__(self) -> None:
+        checker = getattr(self, "_checker", None)
+        if checker is not None and self._owns_checker:
+            self._checker = None
+            icu.uspoof_close(checker)
+
+    def __contains__(self, s: object) -> bool:
+        """Return ``True`` if the index has a string confusable with *s*."""
+        if not isinstance(s, (str, icu.UnicodeString)):
+            return False
+        return self.skeleton(s) in self._groups
+
+    def __iter__(self) -> Iterator[str]:
+        for group in self._groups.values():
+            yield from group
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, s: str | icu.UnicodeString) -> None:
+        """Add *s* to the index."""
+        self._add(str(s), self.skeleton(s))
+
+    def find(self, s: str | icu.UnicodeString) -> list[str]:
+        """Return the strings in the index that are confusable with *s*,
+        including *s* itself if it is in the index, in insertion order.
+        """
+        return list(self._groups.get(self.skeleton(s), ()))
+
+    def groups(self, min_size: int = 2) -> Iterator[list[str]]:
+        """Yield the groups of mutually confusable strings that have at least
+        *min_size* strings.
+        """
+        for group in self._groups.values():
+            if len(group) >= min_size:
+                yield list(group)
+
+    def skeleton(self, s: str | icu.UnicodeString) -> str:
+        """Return the skeleton of *s*."""
+        return str(
+            icu.uspoof_get_skeleton_unicode_string(self._checker, 0, s, icu.UnicodeString())
+        )
+
+    def update(
+        self, strings: Iterable[str | icu.UnicodeString], *, workers: int | None = None
+    ) -> None:
+        """Add all *strings* to the index.
+
+        The skeletons are computed by
+        :meth:`~icupy.icu.USpoofChecker.skeletons_many` in parallel by
+        *workers* threads.
+        """
+        strings = [str(s) for s in strings]
+        skeletons = self._checker.skeletons_many(strings, workers=workers)
+        for s, skeleton in zip(strings, skeletons, strict=True):
+            self._add(s, skeleton)
+
+    def _add(self, s: str, skeleton: str) -> None:
+        group = self._groups.setdefault(skeleton, {})
+        if s not in group:
+            group[s] = None
+            self._size += 1
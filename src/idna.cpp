@@ -1,9 +1,132 @@
 #include "main.hpp"
+#include "parallel.hpp"
+#include <optional>
 #include <pybind11/stl.h>
+#include <sstream>
+#include <string_view>
 #include <unicode/idna.h>
 
 using namespace icu;
 
+namespace icupy {
+
+using IDNAConvertFunction = UnicodeString &(IDNA::*)(const UnicodeString &,
+                                                     UnicodeString &,
+                                                     IDNAInfo &,
+                                                     UErrorCode &) const;
+
+using IDNAConvertUTF8Function = void (IDNA::*)(StringPiece, ByteSink &,
+                                               IDNAInfo &, UErrorCode &) const;
+
+// Convert each of *names* with *convert* or *convert_utf8* and return the
+// results as described in IDNA.names_to_ascii_many().
+py::object convert_names(const IDNA &idna, const py::object &names,
+                         IDNAConvertFunction convert,
+                         IDNAConvertUTF8Function convert_utf8,
+                         const std::string &errors,
+                         const std::optional<int> &workers) {
+  if (errors != "mask" && errors != "raise" && errors != "keep") {
+    throw py::value_error("errors must be 'mask', 'raise', or 'keep', not '" +
+                          errors + "'");
+  }
+  if (workers && *workers < 1) {
+    throw py::value_error("workers must be greater than 0");
+  }
+  const auto is_buffer = PyObject_CheckBuffer(names.ptr()) != 0;
+  std::shared_ptr<py::buffer_info> info;
+  std::vector<std::string_view> lines;
+  std::vector<UnicodeStringVariant> strings;
+  if (is_buffer) {
+    info = request_buffer(py::reinterpret_borrow<py::buffer>(names), 1);
+    std::string_view data(static_cast<const char *>(info->ptr),
+                          static_cast<std::size_t>(info->size));
+    while (!data.empty()) {
+      const auto eol = std::min(data.find('\n'), data.size());
+      auto line = data.substr(0, eol);
+      if (!line.empty() && line.back() == '\r') {
+        line.remove_suffix(1);
+      }
+      lines.push_back(line);
+      data.remove_prefix(std::min(eol + 1, data.size()));
+    }
+  } else {
+    try {
+      strings = names.cast<std::vector<UnicodeStringVariant>>();
+    } catch (const py::cast_error &) {
+      throw py::type_error(
+          "names must be a sequence of str or a buffer of bytes, not " +
+          py::str(py::type::handle_of(names).attr("__name__"))
+              .cast<std::string>());
+    }
+  }
+  const auto size = is_buffer ? lines.size() : strings.size();
+  std::vector<std::string> utf8_results(is_buffer ? size : 0);
+  std::vector<UnicodeString> results(is_buffer ? 0 : size);
+  std::vector<uint32_t> error_masks(size);
+  {
+    py::gil_scoped_release release;
+    // IDNA is immutable and thread-safe, so all threads share it.
+    parallel_for(
+        size,
+        num_workers(size, workers ? static_cast<std::size_t>(*workers) : 0),
+        [&](std::size_t, std::size_t begin, std::size_t end) {
+          for (auto i = begin; i < end; ++i) {
+            IDNAInfo idna_info;
+            ErrorCode error_code;
+            if (is_buffer) {
+              StringByteSink<std::string> sink(&utf8_results[i]);
+              (idna.*
+               convert_utf8)(StringPiece(lines[i].data(),
+                                         static_cast<int32_t>(lines[i].size())),
+                             sink, idna_info, error_code);
+            } else {
+              (idna.*convert)(to_unistr(strings[i]), results[i], idna_info,
+                              error_code);
+            }
+            if (error_code.isFailure()) {
+              throw ICUError(error_code);
+            }
+            error_masks[i] = idna_info.getErrors();
+          }
+        });
+  }
+  if (errors == "raise") {
+    const auto it = std::find_if(error_masks.begin(), error_masks.end(),
+                                 [](uint32_t mask) { return mask != 0; });
+    if (it != error_masks.end()) {
+      const auto i = static_cast<std::size_t>(it - error_masks.begin());
+      const auto name =
+          is_buffer ? py::repr(py::bytes(lines[i].data(), lines[i].size()))
+                    : py::repr(to_pystr(to_unistr(strings[i])));
+      std::stringstream message;
+      message << "could not convert name at index " << i << ": "
+              << name.cast<std::string>() << " (errors=0x" << std::hex << *it
+              << ")";
+      throw py::value_error(message.str());
+    }
+  }
+  py::object result;
+  if (is_buffer) {
+    std::string joined;
+    for (const auto &item : utf8_results) {
+      joined.append(item).push_back('\n');
+    }
+    result = py::bytes(joined);
+  } else {
+    py::list list(size);
+    for (std::size_t i = 0; i < size; ++i) {
+      list[i] = to_pystr(results[i]);
+    }
+    result = std::move(list);
+  }
+  if (errors == "mask") {
+    return py::make_tuple(result, to_pyarray("I", error_masks));
+  }
+  return result;
+}
+
+} // namespace icupy
+
 void init_idna(py::module &m) {
   //
   // class icu::IDNAInfo
@@ -118,7 +241,8 @@ void init_idna(py::module &m) {
         }
         return result;
       },
-      py::arg("label"), py::arg("dest"), py::arg("info"), R"doc(
+      py::call_guard<py::gil_scoped_release>(), py::arg("label"),
+      py::arg("dest"), py::arg("info"), R"doc(
       Convert a single domain name label into its ASCII form for DNS lookup,
       copy the result to *dest*, and return *dest* itself.
 
@@ -158,7 +282,8 @@ void init_idna(py::module &m) {
         }
         return result;
       },
-      py::arg("label"), py::arg("dest"), py::arg("info"), R"doc(
+      py::call_guard<py::gil_scoped_release>(), py::arg("label"),
+      py::arg("dest"), py::arg("info"), R"doc(
       Convert a single domain name label into its Unicode form for
       human-readable display, copy the result to *dest*, and return *dest*
       itself.
@@ -198,7 +323,8 @@ void init_idna(py::module &m) {
         }
         return result;
       },
-      py::arg("name"), py::arg("dest"), py::arg("info"), R"doc(
+      py::call_guard<py::gil_scoped_release>(), py::arg("name"),
+      py::arg("dest"), py::arg("info"), R"doc(
       Convert a whole domain name into its ASCII form for DNS lookup,
       copy the result to *dest*, and return *dest* itself.
 
@@ -226,6 +352,58 @@ void init_idna(py::module &m) {
       ``bytes`` version of :meth:`.name_to_ascii`, same behavior.
       )doc");
 
+  idna.def(
+      "names_to_ascii_many",
+      [](const IDNA &self, const py::object &names, const std::string &errors,
+         const std::optional<int> &workers) {
+        return icupy::convert_names(self, names, &IDNA::nameToASCII,
+                                    &IDNA::nameToASCII_UTF8, errors, workers);
+      },
+      py::arg("names"), py::kw_only(), py::arg("errors") = "mask",
+      py::arg("workers") = std::nullopt, R"doc(
+      Convert many whole domain names into their ASCII form for DNS lookup.
+
+      *names* is either a sequence of ``str`` or a buffer of newline-delimited
+      UTF-8 names, such as ``bytes`` or :class:`mmap.mmap`; a trailing
+      ``"\r"`` is removed from each line. The names are converted in
+      parallel by *workers* threads with the GIL released. If *workers* is
+      ``None``, the number of processors is used.
+
+      The converted names are returned as a list of ``str``, or as ``bytes``
+      with each name followed by ``"\n"`` if *names* is a buffer. *errors*
+      selects how the names with processing errors are handled:
+
+      * ``"mask"``: Return a tuple of the converted names and an
+        ``array.array('I')`` of the error bit sets
+        (see :meth:`IDNAInfo.get_errors`), which are 0 for the names without
+        errors.
+      * ``"raise"``: Raise :class:`ValueError` for the first name with
+        errors.
+      * ``"keep"``: Return the converted names, including those with errors,
+        as they are.
+
+      .. seealso::
+
+         :meth:`.name_to_ascii`
+         :meth:`.names_to_unicode_many`
+      )doc");
+
+  idna.def(
+      "names_to_unicode_many",
+      [](const IDNA &self, const py::object &names, const std::string &errors,
+         const std::optional<int> &workers) {
+        return icupy::convert_names(self, names, &IDNA::nameToUnicode,
+                                    &IDNA::nameToUnicodeUTF8, errors, workers);
+      },
+      py::arg("names"), py::kw_only(), py::arg("errors") = "mask",
+      py::arg("workers") = std::nullopt, R"doc(
+      Convert many whole domain names into their Unicode form for
+      human-readable display.
+
+      Same as :meth:`.names_to_ascii_many`, except that the names are
+      converted with :meth:`.name_to_unicode`.
+      )doc");
+
   idna.def(
       "name_to_unicode",
       [](const IDNA &self, const icupy::UnicodeStringVariant &name,
@@ -238,7 +416,8 @@ void init_idna(py::module &m) {
         }
         return result;
       },
-      py::arg("name"), py::arg("dest"), py::arg("info"), R"doc(
+      py::call_guard<py::gil_scoped_release>(), py::arg("name"),
+      py::arg("dest"), py::arg("info"), R"doc(
       Convert a whole domain name into its Unicode form for human-readable
       display, copy the result to *dest*, and return *dest* itself.
 
@@ -1,4 +1,5 @@
 #include "main.hpp"
+#include <string_view>
 #include <unicode/decimfmt.h>
 #include <unicode/fmtable.h>
 #include <unicode/plurrule.h>
@@ -151,9 +152,113 @@ ICUError::ICUError(const ErrorCode &error_code, const char *message)
 
 ICUError::ICUError(UErrorCode error_code) { error_code_.set(error_code); }
 
+char buffer_kind(const py::buffer_info &info) {
+  if (info.ndim != 1) {
+    throw py::value_error("buffer must be one-dimensional");
+  }
+  std::string_view format(info.format);
+#if U_IS_BIG_ENDIAN
+  constexpr std::string_view native_prefixes("@=>!");
+#else
+  constexpr std::string_view native_prefixes("@=<");
+#endif // U_IS_BIG_ENDIAN
+  if (!format.empty() &&
+      native_prefixes.find(format.front()) != std::string_view::npos) {
+    format.remove_prefix(1);
+  }
+  if (format.size() == 1) {
+    switch (format.front()) {
+    case 'b':
+    case 'h':
+    case 'i':
+    case 'l':
+    case 'q':
+    case 'n':
+      return 'i';
+    case 'B':
+    case 'H':
+    case 'I':
+    case 'L':
+    case 'Q':
+    case 'N':
+      return 'u';
+    case 'f':
+    case 'd':
+      return 'f';
+    default:
+      break;
+    }
+  }
+  throw py::type_error("unsupported buffer format: '" + info.format + "'");
+}
+
+std::vector<UChar32> to_code_points(const py::handle &values) {
+  if (!PyUnicode_Check(values.ptr())) {
+    return to_vector<UChar32>(values);
+  }
+  const auto length = PyUnicode_GET_LENGTH(values.ptr());
+  std::vector<UChar32> result(length);
+  for (py::ssize_t i = 0; i < length; ++i) {
+    result[i] = static_cast<UChar32>(PyUnicode_READ_CHAR(values.ptr(), i));
+  }
+  return result;
+}
+
+std::shared_ptr<py::buffer_info> request_buffer(const py::buffer &b,
+                                                py::ssize_t itemsize) {
+  auto info = std::shared_ptr<py::buffer_info>(new py::buffer_info(b.request()),
+                                               [](py::buffer_info *p) {
+                                                 py::gil_scoped_acquire acquire;
+                                                 delete p;
+                                               });
+  if (info->ndim != 1 || info->itemsize != itemsize ||
+      (info->size > 1 && info->strides[0] != itemsize)) {
+    throw py::value_error("buffer must be one-dimensional and C-contiguous "
+                          "with " +
+                          std::to_string(itemsize) + "-byte items");
+  }
+  return info;
+}
+
+py::str to_pystr(const UnicodeString &text) {
+  const auto length = text.length();
+  const auto begin = text.getBuffer();
+  const auto end = begin + length;
+  char16_t max_char = 0;
+  bool has_surrogates = false;
+  for (auto p = begin; p < end; ++p) {
+    max_char = std::max(max_char, *p);
+    has_surrogates |= U16_IS_SURROGATE(*p);
+  }
+  if (has_surrogates) {
+#if U_IS_BIG_ENDIAN
+    int byteorder = 1;
+#else
+    int byteorder = -1;
+#endif // U_IS_BIG_ENDIAN
+    auto result = PyUnicode_DecodeUTF16(reinterpret_cast<const char *>(begin),
+                                        length * sizeof(char16_t),
+                                        "surrogatepass", &byteorder);
+    if (result == nullptr) {
+      throw py::error_already_set();
+    }
+    return py::reinterpret_steal<py::str>(result);
+  }
+  auto result = PyUnicode_New(length, max_char);
+  if (result == nullptr) {
+    throw py::error_already_set();
+  }
+  if (PyUnicode_KIND(result) == PyUnicode_1BYTE_KIND) {
+    std::copy(begin, end, PyUnicode_1BYTE_DATA(result));
+  } else {
+    std::copy(begin, end, PyUnicode_2BYTE_DATA(result));
+  }
+  return py::reinterpret_steal<py::str>(result);
+}
+
 } // namespace icupy
 
-PYBIND11_MODULE(MODULE_NAME, m) {
+PYBIND11_MODULE(MODULE_NAME, m, py::mod_gil_not_used()) {
   m.doc() = R"doc(
       Python Binding for ICU4C.
       )doc";
@@ -172,11 +277,14 @@ PYBIND11_MODULE(MODULE_NAME, m) {
         std::rethrow_exception(p);
       }
     } catch (const icupy::ICUError &e) {
+      // Set the attributes on the exception instance, not on the shared
+      // exception type, so that concurrent threads do not overwrite them.
       auto &ex = exc_storage.get_stored();
       const auto error_code = py::cast(e.error_code());
-      ex.attr("error_code") = error_code;
-      ex.attr("reason") = py::cast(e.what());
-      py::set_error(ex, error_code);
+      auto value = ex(error_code);
+      value.attr("error_code") = error_code;
+      value.attr("reason") = py::cast(e.what());
+      py::set_error(ex, value);
     }
   });
 
@@ -261,6 +369,11 @@ PYBIND11_MODULE(MODULE_NAME, m) {
       For more information, see the ICU User Guide: `Strings
       <https://unicode-org.github.io/icu/userguide/strings/#strings-in-icu>`__.
 
+      .. note::
+
+         ``UnicodeString`` is mutable and is not thread-safe. Do not modify
+         an instance while other threads are using it.
+
       .. seealso::
 
          :class:`StringCharacterIterator`
@@ -7,11 +7,18 @@
 #define strdup _strdup
 #endif // _MSC_VER
 
+#include <algorithm>
+#include <cstring>
+#include <memory>
 #include <pybind11/pybind11.h>
+#include <string>
+#include <type_traits>
 #include <unicode/errorcode.h>
 #include <unicode/locid.h>
 #include <unicode/unistr.h>
+#include <unicode/utf16.h>
 #include <variant>
+#include <vector>
 
 namespace py = pybind11;
 
@@ -28,7 +35,15 @@ using CharPtrVariant = std::variant<std::string, py::bytes>;
 
 using LocaleVariant = std::variant<icu::Locale, std::string>;
 
-using UnicodeStringVariant = std::variant<icu::UnicodeString, std::u16string>;
+// Python str converted to UTF-16 once, directly from the PEP 393
+// representation. UCS-2 strings are not copied: *value* is a read-only alias
+// of the string data. *owner* is the source str object.
+struct PyUnicodeString {
+  py::object owner;
+  icu::UnicodeString value;
+};
+
+using UnicodeStringVariant = std::variant<icu::UnicodeString, PyUnicodeString>;
 
 struct CharPtr {
   CharPtrVariant value;
@@ -73,18 +88,133 @@ inline icu::Locale to_locale(const LocaleVariant &value) {
       value);
 }
 
-inline icu::UnicodeString to_unistr(const UnicodeStringVariant &value) {
+inline const icu::UnicodeString &to_unistr(const UnicodeStringVariant &value) {
   return std::visit(
-      overload{[](const icu::UnicodeString &text) -> icu::UnicodeString {
-                 return text;
-               },
-               [](const std::u16string &text) -> icu::UnicodeString {
-                 return icu::UnicodeString(text.data(),
-                                           static_cast<int32_t>(text.size()));
+      overload{[](const icu::UnicodeString &text)
+                   -> const icu::UnicodeString & { return text; },
+               [](const PyUnicodeString &text) -> const icu::UnicodeString & {
+                 return text.value;
                }},
       value);
 }
 
+// Return a new array.array of *typecode* that contains a copy of *values*.
+template <typename T>
+py::object to_pyarray(const char *typecode, const std::vector<T> &values) {
+  auto result = py::module_::import("array").attr("array")(typecode);
+  if (result.attr("itemsize").cast<std::size_t>() != sizeof(T)) {
+    throw std::runtime_error("array item size mismatch for typecode " +
+                             std::string(typecode));
+  }
+  result.attr("frombytes")(py::memoryview::from_memory(
+      values.data(), static_cast<py::ssize_t>(values.size() * sizeof(T))));
+  return result;
+}
+
+// Return the kind of the items in the one-dimensional buffer *info*: 'i' for
+// signed integers, 'u' for unsigned integers, or 'f' for floating-point
+// numbers. Raise TypeError if the items are not numbers in the native byte
+// order.
+char buffer_kind(const py::buffer_info &info);
+
+// Return a copy of the numbers in the one-dimensional buffer *info* converted
+// to T. Raise TypeError if T is an integer type and the items are
+// floating-point numbers, or ValueError if an integer is out of range of T.
+template <typename T>
+std::vector<T> buffer_to_vector(const py::buffer_info &info) {
+  const auto kind = buffer_kind(info);
+  if constexpr (std::is_integral_v<T>) {
+    if (kind == 'f') {
+      throw py::type_error("expected a buffer of integers, got format '" +
+                           info.format + "'");
+    }
+  }
+  const auto size = static_cast<std::size_t>(info.shape[0]);
+  const auto stride = info.strides[0];
+  const auto data = static_cast<const char *>(info.ptr);
+  std::vector<T> result(size);
+  auto copy = [&](auto zero) {
+    using U = decltype(zero);
+    for (std::size_t i = 0; i < size; ++i) {
+      U value;
+      std::memcpy(&value, data + static_cast<py::ssize_t>(i) * stride,
+                  sizeof(U));
+      if constexpr (std::is_integral_v<T> && std::is_integral_v<U>) {
+        if (static_cast<U>(static_cast<T>(value)) != value ||
+            (value < 0) != (static_cast<T>(value) < 0)) {
+          throw py::value_error("value out of range: " + std::to_string(value));
+        }
+      }
+      result[i] = static_cast<T>(value);
+    }
+  };
+  const auto itemsize = info.itemsize;
+  if (kind == 'f' && itemsize == sizeof(float)) {
+    copy(float{});
+  } else if (kind == 'f' && itemsize == sizeof(double)) {
+    copy(double{});
+  } else if (kind == 'i' && itemsize == 1) {
+    copy(int8_t{});
+  } else if (kind == 'i' && itemsize == 2) {
+    copy(int16_t{});
+  } else if (kind == 'i' && itemsize == 4) {
+    copy(int32_t{});
+  } else if (kind == 'i' && itemsize == 8) {
+    copy(int64_t{});
+  } else if (kind == 'u' && itemsize == 1) {
+    copy(uint8_t{});
+  } else if (kind == 'u' && itemsize == 2) {
+    copy(uint16_t{});
+  } else if (kind == 'u' && itemsize == 4) {
+    copy(uint32_t{});
+  } else if (kind == 'u' && itemsize == 8) {
+    copy(uint64_t{});
+  } else {
+    throw py::type_error("unsupported buffer format: '" + info.format + "'");
+  }
+  return result;
+}
+
+// Return a copy of the numbers in *values* converted to T. *values* is either
+// an object that supports the buffer protocol, e.g., array.array, or an
+// iterable of Python numbers.
+template <typename T> std::vector<T> to_vector(const py::handle &values) {
+  if (PyObject_CheckBuffer(values.ptr())) {
+    return buffer_to_vector<T>(
+        py::reinterpret_borrow<py::buffer>(values).request());
+  }
+  std::vector<T> result;
+  if (PySequence_Check(values.ptr())) {
+    result.reserve(py::len(values));
+  }
+  for (auto item : values) {
+    try {
+      result.push_back(item.cast<T>());
+    } catch (const py::cast_error &) {
+      throw py::type_error("expected a number, got " +
+                           py::str(py::type::handle_of(item).attr("__name__"))
+                               .cast<std::string>());
+    }
+  }
+  return result;
+}
+
+// Return a copy of the code points in *values*. *values* is either a str, an
+// object that supports the buffer protocol with integer items, or an iterable
+// of Python ints.
+std::vector<UChar32> to_code_points(const py::handle &values);
+
+// Return a view of the C-contiguous, one-dimensional buffer *b* whose items
+// are *itemsize* bytes. Raise ValueError if *b* is not such a buffer. The view
+// is released, with the GIL acquired, when the last reference to it is
+// dropped.
+std::shared_ptr<py::buffer_info> request_buffer(const py::buffer &b,
+                                                py::ssize_t itemsize);
+
+// Return a Python str from the UTF-16 string *text*. Unpaired surrogates are
+// passed through as they are.
+py::str to_pystr(const icu::UnicodeString &text);
+
 class ICUError : public std::exception {
 public:
   explicit ICUError(const icu::ErrorCode &error_code, const char *message = "");
@@ -102,4 +232,66 @@ private:
 
 } // namespace icupy
 
+namespace pybind11::detail {
+
+template <> struct type_caster<icupy::PyUnicodeString> {
+public:
+  PYBIND11_TYPE_CASTER(icupy::PyUnicodeString, const_name("str"));
+
+  bool load(handle src, bool) {
+    if (!src || !PyUnicode_Check(src.ptr())) {
+      return false;
+    }
+    auto obj = src.ptr();
+#if PY_VERSION_HEX < 0x030C0000
+    if (PyUnicode_READY(obj) == -1) {
+      throw error_already_set();
+    }
+#endif // PY_VERSION_HEX < 0x030C0000
+    const auto length = PyUnicode_GET_LENGTH(obj);
+    const auto kind = PyUnicode_KIND(obj);
+    const auto data = PyUnicode_DATA(obj);
+    if (length > INT32_MAX) {
+      return false;
+    }
+    value.owner = reinterpret_borrow<object>(src);
+    auto &dest = value.value;
+    if (kind == PyUnicode_2BYTE_KIND) {
+      dest.setTo(false, static_cast<const char16_t *>(data),
+                 static_cast<int32_t>(length));
+      return true;
+    }
+    if (kind == PyUnicode_1BYTE_KIND) {
+      auto src_ptr = static_cast<const Py_UCS1 *>(data);
+      auto buffer = dest.getBuffer(static_cast<int32_t>(length));
+      if (buffer == nullptr) {
+        throw std::bad_alloc();
+      }
+      std::copy(src_ptr, src_ptr + length, buffer);
+      dest.releaseBuffer(static_cast<int32_t>(length));
+      return true;
+    }
+    auto src_ptr = static_cast<const Py_UCS4 *>(data);
+    auto src_limit = src_ptr + length;
+    const auto supplementary =
+        std::count_if(src_ptr, src_limit, [](Py_UCS4 c) { return c > 0xffff; });
+    if (length + supplementary > INT32_MAX) {
+      return false;
+    }
+    const auto dest_length = static_cast<int32_t>(length + supplementary);
+    auto buffer = dest.getBuffer(dest_length);
+    if (buffer == nullptr) {
+      throw std::bad_alloc();
+    }
+    int32_t i = 0;
+    for (auto p = src_ptr; p < src_limit; ++p) {
+      U16_APPEND_UNSAFE(buffer, i, *p);
+    }
+    dest.releaseBuffer(dest_length);
+    return true;
+  }
+};
+
+} // namespace pybind11::detail
+
 #endif // ICUPY_MAIN_HPP
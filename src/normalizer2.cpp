@@ -2,6 +2,7 @@
 #include <optional>
 #include <pybind11/stl.h>
 #include <unicode/normalizer2.h>
+#include <vector>
 
 #if (U_ICU_VERSION_MAJOR_NUM >= 60)
 #include <unicode/edits.h>
@@ -26,7 +27,8 @@ void init_normalizer2(py::module &m) {
         }
         return result;
       },
-      py::arg("first"), py::arg("second"));
+      py::call_guard<py::gil_scoped_release>(), py::arg("first"),
+      py::arg("second"));
 
 #if (U_ICU_VERSION_MAJOR_NUM >= 49)
   n2.def("compose_pair", &Normalizer2::composePair, py::arg("a"), py::arg("b"));
@@ -148,7 +150,24 @@ void init_normalizer2(py::module &m) {
         }
         return result;
       },
-      py::arg("s"));
+      py::call_guard<py::gil_scoped_release>(), py::arg("s"));
+
+  n2.def(
+      "is_normalized_many",
+      [](const Normalizer2 &self,
+         const std::vector<icupy::UnicodeStringVariant> &iterable) {
+        std::vector<bool> result;
+        result.reserve(iterable.size());
+        ErrorCode error_code;
+        for (const auto &s : iterable) {
+          result.push_back(self.isNormalized(icupy::to_unistr(s), error_code));
+          if (error_code.isFailure()) {
+            throw icupy::ICUError(error_code);
+          }
+        }
+        return result;
+      },
+      py::call_guard<py::gil_scoped_release>(), py::arg("iterable"));
 
 #if (U_ICU_VERSION_MAJOR_NUM >= 60)
   n2.def(
@@ -174,7 +193,7 @@ void init_normalizer2(py::module &m) {
           }
           return result;
         },
-        py::arg("src"))
+        py::call_guard<py::gil_scoped_release>(), py::arg("src"))
       .def(
           "normalize",
           [](const Normalizer2 &self, const icupy::UnicodeStringVariant &src,
@@ -187,7 +206,49 @@ void init_normalizer2(py::module &m) {
             }
             return result;
           },
-          py::arg("src"), py::arg("dest"));
+          py::call_guard<py::gil_scoped_release>(), py::arg("src"),
+          py::arg("dest"));
+
+  n2.def(
+      "normalize_many",
+      [](const Normalizer2 &self,
+         const std::vector<icupy::UnicodeStringVariant> &iterable) {
+        // Only the strings that are not normalized yet get a new buffer.
+        std::vector<std::optional<UnicodeString>> normalized(iterable.size());
+        {
+          py::gil_scoped_release release;
+          ErrorCode error_code;
+          for (std::size_t i = 0; i < iterable.size(); ++i) {
+            const auto &src = icupy::to_unistr(iterable[i]);
+            const auto span = self.spanQuickCheckYes(src, error_code);
+            if (error_code.isFailure()) {
+              throw icupy::ICUError(error_code);
+            }
+            if (span == src.length()) {
+              continue;
+            }
+            auto &dest = normalized[i].emplace(src, 0, span);
+            self.normalizeSecondAndAppend(dest, src.tempSubString(span),
+                                          error_code);
+            if (error_code.isFailure()) {
+              throw icupy::ICUError(error_code);
+            }
+          }
+        }
+        py::list result(iterable.size());
+        for (std::size_t i = 0; i < iterable.size(); ++i) {
+          if (normalized[i]) {
+            result[i] = icupy::to_pystr(*normalized[i]);
+          } else if (auto s =
+                         std::get_if<icupy::PyUnicodeString>(&iterable[i])) {
+            result[i] = s->owner;
+          } else {
+            result[i] = icupy::to_pystr(icupy::to_unistr(iterable[i]));
+          }
+        }
+        return result;
+      },
+      py::arg("iterable"));
 
   n2.def(
       "normalize_second_and_append",
@@ -201,7 +262,8 @@ void init_normalizer2(py::module &m) {
         }
         return result;
       },
-      py::arg("first"), py::arg("second"));
+      py::call_guard<py::gil_scoped_release>(), py::arg("first"),
+      py::arg("second"));
 
 #if (U_ICU_VERSION_MAJOR_NUM >= 60)
   n2.def(
@@ -231,7 +293,24 @@ void init_normalizer2(py::module &m) {
         }
         return result;
       },
-      py::arg("s"));
+      py::call_guard<py::gil_scoped_release>(), py::arg("s"));
+
+  n2.def(
+      "quick_check_many",
+      [](const Normalizer2 &self,
+         const std::vector<icupy::UnicodeStringVariant> &iterable) {
+        std::vector<UNormalizationCheckResult> result;
+        result.reserve(iterable.size());
+        ErrorCode error_code;
+        for (const auto &s : iterable) {
+          result.push_back(self.quickCheck(icupy::to_unistr(s), error_code));
+          if (error_code.isFailure()) {
+            throw icupy::ICUError(error_code);
+          }
+        }
+        return result;
+      },
+      py::call_guard<py::gil_scoped_release>(), py::arg("iterable"));
 
   n2.def(
       "span_quick_check_yes",
@@ -243,7 +322,7 @@ void init_normalizer2(py::module &m) {
         }
         return result;
       },
-      py::arg("s"));
+      py::call_guard<py::gil_scoped_release>(), py::arg("s"));
 
   //
   // class icu::FilteredNormalizer2
@@ -1,6 +1,8 @@
 #include "main.hpp"
 
 #if (U_ICU_VERSION_MAJOR_NUM >= 60)
+#include <climits>
+#include <optional>
 #include <pybind11/stl.h>
 #include <unicode/numberformatter.h>
 
@@ -19,6 +21,65 @@ using _UnlocalizedNumberFormatterSettings =
     NumberFormatterSettings<UnlocalizedNumberFormatter>;
 #endif // (U_ICU_VERSION_MAJOR_NUM >= 60)
 
+#if (U_ICU_VERSION_MAJOR_NUM >= 62)
+namespace icupy {
+
+// Number to be formatted by LocalizedNumberFormatter.format_many(). An
+// integer that does not fit in int64_t is kept as a decimal string.
+using NumberVariant = std::variant<double, int64_t, std::string>;
+
+static std::vector<NumberVariant> to_numbers(const py::handle &values) {
+  std::vector<NumberVariant> result;
+  if (PyObject_CheckBuffer(values.ptr())) {
+    const auto info = py::reinterpret_borrow<py::buffer>(values).request();
+    const auto kind = buffer_kind(info);
+    if (kind == 'f') {
+      const auto numbers = buffer_to_vector<double>(info);
+      result.assign(numbers.begin(), numbers.end());
+    } else if (kind == 'u' && info.itemsize == sizeof(uint64_t)) {
+      const auto numbers = buffer_to_vector<uint64_t>(info);
+      result.reserve(numbers.size());
+      for (const auto value : numbers) {
+        if (value > static_cast<uint64_t>(INT64_MAX)) {
+          result.emplace_back(std::to_string(value));
+        } else {
+          result.emplace_back(static_cast<int64_t>(value));
+        }
+      }
+    } else {
+      const auto numbers = buffer_to_vector<int64_t>(info);
+      result.assign(numbers.begin(), numbers.end());
+    }
+    return result;
+  }
+  if (PySequence_Check(values.ptr())) {
+    result.reserve(py::len(values));
+  }
+  for (auto item : values) {
+    if (PyLong_Check(item.ptr())) {
+      int overflow = 0;
+      const auto value = PyLong_AsLongLongAndOverflow(item.ptr(), &overflow);
+      if (overflow != 0) {
+        result.emplace_back(py::str(item).cast<std::string>());
+      } else if (value == -1 && PyErr_Occurred()) {
+        throw py::error_already_set();
+      } else {
+        result.emplace_back(static_cast<int64_t>(value));
+      }
+      continue;
+    }
+    const auto value = PyFloat_AsDouble(item.ptr());
+    if (value == -1.0 && PyErr_Occurred()) {
+      throw py::error_already_set();
+    }
+    result.emplace_back(value);
+  }
+  return result;
+}
+
+} // namespace icupy
+#endif // (U_ICU_VERSION_MAJOR_NUM >= 62)
+
 void init_numberformatter(py::module &, py::module &m2) {
 #if (U_ICU_VERSION_MAJOR_NUM >= 60)
   //
@@ -472,6 +533,81 @@ void init_numberformatter(py::module &, py::module &m2) {
       in the :class:`NumberFormatter` fluent setting chain.
       )doc");
 
+#if (U_ICU_VERSION_MAJOR_NUM >= 62)
+  lnf.def(
+      "format_many",
+      [](const LocalizedNumberFormatter &self, const py::object &values,
+         const std::optional<py::object> &out) {
+        const auto numbers = icupy::to_numbers(values);
+        const auto size = numbers.size();
+        if (out && py::len(*out) != size) {
+          throw py::value_error("length of out (" +
+                                std::to_string(py::len(*out)) +
+                                ") does not match the number of values (" +
+                                std::to_string(size) + ")");
+        }
+        std::vector<UnicodeString> strings(size);
+        {
+          py::gil_scoped_release release;
+          ErrorCode error_code;
+          for (std::size_t i = 0; i < size; ++i) {
+            auto formatted = std::visit(
+                icupy::overload{[&](double value) {
+                                  return self.formatDouble(value, error_code);
+                                },
+                                [&](int64_t value) {
+                                  return self.formatInt(value, error_code);
+                                },
+                                [&](const std::string &value) {
+                                  return self.formatDecimal(value, error_code);
+                                }},
+                numbers[i]);
+            strings[i] = formatted.toString(error_code);
+            if (error_code.isFailure()) {
+              throw icupy::ICUError(error_code);
+            }
+          }
+        }
+        if (out) {
+          for (std::size_t i = 0; i < size; ++i) {
+            (*out)[py::int_(i)] = icupy::to_pystr(strings[i]);
+          }
+          return *out;
+        }
+        py::list result(size);
+        for (std::size_t i = 0; i < size; ++i) {
+          result[i] = icupy::to_pystr(strings[i]);
+        }
+        return static_cast<py::object>(result);
+      },
+      py::arg("values"), py::arg("out") = std::nullopt, R"doc(
+      Format each number in *values* to a string using the settings
+      specified in the :class:`NumberFormatter` fluent setting chain and
+      return a list of ``str``.
+
+      *values* is either an iterable of ``int`` and ``float``, or an object
+      that supports the buffer protocol with integer or floating-point items,
+      such as :class:`array.array` or a one-dimensional NumPy array.
+      Integers are formatted with :meth:`.format_int` (or
+      :meth:`.format_decimal` if they do not fit in 64 bits) and floats with
+      :meth:`.format_double`. Formatting runs with the GIL released, and no
+      :class:`FormattedNumber` objects are created.
+
+      If *out* is given, the strings are stored into *out*, which must be a
+      mutable sequence of the same length as *values*, e.g., a ``list`` or a
+      NumPy array with ``StringDType``, and *out* is returned.
+
+      .. rubric:: Example
+
+      .. code-block:: python
+
+         from array import array
+         from icupy import icu
+         fmt = icu.number.NumberFormatter.with_locale(icu.ULOC_US)
+         fmt.format_many(array("d", [1234.5, 0.25]))  # ['1,234.5', '0.25']
+      )doc");
+#endif // (U_ICU_VERSION_MAJOR_NUM >= 62)
+
 #if (U_ICU_VERSION_MAJOR_NUM >= 62)
   lnf.def(
       "to_format",
@@ -1,4 +1,7 @@
 #include "main.hpp"
+#include "parallel.hpp"
+#include <cmath>
+#include <limits>
 #include <optional>
 #include <pybind11/native_enum.h>
 #include <pybind11/stl.h>
@@ -425,6 +428,98 @@ rounding-modes
           },
           py::arg("text"), py::arg("result"));
 
+  nf.def(
+      "parse_many",
+      [](const NumberFormat &self,
+         const std::vector<icupy::UnicodeStringVariant> &strings,
+         const std::string &errors, const std::string &dtype,
+         const std::optional<int> &workers) -> py::object {
+        if (errors != "nan" && errors != "raise" && errors != "mask") {
+          throw py::value_error(
+              "errors must be 'nan', 'raise', or 'mask', not '" + errors + "'");
+        }
+        if (dtype != "d" && dtype != "q") {
+          throw py::value_error("dtype must be 'd' or 'q', not '" + dtype +
+                                "'");
+        }
+        if (workers && *workers < 1) {
+          throw py::value_error("workers must be greater than 0");
+        }
+        const auto size = strings.size();
+        const auto as_int64 = dtype == "q";
+        // A string that cannot be parsed is NaN, or INT64_MIN for int64.
+        std::vector<double> doubles(as_int64 ? 0 : size,
+                                    std::numeric_limits<double>::quiet_NaN());
+        std::vector<int64_t> int64s(as_int64 ? size : 0, INT64_MIN);
+        std::vector<uint8_t> valid(size, 0);
+        {
+          py::gil_scoped_release release;
+          const auto num_workers = icupy::num_workers(
+              size, workers ? static_cast<std::size_t>(*workers) : 0);
+          icupy::parallel_for(
+              size, num_workers,
+              [&](std::size_t n, std::size_t begin, std::size_t end) {
+                std::unique_ptr<NumberFormat> clone;
+                if (n > 0) {
+                  clone.reset(static_cast<NumberFormat *>(self.clone()));
+                  if (!clone) {
+                    throw icupy::ICUError(U_MEMORY_ALLOCATION_ERROR);
+                  }
+                }
+                const auto &fmt = clone ? *clone : self;
+                Formattable result;
+                for (auto i = begin; i < end; ++i) {
+                  const auto &text = icupy::to_unistr(strings[i]);
+                  ParsePosition pos;
+                  fmt.parse(text, result, pos);
+                  if (pos.getErrorIndex() >= 0 ||
+                      pos.getIndex() != text.length()) {
+                    continue;
+                  }
+                  ErrorCode error_code;
+                  if (!as_int64) {
+                    const auto value = result.getDouble(error_code);
+                    if (error_code.isSuccess()) {
+                      doubles[i] = value;
+                      valid[i] = 1;
+                    }
+                    continue;
+                  }
+                  // getInt64() truncates a fraction, so reject it here.
+                  if (result.getType() == Formattable::kDouble) {
+                    const auto value = result.getDouble();
+                    if (std::trunc(value) != value) {
+                      continue;
+                    }
+                  }
+                  const auto value = result.getInt64(error_code);
+                  if (error_code.isSuccess()) {
+                    int64s[i] = value;
+                    valid[i] = 1;
+                  }
+                }
+              });
+        }
+        if (errors == "raise") {
+          const auto it = std::find(valid.begin(), valid.end(), 0);
+          if (it != valid.end()) {
+            const auto i = static_cast<std::size_t>(it - valid.begin());
+            throw py::value_error(
+                "could not parse string at index " + std::to_string(i) + ": " +
+                py::repr(icupy::to_pystr(icupy::to_unistr(strings[i])))
+                    .cast<std::string>());
+          }
+        }
+        auto result = as_int64 ? icupy::to_pyarray("q", int64s)
+                               : icupy::to_pyarray("d", doubles);
+        if (errors == "mask") {
+          return py::make_tuple(result, icupy::to_pyarray("B", valid));
+        }
+        return result;
+      },
+      py::arg("strings"), py::kw_only(), py::arg("errors") = "nan",
+      py::arg("dtype") = "d", py::arg("workers") = std::nullopt);
+
   nf.def(
       "parse_currency",
       [](const NumberFormat &self, const icupy::UnicodeStringVariant &text,
@@ -0,0 +1,64 @@
+#ifndef ICUPY_PARALLEL_HPP
+#define ICUPY_PARALLEL_HPP
+
+#include <algorithm>
+#include <cstddef>
+#include <exception>
+#include <thread>
+#include <vector>
+
+namespace icupy {
+
+// Return the number of threads to be used for *size* items. *workers* is the
+// requested number of threads, or 0 for the number of processors. Each thread
+// gets at least *min_chunk* items.
+inline std::size_t num_workers(std::size_t size, std::size_t workers,
+                               std::size_t min_chunk = 1024) {
+  if (workers == 0) {
+    workers = std::max(1U, std::thread::hardware_concurrency());
+  }
+  return std::max<std::size_t>(1, std::min(workers, size / min_chunk + 1));
+}
+
+// Split [0, size) into *workers* contiguous chunks and call fn(n, begin, end)
+// for each chunk n. The first chunk is processed on the calling thread and
+// the others on new threads. If fn throws an exception, it is rethrown after
+// all threads have been joined.
+template <typename Fn>
+void parallel_for(std::size_t size, std::size_t workers, Fn &&fn) {
+  workers = std::max<std::size_t>(1, workers);
+  auto bound = [&](std::size_t n) { return size * n / workers; };
+  if (workers == 1) {
+    fn(std::size_t{0}, std::size_t{0}, size);
+    return;
+  }
+  std::vector<std::exception_ptr> errors(workers);
+  std::vector<std::thread> threads;
+  threads.reserve(workers - 1);
+  for (std::size_t n = 1; n < workers; ++n) {
+    threads.emplace_back([&, n] {
+      try {
+        fn(n, bound(n), bound(n + 1));
+      } catch (...) {
+        errors[n] = std::current_exception();
+      }
+    });
+  }
+  try {
+    fn(std::size_t{0}, std::size_t{0}, bound(1));
+  } catch (...) {
+    errors[0] = std::current_exception();
+  }
+  for (auto &thread : threads) {
+    thread.join();
+  }
+  for (const auto &error : errors) {
+    if (error) {
+      std::rethrow_exception(error);
+    }
+  }
+}
+
+} // namespace icupy
+
+#endif // ICUPY_PARALLEL_HPP
@@ -46,6 +46,12 @@ void init_rbbi(py::module &m) {
       For more information, see the ICU User Guide:
       `Boundary Analysis <https://unicode-org.github.io/icu/userguide/boundaryanalysis/>`__.
 
+      .. note::
+
+         A ``BreakIterator`` object keeps the current position in its text and
+         is not thread-safe. Use a separate instance (e.g., :meth:`.clone`)
+         for each thread.
+
       .. seealso::
 
          :class:`RuleBasedBreakIterator`
@@ -217,6 +223,32 @@ void init_rbbi(py::module &m) {
          :meth:`.set_text`
       )doc");
 
+  bi.def(
+      "boundaries",
+      [](const BreakIterator &self, const icupy::UnicodeStringVariant &text) {
+        std::vector<int32_t> result;
+        {
+          py::gil_scoped_release release;
+          std::unique_ptr<BreakIterator> it(self.clone());
+          it->setText(icupy::to_unistr(text));
+          for (auto n = it->first(); n != BreakIterator::DONE; n = it->next()) {
+            result.push_back(n);
+          }
+        }
+        return icupy::to_pyarray("i", result);
+      },
+      py::arg("text"), R"doc(
+      Return all the boundaries in *text* as an ``array.array('i')``.
+
+      The result includes the start and the end of *text*. Offsets are in
+      UTF-16 code units. The whole iteration runs natively with the GIL
+      released. This break iterator's text and position are not changed.
+
+      .. seealso::
+
+         :meth:`.split`
+      )doc");
+
   bi.def("clone", &BreakIterator::clone,
          R"doc(
       Return a copy of this instance.
@@ -556,6 +588,64 @@ void init_rbbi(py::module &m) {
          iterator object.
       )doc");
 
+#if (U_ICU_VERSION_MAJOR_NUM >= 52)
+  bi.def(
+      "split",
+      [](const BreakIterator &self, const icupy::UnicodeStringVariant &text,
+         const std::optional<std::pair<int32_t, int32_t>> &rule_status) {
+        const auto &src = icupy::to_unistr(text);
+        std::vector<std::pair<int32_t, int32_t>> segments;
+        {
+          py::gil_scoped_release release;
+          std::unique_ptr<BreakIterator> it(self.clone());
+          it->setText(src);
+          auto start = it->first();
+          for (auto end = it->next(); end != BreakIterator::DONE;
+               start = end, end = it->next()) {
+            if (rule_status) {
+              const auto status = it->getRuleStatus();
+              if (status < rule_status->first ||
+                  status >= rule_status->second) {
+                continue;
+              }
+            }
+            segments.emplace_back(start, end);
+          }
+        }
+        py::list result(segments.size());
+        for (std::size_t i = 0; i < segments.size(); ++i) {
+          const auto [start, end] = segments[i];
+          result[i] = icupy::to_pystr(src.tempSubString(start, end - start));
+        }
+        return result;
+      },
+      py::arg("text"), py::arg("rule_status") = std::nullopt, R"doc(
+      Split *text* at its boundaries and return the segments as a list of
+      ``str``.
+
+      If *rule_status* is a pair ``(low, high)``, only the segments whose rule
+      status (see :meth:`.get_rule_status`) is in the range
+      ``low <= status < high`` are returned. The whole iteration runs natively
+      with the GIL released. This break iterator's text and position are not
+      changed.
+
+      .. seealso::
+
+         :meth:`.boundaries`
+
+      .. rubric:: Example
+
+      .. code-block:: python
+
+         >>> from icupy import icu
+         >>> bi = icu.BreakIterator.create_word_instance(icu.ULOC_US)
+         >>> bi.split("Hello, world 42!")
+         ['Hello', ',', ' ', 'world', ' ', '42', '!']
+         >>> bi.split("Hello, world 42!", (icu.UBRK_WORD_NUMBER, icu.UBRK_WORD_IDEO_LIMIT))
+         ['Hello', 'world', '42']
+      )doc");
+#endif // (U_ICU_VERSION_MAJOR_NUM >= 52)
+
   // TODO: Implement "static UBool BreakIterator::unregister(URegistryKey key,
   //  UErrorCode &status)".
 
@@ -1,15 +1,113 @@
 #include "context.hpp"
+#include "parallel.hpp"
 #include "unistrlist.hpp"
 #include "uregex.hpp"
 #include "utextvec.hpp"
+#include <exception>
 #include <memory>
+#include <mutex>
 #include <optional>
 #include <pybind11/operators.h>
 #include <pybind11/stl.h>
 #include <unicode/regex.h>
+#include <utility>
 
 using namespace icu;
 
+namespace icupy {
+
+// Find the next match of *matcher*, and return true if it is found.
+bool find_next(RegexMatcher &matcher) {
+#if (U_ICU_VERSION_MAJOR_NUM >= 55)
+  ErrorCode error_code;
+  auto result = matcher.find(error_code);
+  if (error_code.isFailure()) {
+    throw ICUError(error_code);
+  }
+  return result;
+#else
+  return matcher.find();
+#endif // (U_ICU_VERSION_MAJOR_NUM >= 55)
+}
+
+// Return a new matcher of *pattern* without input text.
+std::unique_ptr<RegexMatcher> new_matcher(const RegexPattern &pattern) {
+  ErrorCode error_code;
+  std::unique_ptr<RegexMatcher> result(pattern.matcher(error_code));
+  if (error_code.isFailure()) {
+    throw ICUError(error_code);
+  }
+  return result;
+}
+
+//
+// icupy::RegexScanner
+//
+class RegexScanner {
+public:
+  RegexScanner(const RegexPattern &pattern, std::unique_ptr<UTextPtr> text,
+               std::size_t chunk_hint)
+      : text_(std::move(text)), matcher_(new_matcher(pattern)),
+        chunk_hint_(chunk_hint) {
+    matcher_->reset(*text_);
+  }
+
+  ~RegexScanner() {
+    // The matcher holds a shallow clone of the text.
+    matcher_.reset();
+    utext_close(*text_);
+  }
+
+  py::object next() {
+    // Like a generator, the scanner cannot be resumed while it is running.
+    std::unique_lock<std::mutex> lock(mutex_, std::try_to_lock);
+    if (!lock.owns_lock()) {
+      throw py::value_error("RegexScanner already executing");
+    }
+    std::vector<int64_t> offsets;
+    if (!error_) {
+      py::gil_scoped_release release;
+      try {
+        while (!finished_ && offsets.size() < chunk_hint_ * 2) {
+          if (!find_next(*matcher_)) {
+            finished_ = true;
+            break;
+          }
+          ErrorCode error_code;
+          const auto start = matcher_->start64(error_code);
+          const auto end = matcher_->end64(error_code);
+          if (error_code.isFailure()) {
+            throw ICUError(error_code);
+          }
+          offsets.push_back(start);
+          offsets.push_back(end);
+        }
+      } catch (...) {
+        // Yield the matches found so far, and raise on the next call.
+        finished_ = true;
+        error_ = std::current_exception();
+      }
+    }
+    if (offsets.empty()) {
+      if (error_) {
+        std::rethrow_exception(std::exchange(error_, nullptr));
+      }
+      throw py::stop_iteration();
+    }
+    return to_pyarray("q", offsets);
+  }
+
+private:
+  std::unique_ptr<UTextPtr> text_;
+  std::unique_ptr<RegexMatcher> matcher_;
+  std::size_t chunk_hint_;
+  bool finished_ = false;
+  std::exception_ptr error_;
+  std::mutex mutex_;
+};
+
+} // namespace icupy
+
 void init_regex(py::module &m) {
   //
   // class icu::RegexMatcher
@@ -21,6 +119,12 @@ void init_regex(py::module &m) {
       For more information, see the ICU User Guide:
       `Regular Expressions <https://unicode-org.github.io/icu/userguide/strings/regexp.html>`__.
 
+      .. note::
+
+         A ``RegexMatcher`` object keeps the state of the match and is not
+         thread-safe. Use a separate instance for each thread, e.g., create
+         one with :meth:`RegexPattern.matcher`.
+
       .. seealso::
 
          :class:`RegexPattern`
@@ -177,11 +281,12 @@ void init_regex(py::module &m) {
       });
 
 #if (U_ICU_VERSION_MAJOR_NUM < 55)
-  rm.def("find", py::overload_cast<>(&RegexMatcher::find));
+  rm.def("find", py::overload_cast<>(&RegexMatcher::find),
+         py::call_guard<py::gil_scoped_release>());
 #endif // (U_ICU_VERSION_MAJOR_NUM < 55)
   rm.def(
         "find",
-        [](RegexMatcher &self, int64_t start) -> py::bool_ {
+        [](RegexMatcher &self, int64_t start) -> bool {
           ErrorCode error_code;
           auto result = self.find(start, error_code);
           if (error_code.isFailure()) {
@@ -189,17 +294,19 @@ void init_regex(py::module &m) {
           }
           return result;
         },
-        py::arg("start"))
+        py::call_guard<py::gil_scoped_release>(), py::arg("start"))
 #if (U_ICU_VERSION_MAJOR_NUM >= 55)
-      .def("find",
-           [](RegexMatcher &self) -> py::bool_ {
-             ErrorCode error_code;
-             auto result = self.find(error_code);
-             if (error_code.isFailure()) {
-               throw icupy::ICUError(error_code);
-             }
-             return result;
-           })
+      .def(
+          "find",
+          [](RegexMatcher &self) -> bool {
+            ErrorCode error_code;
+            auto result = self.find(error_code);
+            if (error_code.isFailure()) {
+              throw icupy::ICUError(error_code);
+            }
+            return result;
+          },
+          py::call_guard<py::gil_scoped_release>())
 #endif // (U_ICU_VERSION_MAJOR_NUM >= 55)
       ;
 
@@ -343,7 +450,7 @@ void init_regex(py::module &m) {
 
   rm.def(
         "looking_at",
-        [](RegexMatcher &self, int64_t start_index) -> py::bool_ {
+        [](RegexMatcher &self, int64_t start_index) -> bool {
           ErrorCode error_code;
           auto result = self.lookingAt(start_index, error_code);
           if (error_code.isFailure()) {
@@ -351,19 +458,22 @@ void init_regex(py::module &m) {
           }
           return result;
         },
-        py::arg("start_index"))
-      .def("looking_at", [](RegexMatcher &self) -> py::bool_ {
-        ErrorCode error_code;
-        auto result = self.lookingAt(error_code);
-        if (error_code.isFailure()) {
-          throw icupy::ICUError(error_code);
-        }
-        return result;
-      });
+        py::call_guard<py::gil_scoped_release>(), py::arg("start_index"))
+      .def(
+          "looking_at",
+          [](RegexMatcher &self) -> bool {
+            ErrorCode error_code;
+            auto result = self.lookingAt(error_code);
+            if (error_code.isFailure()) {
+              throw icupy::ICUError(error_code);
+            }
+            return result;
+          },
+          py::call_guard<py::gil_scoped_release>());
 
   rm.def(
         "matches",
-        [](RegexMatcher &self, int64_t start_index) -> py::bool_ {
+        [](RegexMatcher &self, int64_t start_index) -> bool {
           ErrorCode error_code;
           auto result = self.matches(start_index, error_code);
           if (error_code.isFailure()) {
@@ -371,15 +481,18 @@ void init_regex(py::module &m) {
           }
           return result;
         },
-        py::arg("start_index"))
-      .def("matches", [](RegexMatcher &self) -> py::bool_ {
-        ErrorCode error_code;
-        auto result = self.matches(error_code);
-        if (error_code.isFailure()) {
-          throw icupy::ICUError(error_code);
-        }
-        return result;
-      });
+        py::call_guard<py::gil_scoped_release>(), py::arg("start_index"))
+      .def(
+          "matches",
+          [](RegexMatcher &self) -> bool {
+            ErrorCode error_code;
+            auto result = self.matches(error_code);
+            if (error_code.isFailure()) {
+              throw icupy::ICUError(error_code);
+            }
+            return result;
+          },
+          py::call_guard<py::gil_scoped_release>());
 
   rm.def("pattern", &RegexMatcher::pattern);
 
@@ -432,7 +545,7 @@ void init_regex(py::module &m) {
           }
           return result;
         },
-        py::arg("replacement"))
+        py::call_guard<py::gil_scoped_release>(), py::arg("replacement"))
       .def(
           "replace_all",
           [](RegexMatcher &self, icupy::UTextPtr &replacement,
@@ -445,7 +558,8 @@ void init_regex(py::module &m) {
             }
             return std::make_unique<icupy::UTextPtr>(p);
           },
-          py::arg("replacement"), py::arg("dest"));
+          py::call_guard<py::gil_scoped_release>(), py::arg("replacement"),
+          py::arg("dest"));
 
   rm.def(
         "replace_first",
@@ -458,7 +572,7 @@ void init_regex(py::module &m) {
           }
           return result;
         },
-        py::arg("replacement"))
+        py::call_guard<py::gil_scoped_release>(), py::arg("replacement"))
       .def(
           "replace_first",
           [](RegexMatcher &self, icupy::UTextPtr &replacement,
@@ -471,7 +585,8 @@ void init_regex(py::module &m) {
             }
             return std::make_unique<icupy::UTextPtr>(p);
           },
-          py::arg("replacement"), py::arg("dest"));
+          py::call_guard<py::gil_scoped_release>(), py::arg("replacement"),
+          py::arg("dest"));
 
   rm.def("require_end", [](const RegexMatcher &self) -> py::bool_ {
     return self.requireEnd();
@@ -849,6 +964,190 @@ void init_regex(py::module &m) {
           py::arg("group_name"));
 #endif // (U_ICU_VERSION_MAJOR_NUM >= 55)
 
+  rp.def(
+      "finditer_offsets",
+      [](const RegexPattern &self, const icupy::UnicodeStringVariant &text) {
+        std::vector<int32_t> offsets;
+        {
+          py::gil_scoped_release release;
+          auto matcher = icupy::new_matcher(self);
+          matcher->reset(icupy::to_unistr(text));
+          const auto group_count = matcher->groupCount();
+          ErrorCode error_code;
+          while (icupy::find_next(*matcher)) {
+            for (int32_t group = 0; group <= group_count; ++group) {
+              offsets.push_back(matcher->start(group, error_code));
+              offsets.push_back(matcher->end(group, error_code));
+            }
+            if (error_code.isFailure()) {
+              throw icupy::ICUError(error_code);
+            }
+          }
+        }
+        return icupy::to_pyarray("i", offsets);
+      },
+      py::arg("text"), R"doc(
+      Find all matches in *text* and return their offsets as a flat
+      ``array.array('i')``.
+
+      Each match takes ``2 * (group_count + 1)`` items: the start and end of
+      the match, followed by the start and end of each capturing group, or
+      -1 if the group did not participate in the match. Offsets are in
+      UTF-16 code units.
+
+      .. rubric:: Example
+
+      .. code-block:: python
+
+         >>> from icupy import icu
+         >>> pattern = icu.RegexPattern.compile(r"(\w)(\d)?", 0)
+         >>> pattern.finditer_offsets("a1 b")
+         array('i', [0, 2, 0, 1, 1, 2, 3, 4, 3, 4, -1, -1])
+      )doc");
+
+  rp.def(
+      "scan_file",
+      [](const RegexPattern &self, const py::object &path_or_buffer,
+         int64_t chunk_hint) {
+        if (chunk_hint < 1) {
+          throw py::value_error("chunk_hint must be greater than 0");
+        }
+        auto text =
+            PyObject_CheckBuffer(path_or_buffer.ptr())
+                ? icupy::open_utf8_buffer(
+                      nullptr,
+                      py::reinterpret_borrow<py::buffer>(path_or_buffer))
+                : icupy::open_utf8_file(path_or_buffer);
+        return std::make_unique<icupy::RegexScanner>(
+            self, std::move(text), static_cast<std::size_t>(chunk_hint));
+      },
+      py::keep_alive<0, 1>(), py::arg("path_or_buffer"), py::kw_only(),
+      py::arg("chunk_hint") = 4096, R"doc(
+      Return an iterator that finds all matches in the UTF-8 text of a file
+      or a buffer, and yields their spans in batches.
+
+      *path_or_buffer* is either a path of a file, which is mapped into
+      memory read-only, or an object that supports the buffer protocol with
+      1-byte items, such as ``bytes`` or :class:`mmap.mmap`. The text is
+      matched in place through a :class:`UText`, so memory use does not
+      depend on the size of the text.
+
+      Each batch is a flat ``array.array('q')`` of up to *chunk_hint*
+      (start, end) pairs in bytes. The matches are found with the GIL
+      released. If matching fails, e.g., because of the time limit, the
+      matches found before the failure are yielded first, and the error is
+      raised by the next call to :func:`next`. The iterator cannot be
+      advanced from another thread while it is finding matches; that raises
+      :class:`ValueError`.
+
+      .. rubric:: Example
+
+      .. code-block:: python
+
+         from icupy import icu
+         pattern = icu.RegexPattern.compile(r"\bERROR\b.*$", icu.URegexpFlag.UREGEX_MULTILINE)
+         with open("app.log", "rb") as f:
+             for spans in pattern.scan_file("app.log"):
+                 for start, end in zip(spans[::2], spans[1::2]):
+                     f.seek(start)
+                     print(f.read(end - start).decode())
+      )doc");
+
+  rp.def(
+      "search_many",
+      [](const RegexPattern &self,
+         const std::vector<icupy::UnicodeStringVariant> &strings,
+         const std::optional<int> &workers) {
+        if (workers && *workers < 1) {
+          throw py::value_error("workers must be greater than 0");
+        }
+        const auto size = strings.size();
+        std::vector<int32_t> offsets(size * 2, -1);
+        {
+          py::gil_scoped_release release;
+          const auto num_workers = icupy::num_workers(
+              size, workers ? static_cast<std::size_t>(*workers) : 0);
+          icupy::parallel_for(
+              size, num_workers,
+              [&](std::size_t, std::size_t begin, std::size_t end) {
+                auto matcher = icupy::new_matcher(self);
+                ErrorCode error_code;
+                for (auto i = begin; i < end; ++i) {
+                  matcher->reset(icupy::to_unistr(strings[i]));
+                  if (icupy::find_next(*matcher)) {
+                    offsets[i * 2] = matcher->start(error_code);
+                    offsets[i * 2 + 1] = matcher->end(error_code);
+                  }
+                }
+                if (error_code.isFailure()) {
+                  throw icupy::ICUError(error_code);
+                }
+              });
+        }
+        return icupy::to_pyarray("i", offsets);
+      },
+      py::arg("strings"), py::kw_only(), py::arg("workers") = std::nullopt,
+      R"doc(
+      Search each string in *strings* for the first match and return the
+      offsets as a flat ``array.array('i')``.
+
+      The start and end of the match in the i-th string are stored at
+      indices ``2 * i`` and ``2 * i + 1``, or -1 if there is no match.
+      Offsets are in UTF-16 code units.
+
+      The work is split across *workers* threads with the GIL released; each
+      thread reuses one :class:`RegexMatcher`. If *workers* is ``None``, the
+      number of processors is used.
+      )doc");
+
+  rp.def(
+      "sub_many",
+      [](const RegexPattern &self,
+         const std::vector<icupy::UnicodeStringVariant> &strings,
+         const icupy::UnicodeStringVariant &replacement,
+         const std::optional<int> &workers) {
+        if (workers && *workers < 1) {
+          throw py::value_error("workers must be greater than 0");
+        }
+        const auto size = strings.size();
+        std::vector<UnicodeString> results(size);
+        {
+          py::gil_scoped_release release;
+          const auto &repl = icupy::to_unistr(replacement);
+          const auto num_workers = icupy::num_workers(
+              size, workers ? static_cast<std::size_t>(*workers) : 0);
+          icupy::parallel_for(
+              size, num_workers,
+              [&](std::size_t, std::size_t begin, std::size_t end) {
+                auto matcher = icupy::new_matcher(self);
+                ErrorCode error_code;
+                for (auto i = begin; i < end && error_code.isSuccess(); ++i) {
+                  matcher->reset(icupy::to_unistr(strings[i]));
+                  results[i] = matcher->replaceAll(repl, error_code);
+                }
+                if (error_code.isFailure()) {
+                  throw icupy::ICUError(error_code);
+                }
+              });
+        }
+        py::list result(size);
+        for (std::size_t i = 0; i < size; ++i) {
+          result[i] = icupy::to_pystr(results[i]);
+        }
+        return result;
+      },
+      py::arg("strings"), py::arg("replacement"), py::kw_only(),
+      py::arg("workers") = std::nullopt, R"doc(
+      Replace every match in each string in *strings* with *replacement* and
+      return a list of ``str``.
+
+      *replacement* may contain references to capture groups as described in
+      :meth:`RegexMatcher.replace_all`. The work is split across *workers*
+      threads with the GIL released; each thread reuses one
+      :class:`RegexMatcher`. If *workers* is ``None``, the number of
+      processors is used.
+      )doc");
+
   rp.def(
         "matcher",
         [](const RegexPattern &self, const UnicodeString &input) {
@@ -941,4 +1240,16 @@ void init_regex(py::module &m) {
             return result;
           },
           py::arg("input"), py::arg("dest"), py::arg("dest_capacity") = -1);
+
+  //
+  // class icupy::RegexScanner
+  //
+  py::class_<icupy::RegexScanner>(m, "RegexScanner", R"doc(
+      Iterator returned by :meth:`RegexPattern.scan_file`.
+      )doc")
+      .def("__iter__",
+           [](icupy::RegexScanner &self) -> icupy::RegexScanner & {
+             return self;
+           })
+      .def("__next__", &icupy::RegexScanner::next);
 }
@@ -158,8 +158,9 @@ Enum returned by :meth:`Collator.compare` method.
             }
             return result;
           },
-          py::arg("source"), py::arg("source_length"), py::arg("target"),
-          py::arg("target_length"), R"doc(
+          py::call_guard<py::gil_scoped_release>(), py::arg("source"),
+          py::arg("source_length"), py::arg("target"), py::arg("target_length"),
+          R"doc(
       Return :attr:`~UCollationResult.UCOL_LESS` if *source* < *target*
       (up to the specified length),
       :attr:`~UCollationResult.UCOL_GREATER` if *source* > *target*
@@ -180,7 +181,8 @@ Enum returned by :meth:`Collator.compare` method.
             }
             return result;
           },
-          py::arg("source"), py::arg("target"), py::arg("length"), R"doc(
+          py::call_guard<py::gil_scoped_release>(), py::arg("source"),
+          py::arg("target"), py::arg("length"), R"doc(
       Return :attr:`~UCollationResult.UCOL_LESS` if *source* < *target*
       (up to the specified length),
       :attr:`~UCollationResult.UCOL_GREATER` if *source* > *target*
@@ -200,7 +202,8 @@ Enum returned by :meth:`Collator.compare` method.
             }
             return result;
           },
-          py::arg("source"), py::arg("target"), R"doc(
+          py::call_guard<py::gil_scoped_release>(), py::arg("source"),
+          py::arg("target"), R"doc(
       Return :attr:`~UCollationResult.UCOL_LESS` if *source* < *target*,
       :attr:`~UCollationResult.UCOL_GREATER` if *source* > *target*, and
       :attr:`~UCollationResult.UCOL_EQUAL` otherwise.
@@ -285,10 +288,11 @@ Enum returned by :meth:`Collator.compare` method.
   coll.def(
       "equals",
       [](const Collator &self, const icupy::UnicodeStringVariant &source,
-         const icupy::UnicodeStringVariant &target) -> py::bool_ {
+         const icupy::UnicodeStringVariant &target) -> bool {
         return self.equals(icupy::to_unistr(source), icupy::to_unistr(target));
       },
-      py::arg("source"), py::arg("target"), R"doc(
+      py::call_guard<py::gil_scoped_release>(), py::arg("source"),
+      py::arg("target"), R"doc(
       Return ``True`` if the strings are equal according to the collation
       rules. ``False`` otherwise.
       )doc");
@@ -370,7 +374,8 @@ Enum returned by :meth:`Collator.compare` method.
             }
             return result;
           },
-          py::arg("source"), py::arg("source_length"), py::arg("key"), R"doc(
+          py::call_guard<py::gil_scoped_release>(), py::arg("source"),
+          py::arg("source_length"), py::arg("key"), R"doc(
       Transform the string (up to the specified length) into a series of
       characters that can be compared with :meth:`CollationKey.compare_to`,
       store it in *key*, and return *key* itself.
@@ -387,7 +392,8 @@ Enum returned by :meth:`Collator.compare` method.
             }
             return result;
           },
-          py::arg("source"), py::arg("key"), R"doc(
+          py::call_guard<py::gil_scoped_release>(), py::arg("source"),
+          py::arg("key"), R"doc(
       Transform the string into a series of characters that can be compared
       with :meth:`CollationKey.compare_to`, store it in *key*, and return *key*
       itself.
@@ -558,11 +564,16 @@ Enum returned by :meth:`Collator.compare` method.
           [](const Collator &self, const std::u16string &source,
              int32_t source_length) {
             auto source_data = source.data();
-            const auto result_length =
-                self.getSortKey(source_data, source_length, nullptr, 0);
-            std::vector<uint8_t> result(result_length, 0);
-            self.getSortKey(source_data, source_length, result.data(),
-                            result_length);
+            std::vector<uint8_t> result;
+            int32_t result_length;
+            {
+              py::gil_scoped_release release;
+              result_length =
+                  self.getSortKey(source_data, source_length, nullptr, 0);
+              result.resize(result_length);
+              self.getSortKey(source_data, source_length, result.data(),
+                              result_length);
+            }
             return py::bytes(reinterpret_cast<char *>(result.data()),
                              result_length);
           },
@@ -573,10 +584,14 @@ Enum returned by :meth:`Collator.compare` method.
           "get_sort_key",
           [](const Collator &self, const icupy::UnicodeStringVariant &source) {
             const auto source_value = icupy::to_unistr(source);
-            const auto result_length =
-                self.getSortKey(source_value, nullptr, 0);
-            std::vector<uint8_t> result(result_length, 0);
-            self.getSortKey(source_value, result.data(), result_length);
+            std::vector<uint8_t> result;
+            int32_t result_length;
+            {
+              py::gil_scoped_release release;
+              result_length = self.getSortKey(source_value, nullptr, 0);
+              result.resize(result_length);
+              self.getSortKey(source_value, result.data(), result_length);
+            }
             return py::bytes(reinterpret_cast<char *>(result.data()),
                              result_length);
           },
@@ -589,6 +604,67 @@ Enum returned by :meth:`Collator.compare` method.
          :py:func:`sorted` or :py:meth:`list.sort`.
       )doc");
 
+  coll.def(
+      "get_sort_keys",
+      [](const Collator &self, const py::iterable &iterable) {
+        if (py::isinstance<py::str>(iterable)) {
+          throw py::type_error("expected an iterable of strings, got str");
+        }
+        std::vector<UnicodeString> sources;
+        if (PySequence_Check(iterable.ptr())) {
+          sources.reserve(py::len(iterable));
+        }
+        for (auto item : iterable) {
+          try {
+            sources.push_back(
+                icupy::to_unistr(item.cast<icupy::UnicodeStringVariant>()));
+          } catch (const py::cast_error &) {
+            throw py::type_error(
+                "expected str or UnicodeString, got " +
+                py::str(py::type::handle_of(item).attr("__name__"))
+                    .cast<std::string>());
+          }
+        }
+        std::vector<uint8_t> buffer;
+        std::vector<std::size_t> offsets(sources.size() + 1, 0);
+        {
+          py::gil_scoped_release release;
+          std::size_t offset = 0;
+          for (std::size_t i = 0; i < sources.size(); ++i) {
+            const auto &source = sources[i];
+            auto capacity = static_cast<int32_t>(std::max<std::size_t>(
+                buffer.size() - offset, source.length() * 4 + 16));
+            buffer.resize(offset + capacity);
+            auto length =
+                self.getSortKey(source, buffer.data() + offset, capacity);
+            if (length > capacity) {
+              buffer.resize(offset + length);
+              self.getSortKey(source, buffer.data() + offset, length);
+            }
+            offset += length;
+            offsets[i + 1] = offset;
+          }
+        }
+        py::list result(sources.size());
+        for (std::size_t i = 0; i < sources.size(); ++i) {
+          result[i] = py::bytes(
+              reinterpret_cast<const char *>(buffer.data() + offsets[i]),
+              offsets[i + 1] - offsets[i]);
+        }
+        return result;
+      },
+      py::arg("iterable"), R"doc(
+      Return a list of sort keys as ``bytes`` from the strings in *iterable*.
+
+      This is equivalent to calling :meth:`.get_sort_key` for each string,
+      but all the sort keys are computed in a single call with the GIL
+      released.
+
+      .. seealso::
+
+         :meth:`.get_sort_key`
+      )doc");
+
   coll.def(
       "get_tailored_set",
       [](const Collator &self) {
@@ -1,4 +1,6 @@
 #include "main.hpp"
+#include "parallel.hpp"
+#include <memory>
 #include <optional>
 #include <pybind11/stl.h>
 #include <unicode/translit.h>
@@ -45,6 +47,87 @@ public:
 
 UOBJECT_DEFINE_RTTI_IMPLEMENTATION(PyTransliterator);
 
+namespace icupy {
+
+//
+// icupy::TransliteratorStream
+//
+class TransliteratorStream {
+public:
+  TransliteratorStream(const Transliterator &transliterator,
+                       const py::iterable &chunks)
+      : transliterator_(transliterator), chunks_(py::iter(chunks)) {}
+
+  py::str next() {
+    while (true) {
+      const auto end = finished_ ? text_.length() : pos_.start;
+      if (emitted_ < end) {
+        auto result = to_pystr(text_.tempSubStringBetween(emitted_, end));
+        emitted_ = end;
+        return result;
+      }
+      if (finished_) {
+        throw py::stop_iteration();
+      }
+      auto item = py::reinterpret_steal<py::object>(PyIter_Next(chunks_.ptr()));
+      if (!item) {
+        if (PyErr_Occurred()) {
+          throw py::error_already_set();
+        }
+        finish();
+        continue;
+      }
+      UnicodeStringVariant chunk;
+      try {
+        chunk = item.cast<UnicodeStringVariant>();
+      } catch (const py::cast_error &) {
+        throw py::type_error("expected str or UnicodeString, got " +
+                             py::str(py::type::handle_of(item).attr("__name__"))
+                                 .cast<std::string>());
+      }
+      py::gil_scoped_release release;
+      feed(to_unistr(chunk));
+    }
+  }
+
+private:
+  void feed(const UnicodeString &chunk) {
+    // Drop the text that has already been emitted and is before the context
+    // start. getMaximumContextLength() is 0 for compound transliterators,
+    // such as Any-Latin, although their rules look back at the text, so the
+    // context that ICU maintains in pos_ is kept intact.
+    const auto cut = std::min(emitted_, pos_.contextStart);
+    if (cut > 0) {
+      text_.remove(0, cut);
+      pos_.contextStart -= cut;
+      pos_.start -= cut;
+      pos_.limit -= cut;
+      pos_.contextLimit -= cut;
+      emitted_ -= cut;
+    }
+    ErrorCode error_code;
+    transliterator_.transliterate(text_, pos_, chunk, error_code);
+    if (error_code.isFailure()) {
+      throw ICUError(error_code);
+    }
+  }
+
+  void finish() {
+    py::gil_scoped_release release;
+    transliterator_.finishTransliteration(text_, pos_);
+    finished_ = true;
+  }
+
+  const Transliterator &transliterator_;
+  py::iterator chunks_;
+  UnicodeString text_;
+  UTransPosition pos_{0, 0, 0, 0};
+  int32_t emitted_ = 0;
+  bool finished_ = false;
+};
+
+} // namespace icupy
+
 void init_translit(py::module &m) {
   //
   // class icu::Transliterator
@@ -428,7 +511,8 @@ void init_translit(py::module &m) {
       )doc");
 
   tl.def("finish_transliteration", &Transliterator::finishTransliteration,
-         py::arg("text"), py::arg("index"), R"doc(
+         py::call_guard<py::gil_scoped_release>(), py::arg("text"),
+         py::arg("index"), R"doc(
       Finish any pending transliterations that were waiting for more
       characters.
 
@@ -719,6 +803,94 @@ void init_translit(py::module &m) {
   // FIXME: Implement "static void registerFactory(const UnicodeString &id,
   //  Factory factory, Token context)".
 
+  tl.def(
+      "transliterate_many",
+      [](const Transliterator &self,
+         const std::vector<icupy::UnicodeStringVariant> &strings,
+         const std::optional<int> &workers) {
+        if (workers && *workers < 1) {
+          throw py::value_error("workers must be greater than 0");
+        }
+        const auto size = strings.size();
+        if (dynamic_cast<const PyTransliterator *>(&self) != nullptr) {
+          // A transliterator implemented in Python cannot be cloned, and its
+          // methods need Python objects of the text.
+          py::list result(size);
+          for (std::size_t i = 0; i < size; ++i) {
+            auto text = py::cast(UnicodeString(icupy::to_unistr(strings[i])));
+            self.transliterate(text.cast<UnicodeString &>());
+            result[i] = icupy::to_pystr(text.cast<const UnicodeString &>());
+          }
+          return result;
+        }
+        std::vector<UnicodeString> results(size);
+        {
+          py::gil_scoped_release release;
+          const auto num_workers = icupy::num_workers(
+              size, workers ? static_cast<std::size_t>(*workers) : 0, 64);
+          icupy::parallel_for(
+              size, num_workers,
+              [&](std::size_t n, std::size_t begin, std::size_t end) {
+                std::unique_ptr<Transliterator> clone;
+                if (n > 0) {
+                  clone.reset(self.clone());
+                  if (!clone) {
+                    throw icupy::ICUError(U_MEMORY_ALLOCATION_ERROR);
+                  }
+                }
+                const auto &trans = clone ? *clone : self;
+                for (auto i = begin; i < end; ++i) {
+                  results[i] = icupy::to_unistr(strings[i]);
+                  trans.transliterate(results[i]);
+                }
+              });
+        }
+        py::list result(size);
+        for (std::size_t i = 0; i < size; ++i) {
+          result[i] = icupy::to_pystr(results[i]);
+        }
+        return result;
+      },
+      py::arg("strings"), py::kw_only(), py::arg("workers") = std::nullopt,
+      R"doc(
+      Transliterate each string in *strings* and return a list of ``str``.
+
+      The work is split across *workers* threads with the GIL released; each
+      thread uses its own clone of this transliterator. If *workers* is
+      ``None``, the number of processors is used.
+      )doc");
+
+  tl.def(
+      "stream",
+      [](const Transliterator &self, const py::iterable &chunks) {
+        return icupy::TransliteratorStream(self, chunks);
+      },
+      py::keep_alive<0, 1>(), py::arg("chunks"), R"doc(
+      Return an iterator that transliterates the text given as an iterable of
+      chunks (``str`` or :class:`UnicodeString`) and yields the transliterated
+      text as ``str``.
+
+      The chunks are passed to the incremental :meth:`.transliterate` and the
+      text is yielded as soon as it is finalized, so a rule that spans chunk
+      boundaries is applied correctly and the result is the same as that of
+      transliterating the whole text at once. Since a rule may look back at
+      any of the preceding text, the yielded text is kept as context; only
+      the text before the context start of the transliteration position is
+      dropped.
+
+      .. rubric:: Example
+
+      .. code-block:: python
+
+         from icupy import icu
+         trans = icu.Transliterator.create_instance(
+             "Any-Latin", icu.UTransDirection.UTRANS_FORWARD
+         )
+         with open("input.txt", encoding="utf-8") as f:
+             for text in trans.stream(iter(lambda: f.read(65536), "")):
+                 print(text, end="")
+      )doc");
+
   // TODO: Deprecate Transliterator.register_instance().
   tl.def_static(
       "register_instance",
@@ -781,13 +953,14 @@ void init_translit(py::module &m) {
   tl.def("transliterate",
          py::overload_cast<Replaceable &>(&Transliterator::transliterate,
                                           py::const_),
-         py::arg("text"), R"doc(
+         py::call_guard<py::gil_scoped_release>(), py::arg("text"), R"doc(
       Transliterate the entire text.
       )doc")
       .def("transliterate",
            py::overload_cast<Replaceable &, int32_t, int32_t>(
                &Transliterator::transliterate, py::const_),
-           py::arg("text"), py::arg("start"), py::arg("limit"), R"doc(
+           py::call_guard<py::gil_scoped_release>(), py::arg("text"),
+           py::arg("start"), py::arg("limit"), R"doc(
       Transliterate a portion of the text [*start*, *limit*), and return the
       new ending index.
       )doc")
@@ -803,7 +976,8 @@ void init_translit(py::module &m) {
               throw icupy::ICUError(error_code);
             }
           },
-          py::arg("text"), py::arg("index"), py::arg("insertion"), R"doc(
+          py::call_guard<py::gil_scoped_release>(), py::arg("text"),
+          py::arg("index"), py::arg("insertion"), R"doc(
       Transliterate the portion of the text buffer that can be unambiguously
       transliterated, where new text has been inserted via keyboard event for
       example.
@@ -839,7 +1013,8 @@ void init_translit(py::module &m) {
               throw icupy::ICUError(error_code);
             }
           },
-          py::arg("text"), py::arg("index"), py::arg("insertion"), R"doc(
+          py::call_guard<py::gil_scoped_release>(), py::arg("text"),
+          py::arg("index"), py::arg("insertion"), R"doc(
       Transliterate the portion of the text buffer that can be unambiguously
       transliterated, where a new character has been inserted via keyboard
       event for example.
@@ -854,7 +1029,8 @@ void init_translit(py::module &m) {
               throw icupy::ICUError(error_code);
             }
           },
-          py::arg("text"), py::arg("index"), R"doc(
+          py::call_guard<py::gil_scoped_release>(), py::arg("text"),
+          py::arg("index"), R"doc(
       Transliterate the portion of the text buffer that can be unambiguously
       transliterated.
       )doc");
@@ -871,4 +1047,15 @@ void init_translit(py::module &m) {
       .. version-deprecated:: 0.24
          Do not use this method. It may be removed in a future release.
       )doc");
+
+  //
+  // class icupy::TransliteratorStream
+  //
+  py::class_<icupy::TransliteratorStream>(m, "TransliteratorStream", R"doc(
+      Iterator returned by :meth:`Transliterator.stream`.
+      )doc")
+      .def("__iter__",
+           [](icupy::TransliteratorStream &self)
+               -> icupy::TransliteratorStream & { return self; })
+      .def("__next__", &icupy::TransliteratorStream::next);
 }
@@ -44,6 +44,7 @@ UCharDirection UBiDiClassCallbackPtr::callback(const void *native_context,
   if (native_context == nullptr) {
     throw std::runtime_error("UBiDiClassCallback: context is not set");
   }
+  py::gil_scoped_acquire gil;
   auto pair = reinterpret_cast<ClassCallbackAndContextPair *>(
       const_cast<void *>(native_context));
   auto &action = pair->first;
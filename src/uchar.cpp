@@ -13,6 +13,25 @@
 
 using namespace icu;
 
+namespace icupy {
+
+// Return a new array.array of *typecode* that contains the results of *fn*
+// for the code points in *values*, computed with the GIL released.
+template <typename T, typename Function>
+py::object map_code_points(const char *typecode, const py::handle &values,
+                           Function fn) {
+  const auto code_points = to_code_points(values);
+  std::vector<T> result(code_points.size());
+  {
+    py::gil_scoped_release release;
+    std::transform(code_points.begin(), code_points.end(), result.begin(),
+                   [&](UChar32 c) { return static_cast<T>(fn(c)); });
+  }
+  return to_pyarray(typecode, result);
+}
+
+} // namespace icupy
+
 void init_uchar(py::module &m) {
 #if (U_ICU_VERSION_MAJOR_NUM >= 52)
   //
@@ -2327,6 +2346,17 @@ status tags.)
       "u_get_gc_mask", [](UChar32 c) { return U_GET_GC_MASK(c); },
       py::arg("c"));
 
+  m.def(
+      "u_get_gc_mask_many",
+      [](const py::object &values) {
+        return icupy::map_code_points<uint32_t>(
+            "I", values, [](UChar32 c) { return U_GET_GC_MASK(c); });
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('I')`` of :func:`u_get_gc_mask` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
   m.def("u_mask", [](UChar32 c) { return U_MASK(c); }, py::arg("c"));
 
   m.def(
@@ -2347,8 +2377,30 @@ status tags.)
 
   m.def("u_char_digit_value", &u_charDigitValue, py::arg("c"));
 
+  m.def(
+      "u_char_digit_value_many",
+      [](const py::object &values) {
+        return icupy::map_code_points<int32_t>(
+            "i", values, [](UChar32 c) { return u_charDigitValue(c); });
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('i')`` of :func:`u_char_digit_value` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
   m.def("u_char_direction", &u_charDirection, py::arg("c"));
 
+  m.def(
+      "u_char_direction_many",
+      [](const py::object &values) {
+        return icupy::map_code_points<int8_t>(
+            "b", values, [](UChar32 c) { return u_charDirection(c); });
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('b')`` of :func:`u_char_direction` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
   m.def(
       "u_char_from_name",
       [](UCharNameChoice name_choice, const std::string &name) {
@@ -2382,6 +2434,23 @@ status tags.)
 
   m.def("u_char_type", &u_charType, py::arg("c"));
 
+  m.def(
+      "u_char_type_many",
+      [](const py::object &values) {
+        return icupy::map_code_points<int8_t>(
+            "b", values, [](UChar32 c) { return u_charType(c); });
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('b')`` of :func:`u_char_type` for the code
+      points in *values*.
+
+      This and the other ``*_many`` functions of this module accept as
+      *values* a ``str``, an iterable of ``int``, or an object that supports
+      the buffer protocol with integer items, such as ``array.array('I')`` or
+      a one-dimensional NumPy array. A buffer of floating-point numbers raises
+      :class:`TypeError`.
+      )doc");
+
   m.def("u_digit", &u_digit, py::arg("ch"), py::arg("radix"));
 
   m.def("u_fold_case", &u_foldCase, py::arg("c"), py::arg("options"));
@@ -2408,6 +2477,17 @@ status tags.)
 
   m.def("u_get_combining_class", &u_getCombiningClass, py::arg("c"));
 
+  m.def(
+      "u_get_combining_class_many",
+      [](const py::object &values) {
+        return icupy::map_code_points<uint8_t>(
+            "B", values, [](UChar32 c) { return u_getCombiningClass(c); });
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('B')`` of :func:`u_get_combining_class` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
   m.def(
       "u_get_fc_nfkc_closure",
       [](UChar32 c) {
@@ -2482,8 +2562,31 @@ status tags.)
   m.def("u_get_int_property_value", &u_getIntPropertyValue, py::arg("c"),
         py::arg("which"));
 
+  m.def(
+      "u_get_int_property_value_many",
+      [](const py::object &values, UProperty which) {
+        return icupy::map_code_points<int32_t>("i", values, [which](UChar32 c) {
+          return u_getIntPropertyValue(c, which);
+        });
+      },
+      py::arg("values"), py::arg("which"), R"doc(
+      Return an ``array.array('i')`` of :func:`u_get_int_property_value` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
   m.def("u_get_numeric_value", &u_getNumericValue, py::arg("c"));
 
+  m.def(
+      "u_get_numeric_value_many",
+      [](const py::object &values) {
+        return icupy::map_code_points<double>(
+            "d", values, [](UChar32 c) { return u_getNumericValue(c); });
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('d')`` of :func:`u_get_numeric_value` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
   m.def("u_get_property_enum", &u_getPropertyEnum, py::arg("alias"));
 
   m.def("u_get_property_name", &u_getPropertyName, py::arg("property"),
@@ -2513,6 +2616,18 @@ status tags.)
       },
       py::arg("c"), py::arg("which"));
 
+  m.def(
+      "u_has_binary_property_many",
+      [](const py::object &values, UProperty which) {
+        return icupy::map_code_points<uint8_t>("B", values, [which](UChar32 c) {
+          return u_hasBinaryProperty(c, which) ? 1 : 0;
+        });
+      },
+      py::arg("values"), py::arg("which"), R"doc(
+      Return an ``array.array('B')`` of :func:`u_has_binary_property` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
 #if (U_ICU_VERSION_MAJOR_NUM >= 75)
   m.def("u_has_id_type", &u_hasIDType, py::arg("c"), py::arg("type"));
 #endif // (U_ICU_VERSION_MAJOR_NUM >= 75)
@@ -2641,12 +2756,56 @@ status tags.)
 
   m.def("u_tolower", &u_tolower, py::arg("c"));
 
+  m.def(
+      "u_tolower_many",
+      [](const py::object &values) {
+        return icupy::map_code_points<UChar32>(
+            "i", values, [](UChar32 c) { return u_tolower(c); });
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('i')`` of :func:`u_tolower` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
   m.def("u_totitle", &u_totitle, py::arg("c"));
 
+  m.def(
+      "u_totitle_many",
+      [](const py::object &values) {
+        return icupy::map_code_points<UChar32>(
+            "i", values, [](UChar32 c) { return u_totitle(c); });
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('i')`` of :func:`u_totitle` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
   m.def("u_toupper", &u_toupper, py::arg("c"));
 
+  m.def(
+      "u_toupper_many",
+      [](const py::object &values) {
+        return icupy::map_code_points<UChar32>(
+            "i", values, [](UChar32 c) { return u_toupper(c); });
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('i')`` of :func:`u_toupper` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
   m.def("ublock_get_code", &ublock_getCode, py::arg("c"));
 
+  m.def(
+      "ublock_get_code_many",
+      [](const py::object &values) {
+        return icupy::map_code_points<int32_t>(
+            "i", values, [](UChar32 c) { return ublock_getCode(c); });
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('i')`` of :func:`ublock_get_code` for the
+      code points in *values*, as described in :func:`u_char_type_many`.
+      )doc");
+
   m.attr("U_GC_C_MASK") = U_GC_C_MASK;
   m.attr("U_GC_CC_MASK") = U_GC_CC_MASK;
   m.attr("U_GC_CF_MASK") = U_GC_CF_MASK;
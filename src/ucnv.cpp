@@ -230,6 +230,67 @@ Selectors for Unicode sets that can be returned by
       Free up memory occupied by unused, cached converter shared data.
       )doc");
 
+  m.def(
+      "ucnv_from_u_count_pending",
+      [](const icupy::UConverterPtr &cnv) {
+        ErrorCode error_code;
+        auto result = ucnv_fromUCountPending(cnv, error_code);
+        if (error_code.isFailure()) {
+          throw icupy::ICUError(error_code);
+        }
+        return result;
+      },
+      py::arg("cnv"), R"doc(
+      Return the number of UChars held in the converter's internal state
+      because more input is needed for completing the conversion.
+      )doc");
+
+  m.def(
+      "ucnv_from_unicode",
+      [](icupy::UConverterPtr &converter, const icupy::PyUnicodeString &source,
+         bool flush) {
+        const auto &source_value = source.value;
+        std::string result;
+        {
+          py::gil_scoped_release release;
+          auto source_ptr = source_value.getBuffer();
+          auto source_limit = source_ptr + source_value.length();
+          const auto max_char_size = ucnv_getMaxCharSize(converter);
+          auto capacity = UCNV_GET_MAX_BYTES_FOR_STRING(source_value.length(),
+                                                        max_char_size);
+          std::size_t offset = 0;
+          ErrorCode error_code;
+          do {
+            error_code.reset();
+            result.resize(offset + capacity);
+            auto target = result.data() + offset;
+            ucnv_fromUnicode(converter, &target, result.data() + result.size(),
+                             &source_ptr, source_limit, nullptr, flush,
+                             error_code);
+            offset = target - result.data();
+          } while (error_code.get() == U_BUFFER_OVERFLOW_ERROR);
+          result.resize(offset);
+          if (error_code.isFailure()) {
+            throw icupy::ICUError(error_code);
+          }
+        }
+        return py::bytes(result);
+      },
+      py::arg("converter"), py::arg("source"), py::arg("flush") = true, R"doc(
+      Convert the Unicode string *source* into a codepage string and return it
+      as ``bytes``.
+
+      The conversion state is kept in *converter* between calls, so a long
+      string can be converted in chunks. Set *flush* to ``False`` for every
+      chunk except the last one. If *flush* is ``True``, any pending state is
+      written out and the from-Unicode part of the converter is reset.
+
+      .. seealso::
+
+         :func:`ucnv_reset_from_unicode`
+         :func:`ucnv_to_unicode`
+      )doc");
+
   m.def(
       "ucnv_get_alias",
       [](const std::string &alias, int16_t n) {
@@ -1045,6 +1106,70 @@ Selectors for Unicode sets that can be returned by
          Use :func:`ucnv_set_to_u_call_back` instead.
       )doc");
 
+  m.def(
+      "ucnv_to_u_count_pending",
+      [](const icupy::UConverterPtr &cnv) {
+        ErrorCode error_code;
+        auto result = ucnv_toUCountPending(cnv, error_code);
+        if (error_code.isFailure()) {
+          throw icupy::ICUError(error_code);
+        }
+        return result;
+      },
+      py::arg("cnv"), R"doc(
+      Return the number of chars held in the converter's internal state
+      because more input is needed for completing the conversion.
+      )doc");
+
+  m.def(
+      "ucnv_to_unicode",
+      [](icupy::UConverterPtr &converter, const py::buffer &source,
+         bool flush) {
+        const auto info = icupy::request_buffer(source, 1);
+        std::u16string result;
+        {
+          py::gil_scoped_release release;
+          auto source_ptr = static_cast<const char *>(info->ptr);
+          auto source_limit = source_ptr + info->size;
+          std::size_t capacity = info->size + 32;
+          std::size_t offset = 0;
+          ErrorCode error_code;
+          do {
+            error_code.reset();
+            result.resize(offset + capacity);
+            auto target = result.data() + offset;
+            ucnv_toUnicode(converter, &target, result.data() + result.size(),
+                           &source_ptr, source_limit, nullptr, flush,
+                           error_code);
+            offset = target - result.data();
+          } while (error_code.get() == U_BUFFER_OVERFLOW_ERROR);
+          result.resize(offset);
+          if (error_code.isFailure()) {
+            throw icupy::ICUError(error_code);
+          }
+        }
+        return icupy::u16string_to_pystr(result);
+      },
+      py::arg("converter"), py::arg("source"), py::arg("flush") = true, R"doc(
+      Convert the codepage string *source* into a Unicode string and return it
+      as ``str``.
+
+      *source* must support the buffer protocol with C-contiguous 1-byte
+      items, e.g., ``bytes``, ``bytearray`` or ``memoryview``.
+
+      The conversion state is kept in *converter* between calls, so a long
+      byte stream can be converted in chunks. Set *flush* to ``False`` for
+      every chunk except the last one; an incomplete character sequence at the
+      end of a chunk is kept in *converter* and completed by the next chunk.
+      If *flush* is ``True``, the to-Unicode part of the converter is reset
+      after the conversion.
+
+      .. seealso::
+
+         :func:`ucnv_from_unicode`
+         :func:`ucnv_reset_to_unicode`
+      )doc");
+
   m.def(
       "ucnv_uses_fallback",
       [](const icupy::UConverterPtr &cnv) -> py::bool_ {
@@ -60,6 +60,7 @@ void UConverterFromUCallbackPtr::callback(const void *native_context,
   if (native_context == nullptr) {
     throw std::runtime_error("UConverterFromUCallback: context is not set");
   }
+  py::gil_scoped_acquire gil;
   auto pair = reinterpret_cast<FromUCallbackAndContextPair *>(
       const_cast<void *>(native_context));
   auto &variant = pair->first;
@@ -127,6 +128,7 @@ void UConverterToUCallbackPtr::callback(const void *native_context,
   if (native_context == nullptr) {
     throw std::runtime_error("UConverterToUCallback: context is not set");
   }
+  py::gil_scoped_acquire gil;
   auto pair = reinterpret_cast<ToUCallbackAndContextPair *>(
       const_cast<void *>(native_context));
   auto &variant = pair->first;
@@ -243,6 +245,11 @@ any chained callbacks.
   py::class_<icupy::UConverterPtr>(m, "UConverter", R"doc(
       UConverter structure.
 
+      .. note::
+
+         A ``UConverter`` object keeps the conversion state and is not
+         thread-safe. Open a separate converter for each thread.
+
       .. seealso::
 
          :func:`ucnv_close`
@@ -4,6 +4,7 @@
 #include "context.hpp"
 #include "main.hpp"
 #include <functional>
+#include <string>
 #include <unicode/ucnv.h>
 
 // From icu/source/common/ucnv_bld.h
@@ -13,6 +14,10 @@
 
 namespace icupy {
 
+std::u16string pystr_to_u16string(const py::str &str);
+
+py::str u16string_to_pystr(const std::u16string &str);
+
 // UConverterFromUCallback
 using FromUCallbackArgs = void(py::object &, UConverterFromUnicodeArgs *,
                                const py::str &, int32_t, UChar32,
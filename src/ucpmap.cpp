@@ -23,19 +23,32 @@ const UCPMap *UCPMapPtr::get() const { return p_; }
 //
 uint32_t UCPMapValueFilterPtr::filter(const void *native_context,
                                       uint32_t value) {
-  if (native_context == nullptr) {
-    throw std::runtime_error("UCPMapValueFilter: context is not set");
+  // An exception must not propagate through ucpmap_getRange(), so it is set
+  // as the Python error indicator instead, and the remaining calls of the
+  // range are skipped. The caller checks the indicator after the range.
+  if (PyErr_Occurred()) {
+    return value;
   }
-  auto pair = reinterpret_cast<ValueFilterAndContextPair *>(
-      const_cast<void *>(native_context));
-  auto &action = pair->first;
-  if (!action) {
-    throw std::runtime_error(
-        "UCPMapValueFilter: callback function is not set or invalid");
+  try {
+    if (native_context == nullptr) {
+      throw std::runtime_error("UCPMapValueFilter: context is not set");
+    }
+    auto pair = reinterpret_cast<ValueFilterAndContextPair *>(
+        const_cast<void *>(native_context));
+    auto &action = pair->first;
+    if (!action) {
+      throw std::runtime_error(
+          "UCPMapValueFilter: callback function is not set or invalid");
+    }
+    auto context = pair->second;
+    auto object = context ? context->value() : py::none();
+    return action(object, value);
+  } catch (py::error_already_set &e) {
+    e.restore();
+  } catch (const std::exception &e) {
+    PyErr_SetString(PyExc_RuntimeError, e.what());
   }
-  auto context = pair->second;
-  auto object = context ? context->value() : py::none();
-  return action(object, value);
+  return value;
 }
 
 } // namespace icupy
@@ -104,7 +117,7 @@ should use :attr:`UCPMAP_RANGE_NORMAL`.
   //
   // struct UCPMap
   //
-  py::class_<icupy::UCPMapPtr>(m, "UCPMap", R"doc(
+  py::class_<icupy::UCPMapPtr> ucpmap(m, "UCPMap", R"doc(
       Abstract map from Unicode code points [U+0000, U+10FFFF] to integer values.
 
     .. seealso::
@@ -112,6 +125,101 @@ should use :attr:`UCPMAP_RANGE_NORMAL`.
        :func:`u_get_int_property_map`
     )doc");
 
+  ucpmap.def(
+      "lookup",
+      [](const icupy::UCPMapPtr &self, const py::object &values) {
+        const auto code_points = icupy::to_code_points(values);
+        std::vector<uint32_t> result(code_points.size());
+        {
+          py::gil_scoped_release release;
+          const UCPMap *map = self;
+          std::transform(code_points.begin(), code_points.end(), result.begin(),
+                         [map](UChar32 c) { return ucpmap_get(map, c); });
+        }
+        return icupy::to_pyarray("I", result);
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('I')`` of the property values for the code
+      points in *values*.
+
+      *values* is either a ``str``, an iterable of ``int``, or an object that
+      supports the buffer protocol with integer items, such as
+      ``array.array('I')`` or a one-dimensional NumPy array. The values are
+      looked up in the map's trie with the GIL released.
+
+      .. seealso::
+
+         :func:`ucpmap_get`
+      )doc");
+
+  ucpmap.def(
+      "to_arrays",
+      [](const icupy::UCPMapPtr &self, UCPMapRangeOption option,
+         uint32_t surrogate_value,
+         std::optional<icupy::UCPMapValueFilterPtr> &filter) {
+        UCPMapValueFilter *new_filter = nullptr;
+        const void *new_context = nullptr;
+        if (filter.has_value()) {
+          new_filter = filter->get_native_callback();
+          new_context = filter->context();
+        }
+        std::vector<int32_t> starts, ends;
+        std::vector<uint32_t> values;
+        auto get_ranges = [&]() {
+          UChar32 start = 0;
+          uint32_t value = 0;
+          while (true) {
+            const auto end =
+                ucpmap_getRange(self, start, option, surrogate_value,
+                                new_filter, new_context, &value);
+            if (new_filter != nullptr && PyErr_Occurred()) {
+              throw py::error_already_set();
+            } else if (end < 0) {
+              break;
+            }
+            starts.push_back(start);
+            ends.push_back(end);
+            values.push_back(value);
+            start = end + 1;
+          }
+        };
+        if (new_filter == nullptr) {
+          py::gil_scoped_release release;
+          get_ranges();
+        } else {
+          // The filter calls back into Python.
+          get_ranges();
+        }
+        return py::make_tuple(icupy::to_pyarray("i", starts),
+                              icupy::to_pyarray("i", ends),
+                              icupy::to_pyarray("I", values));
+      },
+      py::arg("option") = UCPMAP_RANGE_NORMAL, py::arg("surrogate_value") = 0,
+      py::arg("filter") = std::nullopt, R"doc(
+      Return all same-value ranges of the map as a tuple of three arrays
+      ``(starts, ends, values)``: ``array.array('i')`` of the first and last
+      code points of the ranges, and ``array.array('I')`` of their values.
+
+      The ranges are sorted, contiguous and cover [U+0000, U+10FFFF]. See
+      :func:`ucpmap_get_range` for *option*, *surrogate_value* and *filter*.
+
+      .. seealso::
+
+         :func:`ucpmap_get_range`
+
+      .. rubric:: Example
+
+      .. code-block:: python
+
+         >>> from icupy import icu
+         >>> ucpmap = icu.u_get_int_property_map(icu.UCHAR_EAST_ASIAN_WIDTH)
+         >>> starts, ends, values = ucpmap.to_arrays()
+         >>> len(starts) == len(ends) == len(values)
+         True
+         >>> starts[0], ends[-1]
+         (0, 1114111)
+      )doc");
+
   //
   // UCPMapValueFilter
   //
@@ -183,6 +291,9 @@ should use :attr:`UCPMAP_RANGE_NORMAL`.
         uint32_t value = 0;
         auto result = ucpmap_getRange(map, start, option, surrogate_value,
                                       new_filter, new_context, &value);
+        if (new_filter != nullptr && PyErr_Occurred()) {
+          throw py::error_already_set();
+        }
         return std::make_tuple(result, value);
       },
       py::arg("ucpmap"), py::arg("start"), py::arg("option"),
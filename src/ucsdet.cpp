@@ -1,6 +1,8 @@
 #include "main.hpp"
+#include "parallel.hpp"
 #include "ucsdetptr.hpp"
 #include "uenumptr.hpp"
+#include <climits>
 #include <optional>
 #include <pybind11/stl.h>
 
@@ -79,7 +81,7 @@ void init_ucsdet(py::module &m) {
         }
         return std::make_unique<icupy::UCharsetMatchPtr>(p);
       },
-      py::arg("ucsd"));
+      py::call_guard<py::gil_scoped_release>(), py::arg("ucsd"));
 
   m.def(
       "ucsdet_detect_all",
@@ -97,7 +99,99 @@ void init_ucsdet(py::module &m) {
         }
         return result;
       },
-      py::arg("ucsd"));
+      py::call_guard<py::gil_scoped_release>(), py::arg("ucsd"));
+
+  m.def(
+      "ucsdet_detect_many",
+      [](const std::vector<py::buffer> &buffers,
+         const std::optional<int> &workers,
+         const std::optional<int64_t> &max_bytes, bool input_filter) {
+        if (workers && *workers < 1) {
+          throw py::value_error("workers must be greater than 0");
+        }
+        if (max_bytes && *max_bytes < 1) {
+          throw py::value_error("max_bytes must be greater than 0");
+        }
+        const auto size = buffers.size();
+        std::vector<std::shared_ptr<py::buffer_info>> infos;
+        infos.reserve(size);
+        for (const auto &buffer : buffers) {
+          infos.push_back(icupy::request_buffer(buffer, 1));
+        }
+        const auto limit =
+            std::min<int64_t>(max_bytes.value_or(INT32_MAX), INT32_MAX);
+        std::vector<
+            std::optional<std::tuple<std::string, int32_t, std::string>>>
+            results(size);
+        {
+          py::gil_scoped_release release;
+          icupy::parallel_for(
+              size,
+              icupy::num_workers(
+                  size, workers ? static_cast<std::size_t>(*workers) : 0, 16),
+              [&](std::size_t, std::size_t begin, std::size_t end) {
+                // Each thread reuses one detector for its documents.
+                ErrorCode error_code;
+                LocalUCharsetDetectorPointer ucsd(ucsdet_open(error_code));
+                if (error_code.isFailure()) {
+                  throw icupy::ICUError(error_code);
+                }
+                ucsdet_enableInputFilter(ucsd.getAlias(), input_filter);
+                for (auto i = begin; i < end; ++i) {
+                  const auto length = static_cast<int32_t>(
+                      std::min<int64_t>(infos[i]->size, limit));
+                  ucsdet_setText(ucsd.getAlias(),
+                                 static_cast<const char *>(infos[i]->ptr),
+                                 length, error_code);
+                  auto match = ucsdet_detect(ucsd.getAlias(), error_code);
+                  if (error_code.isFailure()) {
+                    throw icupy::ICUError(error_code);
+                  } else if (match == nullptr) {
+                    continue;
+                  }
+                  const auto name = ucsdet_getName(match, error_code);
+                  const auto confidence =
+                      ucsdet_getConfidence(match, error_code);
+                  const auto language = ucsdet_getLanguage(match, error_code);
+                  if (error_code.isFailure()) {
+                    throw icupy::ICUError(error_code);
+                  }
+                  results[i].emplace(name, confidence,
+                                     language ? language : "");
+                }
+              });
+        }
+        return results;
+      },
+      py::arg("buffers"), py::kw_only(), py::arg("workers") = std::nullopt,
+      py::arg("max_bytes") = 65536, py::arg("input_filter") = false, R"doc(
+      Detect the charset of each buffer in *buffers* and return a list of
+      tuples ``(name, confidence, language)``, or ``None`` for a buffer
+      whose charset is not detected.
+
+      Each buffer is an object that supports the buffer protocol with 1-byte
+      items, such as ``bytes``, ``memoryview``, or :class:`mmap.mmap`. Only
+      the first *max_bytes* bytes of each buffer are examined, in place
+      without copying them. If *max_bytes* is ``None``, the whole buffer is
+      examined, up to 2 GiB. If *input_filter* is ``True``, markup is
+      filtered out of the input as with :func:`ucsdet_enable_input_filter`.
+
+      The result for a buffer is the same as for its first *max_bytes* bytes
+      alone. The buffer is cut at that byte offset regardless of character
+      boundaries, so a multibyte character split at the end may lower the
+      confidence of multibyte charsets such as UTF-8 or Shift_JIS.
+
+      The buffers are processed in parallel by *workers* threads with the GIL
+      released; each thread uses its own detector. If *workers* is ``None``,
+      the number of processors is used.
+
+      .. seealso::
+
+         :func:`ucsdet_detect`
+         :func:`ucsdet_get_confidence`
+         :func:`ucsdet_get_language`
+         :func:`ucsdet_get_name`
+      )doc");
 
   m.def(
       "ucsdet_enable_input_filter",
@@ -1,5 +1,6 @@
 #include "main.hpp"
 #include "usetptr.hpp"
+#include <climits>
 #include <memory>
 #include <optional>
 #include <pybind11/native_enum.h>
@@ -22,6 +23,48 @@ void init_unifunctor(py::module &m) {
       )doc");
 }
 
+namespace icupy {
+
+// Return the (start, end) pairs of the maximal runs of *length* units in
+// *text* that are spanned by *set* with *condition*. *span(pos, condition)*
+// returns the end of the span of *set* from *pos*.
+template <typename Span>
+std::vector<int64_t> span_runs(int64_t length, USetSpanCondition condition,
+                               Span span) {
+  // The text between the runs is spanned with the opposite condition.
+  const auto opposite = condition == USET_SPAN_NOT_CONTAINED
+                            ? USET_SPAN_SIMPLE
+                            : USET_SPAN_NOT_CONTAINED;
+  std::vector<int64_t> result;
+  int64_t pos = 0;
+  while (pos < length) {
+    const auto end = span(pos, condition);
+    if (end > pos) {
+      result.push_back(pos);
+      result.push_back(end);
+    }
+    const auto next = span(end, opposite);
+    if (next == pos) {
+      break; // No progress; neither condition spans the text at pos.
+    }
+    pos = next;
+  }
+  return result;
+}
+
+// Return *set* if it is frozen, otherwise a frozen copy of it in *copy*.
+const UnicodeSet &frozen(const UnicodeSet &set,
+                         std::unique_ptr<UnicodeSet> &copy) {
+  if (set.isFrozen()) {
+    return set;
+  }
+  copy = std::make_unique<UnicodeSet>(set);
+  copy->freeze();
+  return *copy;
+}
+
+} // namespace icupy
+
 void init_uniset(py::module &m, py::module &h) {
   //
   // enum icu::UMatchDegree
@@ -445,6 +488,29 @@ match.
           },
           py::arg("start"), py::arg("end"));
 
+  us.def(
+      "contains_many",
+      [](const UnicodeSet &self, const py::object &values) {
+        const auto code_points = icupy::to_code_points(values);
+        std::vector<uint8_t> result(code_points.size());
+        {
+          py::gil_scoped_release release;
+          std::transform(code_points.begin(), code_points.end(), result.begin(),
+                         [&](UChar32 c) { return self.contains(c) ? 1 : 0; });
+        }
+        return icupy::to_pyarray("B", result);
+      },
+      py::arg("values"), R"doc(
+      Return an ``array.array('B')`` in which each item is 1 if the
+      corresponding code point in *values* is in this set, or 0 otherwise.
+
+      *values* is either a ``str``, an iterable of ``int``, or an object that
+      supports the buffer protocol with integer items, such as
+      :class:`array.array` or a one-dimensional NumPy array. The result can
+      be viewed as a NumPy boolean mask with
+      ``numpy.frombuffer(result, bool)``.
+      )doc");
+
   us.def(
         "contains_all",
         [](const UnicodeSet &self, const UnicodeSet &c) -> py::bool_ {
@@ -656,6 +722,100 @@ match.
                &UnicodeSet::spanBack, py::const_),
            py::arg("s"), py::arg("limit"), py::arg("span_condition"));
 
+  us.def(
+      "span_runs",
+      [](const UnicodeSet &self, const icupy::UnicodeStringVariant &s,
+         USetSpanCondition span_condition) {
+        std::vector<int64_t> offsets;
+        {
+          py::gil_scoped_release release;
+          std::unique_ptr<UnicodeSet> copy;
+          const auto &set = icupy::frozen(self, copy);
+          const auto &text = icupy::to_unistr(s);
+          offsets = icupy::span_runs(
+              text.length(), span_condition,
+              [&](int64_t pos, USetSpanCondition condition) -> int64_t {
+                return set.span(text, static_cast<int32_t>(pos), condition);
+              });
+        }
+        return icupy::to_pyarray(
+            "i", std::vector<int32_t>(offsets.begin(), offsets.end()));
+      },
+      py::arg("s"), py::arg("span_condition") = USET_SPAN_SIMPLE, R"doc(
+      Return the maximal runs of *s* that are spanned by this set with
+      *span_condition*, as a flat ``array.array('i')`` of (start, end) pairs
+      in UTF-16 code units.
+
+      For example, ``USET_SPAN_SIMPLE`` returns the runs of characters in
+      this set and ``USET_SPAN_NOT_CONTAINED`` returns the runs of characters
+      not in this set.
+
+      The whole text is scanned in one call with the GIL released. If this
+      set is not frozen, a frozen copy is used; call :meth:`.freeze`
+      beforehand to avoid the copy.
+
+      .. seealso::
+
+         :meth:`.span`
+         :meth:`.span_runs_utf8`
+
+      .. rubric:: Example
+
+      .. code-block:: python
+
+         >>> from icupy import icu
+         >>> digits = icu.UnicodeSet("[:Nd:]").freeze()
+         >>> digits.span_runs("ab12c3")
+         array('i', [2, 4, 5, 6])
+         >>> digits.span_runs("ab12c3", icu.USetSpanCondition.USET_SPAN_NOT_CONTAINED)
+         array('i', [0, 2, 4, 5])
+      )doc");
+
+  us.def(
+      "span_runs_utf8",
+      [](const UnicodeSet &self, const py::buffer &b,
+         USetSpanCondition span_condition) {
+        const auto info = icupy::request_buffer(b, 1);
+        std::vector<int64_t> offsets;
+        {
+          py::gil_scoped_release release;
+          std::unique_ptr<UnicodeSet> copy;
+          const auto &set = icupy::frozen(self, copy);
+          const auto data = static_cast<const char *>(info->ptr);
+          const auto size = static_cast<int64_t>(info->size);
+          offsets = icupy::span_runs(
+              size, span_condition,
+              [&](int64_t pos, USetSpanCondition condition) -> int64_t {
+                // spanUTF8() takes an int32_t length, so a larger buffer is
+                // spanned in pieces split at character boundaries.
+                while (pos < size) {
+                  int64_t length = std::min<int64_t>(size - pos, INT32_MAX);
+                  if (pos + length < size) {
+                    while (length > 0 && U8_IS_TRAIL(static_cast<uint8_t>(
+                                             data[pos + length]))) {
+                      --length;
+                    }
+                  }
+                  const auto n = set.spanUTF8(
+                      data + pos, static_cast<int32_t>(length), condition);
+                  pos += n;
+                  if (n < length) {
+                    break;
+                  }
+                }
+                return pos;
+              });
+        }
+        return icupy::to_pyarray("q", offsets);
+      },
+      py::arg("b"), py::arg("span_condition") = USET_SPAN_SIMPLE, R"doc(
+      Same as :meth:`.span_runs`, except that *b* is UTF-8 text in an object
+      that supports the buffer protocol, such as ``bytes``, ``bytearray``,
+      ``memoryview``, or :class:`mmap.mmap`.
+
+      Return a flat ``array.array('q')`` of (start, end) pairs in bytes.
+      )doc");
+
 #if (U_ICU_VERSION_MAJOR_NUM >= 76)
   us.def(
       "strings",
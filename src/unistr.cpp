@@ -146,11 +146,15 @@ string.
       .def(
           // [10] UnicodeString(const S &text)
           //      UnicodeString(const char16_t *text)
-          py::init([](const std::u16string &text) {
+          py::init([](const icupy::PyUnicodeString &text) {
 #if (U_ICU_VERSION_MAJOR_NUM >= 76)
-            return std::make_unique<UnicodeString>(text);
+            return std::make_unique<UnicodeString>(text.value);
 #else
-            return std::make_unique<UnicodeString>(text.data());
+            auto length = text.value.indexOf(u'\0');
+            if (length == -1) {
+              length = text.value.length();
+            }
+            return std::make_unique<UnicodeString>(text.value, 0, length);
 #endif
           }),
           py::arg("text"), R"doc(
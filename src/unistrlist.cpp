@@ -1,8 +1,14 @@
 #include "unistrlist.hpp"
+#include "parallel.hpp"
 #include "pybind11/pytypes.h"
+#include <cstring>
 #include <iomanip>
+#include <memory>
+#include <numeric>
+#include <optional>
 #include <pybind11/stl.h>
 #include <sstream>
+#include <thread>
 
 using namespace icu;
 
@@ -114,16 +120,18 @@ void UnicodeStringList::remove(const UnicodeStringVariant &value) {
 
 void UnicodeStringList::sort(icu::Collator *coll, bool reverse) {
   if (coll) {
-    std::stable_sort(
-        strings_.begin(), strings_.end(),
-        [&](const icu::UnicodeString &a, const icu::UnicodeString &b) {
-          ErrorCode error_code;
-          auto comp = coll->compare(a, b, error_code);
-          if (error_code.isFailure()) {
-            throw icupy::ICUError(error_code);
-          }
-          return reverse ? (comp > 0) : (comp < 0);
-        });
+    std::vector<const UnicodeString *> sources;
+    sources.reserve(strings_.size());
+    for (const auto &value : strings_) {
+      sources.push_back(&value);
+    }
+    const auto order = collation_order(*coll, sources, reverse);
+    std::vector<UnicodeString> result;
+    result.reserve(strings_.size());
+    for (auto i : order) {
+      result.push_back(std::move(strings_[i]));
+    }
+    strings_.swap(result);
   } else {
     std::stable_sort(
         strings_.begin(), strings_.end(),
@@ -134,6 +142,80 @@ void UnicodeStringList::sort(icu::Collator *coll, bool reverse) {
   }
 }
 
+std::vector<std::size_t>
+collation_order(const Collator &collator,
+                const std::vector<const UnicodeString *> &sources, bool reverse,
+                std::size_t workers) {
+  const auto size = sources.size();
+  workers = num_workers(size, workers);
+  auto bound = [&](std::size_t n) { return size * n / workers; };
+
+  // Sort keys are NUL-terminated and contain no other NUL bytes, so they
+  // can be compared with strcmp().
+  std::vector<const char *> keys(size);
+  std::vector<std::vector<uint8_t>> buffers(workers);
+  std::vector<std::size_t> order(size);
+  std::iota(order.begin(), order.end(), 0);
+  auto less = [&](std::size_t a, std::size_t b) {
+    const auto result = std::strcmp(keys[a], keys[b]);
+    return reverse ? (result > 0) : (result < 0);
+  };
+  auto sort_run = [&](const Collator &coll, std::size_t n) {
+    const auto begin = bound(n);
+    const auto end = bound(n + 1);
+    auto &buffer = buffers[n];
+    std::vector<std::size_t> offsets(end - begin + 1, 0);
+    std::size_t offset = 0;
+    for (auto i = begin; i < end; ++i) {
+      const auto &source = *sources[i];
+      auto capacity = static_cast<int32_t>(std::max<std::size_t>(
+          buffer.size() - offset, source.length() * 4 + 16));
+      buffer.resize(offset + capacity);
+      auto length = coll.getSortKey(source, buffer.data() + offset, capacity);
+      if (length > capacity) {
+        buffer.resize(offset + length);
+        coll.getSortKey(source, buffer.data() + offset, length);
+      }
+      offset += length;
+      offsets[i - begin + 1] = offset;
+    }
+    for (auto i = begin; i < end; ++i) {
+      keys[i] =
+          reinterpret_cast<const char *>(buffer.data() + offsets[i - begin]);
+    }
+    std::stable_sort(order.begin() + begin, order.begin() + end, less);
+  };
+
+  parallel_for(size, workers, [&](std::size_t n, std::size_t, std::size_t) {
+    if (n == 0) {
+      sort_run(collator, n);
+      return;
+    }
+    std::unique_ptr<Collator> coll(collator.clone());
+    if (!coll) {
+      throw ICUError(U_MEMORY_ALLOCATION_ERROR);
+    }
+    sort_run(*coll, n);
+  });
+
+  // Merge the sorted runs pairwise.
+  std::vector<std::thread> threads;
+  for (std::size_t width = 1; width < workers; width *= 2) {
+    threads.clear();
+    for (std::size_t n = 0; n + width < workers; n += 2 * width) {
+      auto first = order.begin() + bound(n);
+      auto middle = order.begin() + bound(n + width);
+      auto last = order.begin() + bound(std::min(n + 2 * width, workers));
+      threads.emplace_back(
+          [=, &less] { std::inplace_merge(first, middle, last, less); });
+    }
+    for (auto &thread : threads) {
+      thread.join();
+    }
+  }
+  return order;
+}
+
 } // namespace icupy
 
 void init_unistrlist(py::module &m) {
@@ -534,6 +616,86 @@ void init_unistrlist(py::module &m) {
       Reverse the order of the elements in the list.
       )doc");
 
+  m.def(
+      "collation_sort",
+      [](const py::iterable &items, const Collator &collator,
+         const std::optional<py::function> &key, bool reverse,
+         const std::optional<int> &workers, bool return_indices) -> py::object {
+        if (workers && *workers < 1) {
+          throw py::value_error("workers must be greater than 0");
+        }
+        py::list values(items);
+        const auto size = values.size();
+        std::vector<icupy::UnicodeStringVariant> strings;
+        strings.reserve(size);
+        for (const auto &value : values) {
+          auto text =
+              key ? (*key)(value) : py::reinterpret_borrow<py::object>(value);
+          py::detail::make_caster<icupy::UnicodeStringVariant> caster;
+          if (!caster.load(text, true)) {
+            throw py::type_error(
+                "collation_sort(): expected str or UnicodeString, got " +
+                std::string(py::str(py::type::of(text).attr("__name__"))));
+          }
+          strings.push_back(py::detail::cast_op<icupy::UnicodeStringVariant &&>(
+              std::move(caster)));
+        }
+        std::vector<const UnicodeString *> sources;
+        sources.reserve(size);
+        for (const auto &value : strings) {
+          sources.push_back(&icupy::to_unistr(value));
+        }
+        std::vector<std::size_t> order;
+        {
+          py::gil_scoped_release release;
+          order = icupy::collation_order(
+              collator, sources, reverse,
+              workers ? static_cast<std::size_t>(*workers) : 0);
+        }
+        if (return_indices) {
+          return icupy::to_pyarray(
+              "q", std::vector<int64_t>(order.begin(), order.end()));
+        }
+        py::list result(size);
+        for (std::size_t i = 0; i < size; ++i) {
+          result[i] = values[order[i]];
+        }
+        return std::move(result);
+      },
+      py::arg("items"), py::arg("collator"), py::kw_only(),
+      py::arg("key") = std::nullopt, py::arg("reverse") = false,
+      py::arg("workers") = std::nullopt, py::arg("return_indices") = false,
+      R"doc(
+      Return a new list containing all items from *items* in collation order
+      of *collator*.
+
+      *key* specifies a function of one argument that is used to extract a
+      string (``str`` or :class:`UnicodeString`) from each item. *reverse* is
+      the same as for :func:`sorted`. The sort is stable.
+
+      Each sort key is computed only once, and the keys are compared as byte
+      strings. The work is split across *workers* threads with the GIL
+      released; each thread uses its own clone of *collator*. If *workers* is
+      ``None``, the number of processors is used.
+
+      If *return_indices* is ``True``, return the permutation as an
+      ``array.array('q')`` of indices into *items* instead.
+
+      .. seealso::
+
+         :meth:`Collator.get_sort_keys`
+         :meth:`UnicodeStringList.sort`
+
+      .. rubric:: Example
+
+      .. code-block:: python
+
+         >>> from icupy import icu
+         >>> coll = icu.Collator.create_instance(icu.Locale("de"))
+         >>> icu.collation_sort(["Zebra", "äpfel", "Apfel"], coll)
+         ['Apfel', 'äpfel', 'Zebra']
+      )doc");
+
   usl.def(
       "sort",
       [](icupy::UnicodeStringList &self, std::optional<icu::Collator *> &coll,
@@ -5,6 +5,7 @@
 #include <algorithm>
 #include <list>
 #include <unicode/coll.h>
+#include <vector>
 
 namespace icupy {
 
@@ -133,6 +134,15 @@ public:
   void sort(icu::Collator *coll = nullptr, bool reverse = false);
 };
 
+// Return the indices of *sources* in collation order. The sort keys are
+// generated and sorted by up to *workers* threads (0 for the number of
+// processors), each with its own clone of *collator*, and the sorted runs are
+// merged afterwards. The sort is stable.
+std::vector<std::size_t>
+collation_order(const icu::Collator &collator,
+                const std::vector<const icu::UnicodeString *> &sources,
+                bool reverse = false, std::size_t workers = 1);
+
 } // namespace icupy
 
 #endif // ICUPY_UNISTRLIST_HPP
@@ -15,6 +15,7 @@ UBool URegexFindProgressCallbackPtr::callback(const void *native_context,
   if (native_context == nullptr) {
     throw std::runtime_error("URegexFindProgressCallback: context is not set");
   }
+  py::gil_scoped_acquire gil;
   auto pair = reinterpret_cast<FindProgressCallbackAndContextPair *>(
       const_cast<void *>(native_context));
   auto &action = pair->first;
@@ -35,6 +36,7 @@ UBool URegexMatchCallbackPtr::callback(const void *native_context,
   if (native_context == nullptr) {
     throw std::runtime_error("URegexMatchCallback: context is not set");
   }
+  py::gil_scoped_acquire gil;
   auto pair = reinterpret_cast<MatchCallbackAndContextPair *>(
       const_cast<void *>(native_context));
   auto &action = pair->first;
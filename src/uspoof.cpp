@@ -1,4 +1,5 @@
 #include "main.hpp"
+#include "parallel.hpp"
 #include "usetptr.hpp"
 #include "uspoofptr.hpp"
 #include <optional>
@@ -239,7 +240,7 @@ be performed, and to report results from the check function.
   //
   // struct USpoofChecker
   //
-  py::class_<icupy::USpoofCheckerPtr>(m, "USpoofChecker", R"doc(
+  py::class_<icupy::USpoofCheckerPtr> sc(m, "USpoofChecker", R"doc(
     USpoofChecker structure.
 
     .. seealso::
@@ -251,6 +252,103 @@ be performed, and to report results from the check function.
        :func:`uspoof_open`
     )doc");
 
+  sc.def(
+      "check_many",
+      [](const icupy::USpoofCheckerPtr &self,
+         const std::vector<icupy::UnicodeStringVariant> &strings,
+         const std::optional<int> &workers) {
+        if (workers && *workers < 1) {
+          throw py::value_error("workers must be greater than 0");
+        }
+        const auto size = strings.size();
+        std::vector<int32_t> results(size);
+        {
+          py::gil_scoped_release release;
+          // The check functions are thread-safe, so all threads share the
+          // checker.
+          icupy::parallel_for(
+              size,
+              icupy::num_workers(
+                  size, workers ? static_cast<std::size_t>(*workers) : 0),
+              [&](std::size_t, std::size_t begin, std::size_t end) {
+                ErrorCode error_code;
+                for (auto i = begin; i < end; ++i) {
+#if (U_ICU_VERSION_MAJOR_NUM >= 58)
+                  results[i] = uspoof_check2UnicodeString(
+                      self, icupy::to_unistr(strings[i]), nullptr, error_code);
+#else
+                  results[i] = uspoof_checkUnicodeString(
+                      self, icupy::to_unistr(strings[i]), nullptr, error_code);
+#endif // (U_ICU_VERSION_MAJOR_NUM >= 58)
+                  if (error_code.isFailure()) {
+                    throw icupy::ICUError(error_code);
+                  }
+                }
+              });
+        }
+        return icupy::to_pyarray("i", results);
+      },
+      py::arg("strings"), py::kw_only(), py::arg("workers") = std::nullopt,
+      R"doc(
+      Check each string in *strings* and return an ``array.array('i')`` of
+      the results, which are bit sets of :class:`USpoofChecks` (0 if no
+      issue is found).
+
+      Same as calling :func:`uspoof_check2_unicode_string` for each string.
+      The strings are checked in parallel by *workers* threads with the GIL
+      released. If *workers* is ``None``, the number of processors is used.
+      )doc");
+
+  sc.def(
+      "skeletons_many",
+      [](const icupy::USpoofCheckerPtr &self,
+         const std::vector<icupy::UnicodeStringVariant> &strings,
+         const std::optional<int> &workers) {
+        if (workers && *workers < 1) {
+          throw py::value_error("workers must be greater than 0");
+        }
+        const auto size = strings.size();
+        std::vector<UnicodeString> results(size);
+        {
+          py::gil_scoped_release release;
+          icupy::parallel_for(
+              size,
+              icupy::num_workers(
+                  size, workers ? static_cast<std::size_t>(*workers) : 0),
+              [&](std::size_t, std::size_t begin, std::size_t end) {
+                ErrorCode error_code;
+                for (auto i = begin; i < end; ++i) {
+                  uspoof_getSkeletonUnicodeString(self, 0,
+                                                  icupy::to_unistr(strings[i]),
+                                                  results[i], error_code);
+                  if (error_code.isFailure()) {
+                    throw icupy::ICUError(error_code);
+                  }
+                }
+              });
+        }
+        py::list result(size);
+        for (std::size_t i = 0; i < size; ++i) {
+          result[i] = icupy::to_pystr(results[i]);
+        }
+        return result;
+      },
+      py::arg("strings"), py::kw_only(), py::arg("workers") = std::nullopt,
+      R"doc(
+      Return a list of the skeletons of the strings in *strings*.
+
+      Two strings are confusable if their skeletons are identical, so the
+      skeletons can be used as keys to find confusable strings without
+      comparing every pair. Same as calling
+      :func:`uspoof_get_skeleton_unicode_string` for each string. The
+      skeletons are computed in parallel by *workers* threads with the GIL
+      released. If *workers* is ``None``, the number of processors is used.
+
+      .. seealso::
+
+         :class:`icupy.spoof.ConfusableIndex`
+      )doc");
+
 #if (U_ICU_VERSION_MAJOR_NUM >= 58)
   //
   // struct USpoofCheckResult
@@ -25,6 +25,52 @@ UText *UTextPtr::get() const { return p_; }
 
 const SharedVoidPtr &UTextPtr::get_source() const { return source_; }
 
+static int64_t normalize_length(int64_t length, py::ssize_t size) {
+  if (length == -1) {
+    return size;
+  }
+  if (length < 0 || length > size) {
+    throw py::value_error("length out of range: " + std::to_string(length));
+  }
+  return length;
+}
+
+std::unique_ptr<UTextPtr> open_utf8_buffer(UText *ut, const py::buffer &b,
+                                           int64_t length) {
+  auto info = request_buffer(b, 1);
+  length = normalize_length(length, info->size);
+  ErrorCode error_code;
+  auto p = utext_openUTF8(ut, static_cast<const char *>(info->ptr), length,
+                          error_code);
+  if (error_code.isFailure()) {
+    throw ICUError(error_code);
+  }
+  return std::make_unique<UTextPtr>(p, info);
+}
+
+std::unique_ptr<UTextPtr> open_utf8_file(const py::object &path) {
+  auto file = py::module_::import("io").attr("open")(path, "rb");
+  py::object data;
+  try {
+    auto fd = file.attr("fileno")();
+    auto size = py::module_::import("os").attr("fstat")(fd).attr("st_size");
+    if (size.cast<int64_t>() == 0) {
+      // An empty file cannot be mapped.
+      data = py::bytes();
+    } else {
+      auto mmap = py::module_::import("mmap");
+      data = mmap.attr("mmap")(fd, 0,
+                               py::arg("access") = mmap.attr("ACCESS_READ"));
+    }
+  } catch (...) {
+    file.attr("close")();
+    throw;
+  }
+  // The map remains valid after the file is closed.
+  file.attr("close")();
+  return open_utf8_buffer(nullptr, data, -1);
+}
+
 //
 // class UTextVector
 //
@@ -131,6 +177,20 @@ void init_utext(py::module &m) {
        :func:`utext_open_utf8`
     )doc");
 
+  utp.def_static("from_file", &icupy::open_utf8_file, py::arg("path"), R"doc(
+      Return a new ``UText`` for the UTF-8 text in the file *path*.
+
+      The file is mapped into memory read-only instead of being read, so
+      that a large file can be searched with :class:`RegexMatcher` or
+      iterated with :class:`BreakIterator` without loading it. Call
+      :func:`utext_close` when the ``UText`` is no longer needed; the map is
+      released when the ``UText`` object is destroyed.
+
+      .. seealso::
+
+         :func:`utext_open_utf8`
+      )doc");
+
   utp.def(
       "__eq__",
       [](const icupy::UTextPtr &self, const icupy::UTextPtr &other) {
@@ -423,24 +483,45 @@ void init_utext(py::module &m) {
 
   m.def(
       "utext_open_uchars",
-      [](std::optional<icupy::UTextPtr> &ut, const std::u16string &s,
-         int64_t length) {
-        auto normalized_length = length;
-        if (normalized_length == -1) {
-          normalized_length = static_cast<int64_t>(s.size());
+      [](std::optional<icupy::UTextPtr> &ut,
+         const std::variant<py::buffer, std::u16string> &s, int64_t length) {
+        const UChar *data = nullptr;
+        icupy::SharedVoidPtr source;
+        if (std::holds_alternative<py::buffer>(s)) {
+          auto info =
+              icupy::request_buffer(std::get<py::buffer>(s), sizeof(UChar));
+          length = icupy::normalize_length(length, info->size);
+          data = static_cast<const UChar *>(info->ptr);
+          source = info;
+        } else {
+          const auto &text = std::get<std::u16string>(s);
+          auto normalized_length = length;
+          if (normalized_length == -1) {
+            normalized_length = static_cast<int64_t>(text.size());
+          }
+          auto s_ptr = std::make_shared<std::u16string>(
+              text, 0, std::max(normalized_length, int64_t{0}));
+          data = s_ptr->data();
+          source = s_ptr;
         }
-        auto s_ptr = std::make_shared<std::u16string>(
-            s, 0, std::max(normalized_length, int64_t{0}));
         ErrorCode error_code;
-        auto p = utext_openUChars(ut.value_or(nullptr), s_ptr->data(), length,
-                                  error_code);
+        auto p =
+            utext_openUChars(ut.value_or(nullptr), data, length, error_code);
         if (error_code.isFailure()) {
           throw icupy::ICUError(error_code);
         }
-        return std::make_unique<icupy::UTextPtr>(p, s_ptr);
+        return std::make_unique<icupy::UTextPtr>(p, source);
       },
       py::keep_alive<1, 0>(), py::arg("ut"), py::arg("s"),
-      py::arg("length") = -1);
+      py::arg("length") = -1, R"doc(
+      Open *ut*, or a new ``UText`` if *ut* is ``None``, for the UTF-16 text
+      *s*.
+
+      *s* is either a ``str`` or an object that supports the buffer protocol
+      with 2-byte items, such as ``array.array('H')``. A buffer is used
+      without copying it and is held until the ``UText`` object is
+      destroyed. If *length* is -1, the whole buffer is used.
+      )doc");
 
   m.def(
       "utext_open_unicode_string",
@@ -456,24 +537,24 @@ void init_utext(py::module &m) {
 
   m.def(
       "utext_open_utf8",
-      [](std::optional<icupy::UTextPtr> &ut, const py::bytes &s,
+      [](std::optional<icupy::UTextPtr> &ut, const py::buffer &b,
          int64_t length) {
-        const auto s_text = s.cast<std::string>();
-        if (length == -1) {
-          length = static_cast<int64_t>(s_text.size());
-        }
-        auto s_ptr = std::make_shared<std::string>(
-            s_text, 0, std::max(length, int64_t{0}));
-        ErrorCode error_code;
-        auto p = utext_openUTF8(ut.value_or(nullptr), s_ptr->data(), length,
-                                error_code);
-        if (error_code.isFailure()) {
-          throw icupy::ICUError(error_code);
-        }
-        return std::make_unique<icupy::UTextPtr>(p, s_ptr);
+        return icupy::open_utf8_buffer(ut.value_or(nullptr), b, length);
       },
       py::keep_alive<1, 0>(), py::arg("ut"), py::arg("s"),
-      py::arg("length") = -1);
+      py::arg("length") = -1, R"doc(
+      Open *ut*, or a new ``UText`` if *ut* is ``None``, for the UTF-8 text
+      in *s*, an object that supports the buffer protocol with 1-byte items,
+      such as ``bytes``, ``memoryview``, :class:`mmap.mmap`, or a NumPy
+      ``uint8`` array.
+
+      The buffer is used without copying it and is held until the ``UText``
+      object is destroyed. If *length* is -1, the whole buffer is used.
+
+      .. seealso::
+
+         :meth:`UText.from_file`
+      )doc");
 
   m.def(
       "utext_previous32",
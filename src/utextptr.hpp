@@ -1,6 +1,7 @@
 #ifndef ICUPY_UTEXTPTR_HPP
 #define ICUPY_UTEXTPTR_HPP
 
+#include "main.hpp"
 #include <memory>
 #include <unicode/utext.h>
 
@@ -38,6 +39,16 @@ private:
   SharedVoidPtr source_;
 };
 
+// Open *ut*, or a new UText if *ut* is nullptr, for the UTF-8 text in the
+// buffer *b* without copying it. The buffer is held until the returned
+// object is destroyed. If *length* is -1, the whole buffer is used.
+std::unique_ptr<UTextPtr> open_utf8_buffer(UText *ut, const py::buffer &b,
+                                           int64_t length = -1);
+
+// Return a new UText for the UTF-8 text in the file *path*, which is mapped
+// into memory read-only.
+std::unique_ptr<UTextPtr> open_utf8_file(const py::object &path);
+
 } // namespace icupy
 
 #endif // ICUPY_UTEXTPTR_HPP
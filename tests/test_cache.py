@@ -0,0 +1,158 @@
+import threading
+
+import pytest
+
+from icupy import icu
+from icupy.cache import Cache, CacheInfo
+
+
+def test_break_iterator() -> None:
+    cache = Cache()
+    bi = cache.break_iterator("en")
+    text = icu.UnicodeString("foo bar")
+    bi.set_text(text)
+    assert list(bi) == [3, 4, 7]
+
+    bi2 = cache.break_iterator(icu.Locale("en"), "word")
+    assert bi2 is not bi
+    assert cache.cache_info() == CacheInfo(1, 1, 0, 128, 1)
+
+    cache.break_iterator("en", "line")
+    assert cache.cache_info().misses == 2
+
+    with pytest.raises(ValueError, match="unknown break iterator type"):
+        cache.break_iterator("en", "paragraph")
+
+
+def test_cache_clear() -> None:
+    cache = Cache()
+    cache.collator("de")
+    cache.collator("de")
+    assert cache.cache_info() == CacheInfo(1, 1, 0, 128, 1)
+
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(0, 0, 0, 128, 0)
+    assert len(cache) == 0
+
+
+def test_collator() -> None:
+    cache = Cache()
+    coll = cache.collator("de")
+    assert isinstance(coll, icu.Collator)
+    assert cache.cache_info() == CacheInfo(0, 1, 0, 128, 1)
+
+    # The caller owns the clone
+    strength = icu.UColAttribute.UCOL_STRENGTH
+    coll.set_attribute(strength, icu.UColAttributeValue.UCOL_PRIMARY)
+    coll2 = cache.collator("de")
+    assert coll2 is not coll
+    assert coll2.get_attribute(strength) == icu.UColAttributeValue.UCOL_TERTIARY
+    assert cache.cache_info() == CacheInfo(1, 1, 0, 128, 1)
+
+
+def test_date_format() -> None:
+    cache = Cache()
+    fmt = cache.date_format("en", "yMMMd")
+    assert isinstance(fmt, icu.DateFormat)
+    fmt.set_time_zone(icu.TimeZone.get_gmt())
+    assert fmt.format(1215298800000.0, icu.UnicodeString()) == "Jul 5, 2008"
+
+    fmt2 = cache.date_format(icu.Locale("en"), "yMMMd")
+    assert fmt2 is not fmt
+    assert cache.date_format("en", "yMd") is not None
+    assert cache.cache_info() == CacheInfo(1, 2, 0, 128, 2)
+
+
+def test_eviction() -> None:
+    cache = Cache(maxsize=2)
+    cache.collator("de")
+    cache.collator("fr")
+    cache.collator("de")  # "fr" is the least recently used
+    cache.collator("ja")
+    assert cache.cache_info() == CacheInfo(1, 3, 1, 2, 2)
+
+    cache.collator("de")
+    assert cache.cache_info().hits == 2
+    cache.collator("fr")
+    assert cache.cache_info() == CacheInfo(2, 4, 2, 2, 2)
+
+    with pytest.raises(ValueError, match="maxsize"):
+        Cache(maxsize=0)
+
+
+def test_get() -> None:
+    cache = Cache()
+    calls = []
+
+    def factory() -> list[int]:
+        calls.append(1)
+        return [1, 2]
+
+    result = cache.get("key", factory, list)
+    assert result == [1, 2]
+    result.append(3)
+    assert cache.get("key", factory, list) == [1, 2]
+    assert cache.get("key", factory, None) is cache.get("key", factory, None)
+    assert len(calls) == 1
+
+
+@pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 62, reason="ICU4C<62")
+def test_number_formatter() -> None:
+    cache = Cache()
+    fmt = cache.number_formatter("en")
+    assert fmt.format_double(1234.5).to_string() == "1,234.5"
+
+    # Immutable formatters are shared
+    assert cache.number_formatter("en") is fmt
+
+    fmt2 = cache.number_formatter("en", "compact-short")
+    assert fmt2.format_int(1234).to_string() == "1.2K"
+    assert cache.cache_info() == CacheInfo(1, 2, 0, 128, 2)
+
+
+def test_plural_rules() -> None:
+    cache = Cache()
+    rules = cache.plural_rules("en")
+    assert rules.select(2) == "other"
+
+    rules = cache.plural_rules("en", icu.UPluralType.UPLURAL_TYPE_ORDINAL)
+    assert rules.select(2) == "two"
+    assert cache.cache_info().misses == 2
+
+
+def test_threads() -> None:
+    cache = Cache(maxsize=4)
+    locales = ["de", "en", "fr", "ja", "sv", "zh"]
+    errors = []
+
+    def worker() -> None:
+        try:
+            for i in range(60):
+                coll = cache.collator(locales[i % len(locales)])
+                coll.get_sort_key("abc")
+        except Exception as ex:  # noqa: BLE001
+            errors.append(ex)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+    info = cache.cache_info()
+    assert info.hits + info.misses == 240
+    assert info.currsize <= 4
+    assert info.evictions == info.misses - info.currsize
+
+
+def test_transliterator() -> None:
+    cache = Cache()
+    trans = cache.transliterator("Any-Latin")
+    text = icu.UnicodeString("あいう")
+    trans.transliterate(text)
+    assert text == "aiu"
+
+    assert cache.transliterator("Any-Latin") is not trans
+    cache.transliterator("Any-Latin", icu.UTransDirection.UTRANS_REVERSE)
+    assert cache.cache_info() == CacheInfo(1, 2, 0, 128, 2)
@@ -0,0 +1,195 @@
+import codecs
+import io
+import itertools
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import icupy.codecs
+from icupy import icu
+from icupy.codecs import IncrementalDecoder, IncrementalEncoder, StreamReader, StreamWriter
+
+
+@pytest.fixture
+def registered() -> Generator[None, None, None]:
+    icupy.codecs.register()
+    try:
+        yield
+    finally:
+        icupy.codecs.unregister()
+
+
+def test_incremental_decoder() -> None:
+    decoder = IncrementalDecoder("Shift_JIS")
+    data = "aあbい".encode("shift_jis")
+    result = "".join(decoder.decode(data[n : n + 1]) for n in range(len(data)))
+    result += decoder.decode(b"", final=True)
+    assert result == "aあbい"
+
+    assert decoder.decode(b"\x82") == ""
+    assert decoder.getstate() == (b"\x82", 0)
+    decoder.reset()
+    assert decoder.getstate() == (b"", 0)
+    assert decoder.decode(b"a", final=True) == "a"
+
+    decoder.setstate((b"\x82", 0))
+    assert decoder.getstate() == (b"\x82", 0)
+    assert decoder.decode(b"\xa0b") == "\u3042b"
+    assert decoder.getstate() == (b"", 0)
+
+    with pytest.raises(UnicodeDecodeError) as exc_info:
+        _ = decoder.decode(b"a\x82", final=True)
+    assert exc_info.value.encoding == "Shift_JIS"
+    assert (exc_info.value.start, exc_info.value.end) == (0, 2)
+    assert decoder.getstate() == (b"", 0)
+    assert decoder.decode(b"b", final=True) == "b"
+
+
+@pytest.mark.parametrize(
+    ("errors", "expected"),
+    [
+        ("ignore", "ab"),
+        ("replace", "a\ufffdb"),
+        ("backslashreplace", "a\\xFFb"),
+    ],
+)
+def test_incremental_decoder_errors(errors: str, expected: str) -> None:
+    decoder = IncrementalDecoder("us-ascii", errors)
+    assert decoder.decode(b"a\xffb", final=True) == expected
+
+    with pytest.raises(ValueError, match="unsupported"):
+        _ = IncrementalDecoder("us-ascii", "xmlcharrefreplace")
+
+
+def test_incremental_encoder() -> None:
+    encoder = IncrementalEncoder("ISO-2022-JP")
+    result = encoder.encode("aあ") + encoder.encode("b", final=True)
+    assert result == "aあb".encode("iso-2022-jp")
+
+    with pytest.raises(UnicodeEncodeError) as exc_info:
+        _ = encoder.encode("\U0001f338", final=True)
+    assert exc_info.value.encoding == "ISO-2022-JP"
+
+    encoder = IncrementalEncoder("us-ascii", "xmlcharrefreplace")
+    assert encoder.encode("aあ", final=True) == b"a&#12354;"
+
+    encoder.errors = "ignore"
+    assert encoder.encode("aあ", final=True) == b"a"
+
+
+def test_stream_reader() -> None:
+    data = "aあbい".encode("shift_jis") * 100
+    reader = StreamReader(io.BytesIO(data), "Shift_JIS")
+    result = []
+    while chunk := reader.read(3):
+        result.append(chunk)
+    assert "".join(result) == "aあbい" * 100
+
+
+def test_stream_writer() -> None:
+    stream = io.BytesIO()
+    writer = StreamWriter(stream, "ISO-2022-JP")
+    writer.write("aあ")
+    writer.writelines(["b", "い"])
+    writer.reset()
+    assert stream.getvalue() == "aあbい".encode("iso-2022-jp")
+
+    writer = StreamWriter(io.BytesIO(), "us-ascii")
+    with pytest.raises(UnicodeEncodeError):
+        writer.write("あ")
+
+
+def test_unsupported_errors() -> None:
+    with pytest.raises(ValueError, match="unsupported"):
+        _ = IncrementalEncoder("us-ascii", "surrogateescape")
+
+    with pytest.raises(icu.ICUError):
+        _ = IncrementalDecoder("no-such-encoding")
+
+
+@pytest.mark.usefixtures("registered")
+def test_register() -> None:
+    info = codecs.lookup("icu:ibm-943_P15A-2003")
+    assert info.name == "icu:ibm-943_P15A-2003"
+    assert codecs.lookup("icu:sjis").name == "icu:ibm-943_P15A-2003"
+    assert codecs.lookup("ICU:UTF8").name == "icu:UTF-8"
+
+    with pytest.raises(LookupError):
+        _ = codecs.lookup("icu:no-such-encoding")
+
+    # Calling register() more than once has no effect
+    icupy.codecs.register()
+
+    assert "aあ".encode("icu:ibm-943_P15A-2003") == b"a\x82\xa0"
+    assert b"a\x82\xa0".decode("icu:ibm-943_P15A-2003") == "aあ"
+    assert b"a\xffb".decode("icu:us-ascii", "replace") == "a\ufffdb"
+    assert "aあ".encode("icu:us-ascii", "xmlcharrefreplace") == b"a&#12354;"
+    with pytest.raises(UnicodeDecodeError):
+        _ = b"a\x82".decode("icu:ibm-943_P15A-2003")
+    # The pooled converter must be reset after an error
+    assert b"b".decode("icu:ibm-943_P15A-2003") == "b"
+
+    decoder = codecs.getincrementaldecoder("icu:ibm-943_P15A-2003")()
+    assert decoder.decode(b"\x82") == ""
+    assert decoder.decode(b"\xa0", final=True) == "あ"
+
+    encoder = codecs.getincrementalencoder("icu:ISO-2022-JP")("strict")
+    result = encoder.encode("aあ") + encoder.encode("", final=True)
+    assert result == "aあ".encode("iso-2022-jp")
+
+
+@pytest.mark.usefixtures("registered")
+def test_register_open_file(tmp_path: Path) -> None:
+    path = tmp_path / "test.txt"
+    text = "aあbい\n" * 1000
+    with path.open("w", encoding="icu:ibm-943_P15A-2003") as f:
+        f.write(text)
+    assert path.read_bytes() == text.encode("shift_jis")
+    with path.open(encoding="icu:ibm-943_P15A-2003") as f:
+        assert f.read() == text
+
+    with codecs.open(str(path), encoding="icu:ibm-943_P15A-2003") as f:
+        assert f.read() == text
+
+
+@pytest.mark.usefixtures("registered")
+def test_register_text_io_wrapper_tell_seek() -> None:
+    text = "a\u3042b\u3044\u3046cd\u3048\u304a\n" * 2
+    data = text.encode("shift_jis")
+    for chunk_size, size in itertools.product(range(1, 5), range(1, 4)):
+        f = io.TextIOWrapper(io.BytesIO(data), encoding="icu:shift_jis")
+        f._CHUNK_SIZE = chunk_size  # type: ignore[attr-defined]  # noqa: SLF001
+        positions = []
+        n = 0
+        while True:
+            positions.append((f.tell(), n))
+            s = f.read(size)
+            if not s:
+                break
+            n += len(s)
+        assert n == len(text)
+        for position, offset in positions:
+            f.seek(position)
+            assert f.read() == text[offset:], (chunk_size, size, offset)
+
+
+@pytest.mark.usefixtures("registered")
+def test_register_in_threads() -> None:
+    def _round_trip(n: int) -> str:
+        text = f"{n}あい"
+        return text.encode("icu:ibm-943_P15A-2003").decode("icu:ibm-943_P15A-2003")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_round_trip, range(100)))
+    assert results == [f"{n}あい" for n in range(100)]
+
+
+def test_unregister() -> None:
+    icupy.codecs.register()
+    icupy.codecs.unregister()
+    with pytest.raises(LookupError):
+        _ = codecs.lookup("icu:utf-8")
+    # Calling unregister() more than once has no effect
+    icupy.codecs.unregister()
@@ -1,4 +1,6 @@
+import array
 import copy
+import itertools
 
 import pytest
 
@@ -426,6 +428,43 @@ def test_format() -> None:
     )
 
 
+def test_format_many() -> None:
+    fmt = icu.SimpleDateFormat("yyyy-MM-dd HH:mm:ss.SSS", icu.Locale.get_english())
+    fmt.set_time_zone(icu.TimeZone.get_gmt())
+    dates = [1215298800000.0, 0.0, -1.5, 1215298800123.0]
+    expected = [
+        "2008-07-05 23:00:00.000",
+        "1970-01-01 00:00:00.000",
+        "1969-12-31 23:59:59.998",
+        "2008-07-05 23:00:00.123",
+    ]
+    result = fmt.format_many(dates)
+    assert isinstance(result, list)
+    assert result == expected
+    assert result == [fmt.format(x, icu.UnicodeString()) for x in dates]
+
+    assert fmt.format_many(array.array("d", dates)) == expected
+    assert fmt.format_many(array.array("q", [0, 1215298800123])) == [expected[1], expected[3]]
+    assert fmt.format_many([]) == []
+
+    # The calendar of the formatter is not modified
+    cal = fmt.get_calendar()
+    before = cal.get_time()
+    fmt.format_many(dates)
+    assert fmt.get_calendar().get_time() == before
+
+    out = [None] * 2
+    result = fmt.format_many([0, 1215298800000], out=out)
+    assert result is out
+    assert out == expected[1:2] + expected[:1]
+
+    with pytest.raises(ValueError, match="length of out"):
+        fmt.format_many(dates, out=out)
+
+    with pytest.raises(TypeError):
+        fmt.format_many(["2008-07-05"])
+
+
 @pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 53, reason="ICU4C<53")
 def test_get_boolean_attribute() -> None:
     fmt = icu.DateFormat.create_date_time_instance(
@@ -575,6 +614,58 @@ def test_parse() -> None:
     assert exc_info.value.args[0] == icu.UErrorCode.U_ILLEGAL_ARGUMENT_ERROR
 
 
+def test_parse_many() -> None:
+    fmt = icu.SimpleDateFormat("yyyy-MM-dd HH:mm", icu.Locale.get_us())
+    fmt.set_time_zone(icu.TimeZone.get_gmt())
+    strings = [
+        "2008-07-05 23:00",
+        "n/a",
+        "2008-07-05 23:00 UTC",
+        icu.UnicodeString("1970-01-01 00:01"),
+    ]
+
+    result = fmt.parse_many(strings)
+    assert isinstance(result, array.array)
+    assert result.typecode == "q"
+    assert result.tolist() == [1215298800000, -(2**63), -(2**63), 60000]
+
+    values, mask = fmt.parse_many(strings, errors="mask")
+    assert values.tolist() == result.tolist()
+    assert mask.typecode == "B"
+    assert mask.tolist() == [1, 0, 0, 1]
+
+    with pytest.raises(ValueError, match=r"index 1: 'n/a'"):
+        fmt.parse_many(strings, errors="raise")
+
+    with pytest.raises(ValueError, match="errors must be"):
+        fmt.parse_many(strings, errors="nan")
+
+    # Leniency can be changed for a call without modifying the formatter
+    assert fmt.is_lenient() is True
+    assert fmt.parse_many(["2008-02-30 00:00"]).tolist() == [1204329600000]
+    assert fmt.parse_many(["2008-02-30 00:00"], lenient=False).tolist() == [-(2**63)]
+    assert fmt.is_lenient() is True
+
+    assert len(fmt.parse_many([])) == 0
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 8])
+def test_parse_many_workers(workers: int) -> None:
+    fmt = icu.SimpleDateFormat("yyyy-MM-dd HH:mm", icu.Locale.get_us())
+    fmt.set_time_zone(icu.TimeZone.get_gmt())
+    strings = [
+        f"{y}-{m:02}-{d:02} {h:02}:{d:02}"
+        for y, m, d, h in itertools.product(
+            range(1990, 2010), range(1, 13), range(1, 29), [0, 13]
+        )
+    ]
+    expected = [fmt.parse(x) for x in strings]
+    assert fmt.parse_many(strings, workers=workers).tolist() == expected
+
+    with pytest.raises(ValueError, match="workers must be"):
+        fmt.parse_many(strings, workers=0)
+
+
 def test_parse_object() -> None:
     fmt = icu.DateFormat.create_date_time_instance(
         icu.DateFormat.SHORT, icu.DateFormat.LONG, icu.Locale.get_english()
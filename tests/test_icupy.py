@@ -1,5 +1,7 @@
 import copy
 import sys
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -212,6 +214,37 @@ def test_icu_error() -> None:
         assert ex.args[0] == icu.U_ILLEGAL_ARGUMENT_ERROR
         assert ex.error_code == icu.U_ILLEGAL_ARGUMENT_ERROR
 
+    # The attributes belong to the exception instance, not to the type
+    assert not hasattr(icu.ICUError, "error_code")
+    assert not hasattr(icu.ICUError, "reason")
+
+
+def test_icu_error_in_threads() -> None:
+    def _raise(n: int) -> tuple[icu.UErrorCode, icu.UErrorCode]:
+        try:
+            if n % 2:
+                icu.RegexPattern.compile("(", 0)
+            else:
+                icu.UnicodeSet("[a-")
+        except icu.ICUError as ex:
+            return ex.args[0].get(), ex.error_code.get()
+        raise AssertionError
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_raise, range(200)))
+    for n, (status, error_code) in enumerate(results):
+        expected = (
+            icu.UErrorCode.U_REGEX_MISMATCHED_PAREN if n % 2 else icu.UErrorCode.U_MALFORMED_SET
+        )
+        assert status == error_code == expected
+
+
+@pytest.mark.skipif(not hasattr(sys, "_is_gil_enabled"), reason="Python<3.13")
+def test_free_threading() -> None:
+    # Importing the module does not re-enable the GIL on free-threaded builds
+    if sysconfig.get_config_var("Py_GIL_DISABLED"):
+        assert sys._is_gil_enabled() is False  # noqa: SLF001
+
 
 @pytest.mark.skipif(not sys.platform.startswith("win"), reason="Windows Only")
 def test_import() -> None:
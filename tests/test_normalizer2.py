@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from icupy import icu
@@ -162,6 +164,67 @@ def test_filtered_normalizer2() -> None:
     assert decomposition == icu.UnicodeString("A\\u0304", -1, icu.US_INV).unescape()
 
 
+def test_normalize_in_threads() -> None:
+    n2 = icu.Normalizer2.get_instance(None, "nfkc_cf", icu.UNormalization2Mode.UNORM2_COMPOSE)
+    data = [f"\uff21\uff22\uff23 {i}" for i in range(100)]
+    expected = [n2.normalize(x) for x in data]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result = list(executor.map(n2.normalize, data))
+    assert result == expected
+    assert result[0] == "abc 0"
+
+
+def test_normalize_many() -> None:
+    n2 = icu.Normalizer2.get_instance(None, "nfkc_cf", icu.UNormalization2Mode.UNORM2_COMPOSE)
+    normalized = "abc"
+    data = [
+        normalized,
+        "\uff21\uff22\uff23",
+        icu.UnicodeString("A\u030a", -1),
+        "",
+        "caf\xc9",
+        "\U0001d400\U0001f338",
+        "x\ud800",
+    ]
+    result = n2.normalize_many(data)
+    assert isinstance(result, list)
+    assert all(isinstance(x, str) for x in result)
+    assert result == [str(n2.normalize(x)) for x in data[:-1]] + ["x\ud800"]
+    assert result == ["abc", "abc", "\xe5", "", "caf\xe9", "a\U0001f338", "x\ud800"]
+
+    # Already normalized strings are returned as they are
+    assert result[0] is normalized
+
+    assert n2.normalize_many(tuple(data[:2])) == ["abc", "abc"]
+    assert n2.normalize_many([]) == []
+
+    with pytest.raises(TypeError):
+        _ = n2.normalize_many([1, 2])
+
+    # list[bool] icu::Normalizer2::isNormalized(...) for each string
+    result2 = n2.is_normalized_many(data)
+    assert result2 == [True, False, False, True, False, False, True]
+
+    # list[UNormalizationCheckResult] icu::Normalizer2::quickCheck(...) for each string
+    nfc = icu.Normalizer2.get_nfc_instance()
+    result3 = nfc.quick_check_many(["a", "\u0958", "\u0300"])
+    assert result3 == [
+        icu.UNormalizationCheckResult.UNORM_YES,
+        icu.UNormalizationCheckResult.UNORM_NO,
+        icu.UNormalizationCheckResult.UNORM_MAYBE,
+    ]
+
+
+def test_normalize_many_in_threads() -> None:
+    n2 = icu.Normalizer2.get_instance(None, "nfkc_cf", icu.UNormalization2Mode.UNORM2_COMPOSE)
+    chunks = [[f"\uff21\uff22\uff23 {i}", f"x{i}"] * 100 for i in range(20)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result = list(executor.map(n2.normalize_many, chunks))
+    assert result == [[f"abc {i}", f"x{i}"] * 100 for i in range(20)]
+
+
 @pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 49, reason="ICU4C<49")
 def test_get_instance() -> None:
     # static const Normalizer2 *icu::Normalizer2::getInstance(
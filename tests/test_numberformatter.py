@@ -5,6 +5,7 @@ from icupy import icu
 if icu.U_ICU_VERSION_MAJOR_NUM < 60:
     pytest.skip("ICU4C<60", allow_module_level=True)
 
+import array
 import copy
 
 
@@ -407,6 +408,53 @@ def test_localized_number_formatter_75() -> None:
     assert actual1 == "2 メートル"
 
 
+@pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 62, reason="ICU4C<62")
+def test_localized_number_formatter_format_many() -> None:
+    fmt = icu.number.NumberFormatter.with_locale(icu.Locale.get_us())
+
+    values = [1234.5, -1, 2**70, 0.25, True]
+    expected = [fmt.format_double(1234.5).to_string(), "-1"]
+    expected += [fmt.format_decimal(str(2**70)).to_string(), "0.25", "1"]
+    result = fmt.format_many(values)
+    assert isinstance(result, list)
+    assert result == expected
+    assert all(isinstance(x, str) for x in result)
+
+    # Iterables other than sequences
+    assert fmt.format_many(x for x in values) == expected
+
+    assert fmt.format_many([]) == []
+
+    # Buffers
+    assert fmt.format_many(array.array("d", [1234.5, 0.25])) == ["1,234.5", "0.25"]
+    assert fmt.format_many(array.array("f", [0.5])) == ["0.5"]
+    assert fmt.format_many(array.array("q", [-(2**63), 1000])) == [
+        "-9,223,372,036,854,775,808",
+        "1,000",
+    ]
+    assert fmt.format_many(array.array("Q", [2**64 - 1])) == ["18,446,744,073,709,551,615"]
+    assert fmt.format_many(array.array("B", [255])) == ["255"]
+    assert fmt.format_many(memoryview(array.array("i", range(6)))[::2]) == ["0", "2", "4"]
+
+    # Preallocated output
+    out = [None] * 3
+    result = fmt.format_many(array.array("l", [1, 22, 333]), out=out)
+    assert result is out
+    assert out == ["1", "22", "333"]
+
+    with pytest.raises(ValueError, match="length of out"):
+        fmt.format_many([1, 2], out=[None])
+
+    with pytest.raises(TypeError):
+        fmt.format_many(["1"])
+
+    with pytest.raises(TypeError, match="unsupported buffer format"):
+        fmt.format_many(memoryview(b"ab").cast("c"))
+
+    with pytest.raises(ValueError, match="one-dimensional"):
+        fmt.format_many(memoryview(bytes(4)).cast("B", (2, 2)))
+
+
 @pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 62, reason="ICU4C<62")
 def test_localized_number_formatter_to_format() -> None:
     # [1]
@@ -1,3 +1,7 @@
+import array
+import itertools
+import math
+
 import pytest
 
 from icupy import icu
@@ -250,6 +254,66 @@ def test_create_instance_56() -> None:
     assert isinstance(test, icu.DecimalFormat)
 
 
+def test_parse_many() -> None:
+    fmt = icu.NumberFormat.create_instance(icu.Locale("de"))
+    strings = ["1.234,5", "-7", "abc", "12abc", "", icu.UnicodeString("0,25")]
+
+    result = fmt.parse_many(strings)
+    assert isinstance(result, array.array)
+    assert result.typecode == "d"
+    assert result[:2].tolist() == [1234.5, -7.0]
+    assert all(math.isnan(x) for x in result[2:5])
+    assert result[5] == 0.25
+
+    values, mask = fmt.parse_many(strings, errors="mask")
+    assert values.typecode == "d"
+    assert mask.typecode == "B"
+    assert mask.tolist() == [1, 1, 0, 0, 0, 1]
+
+    with pytest.raises(ValueError, match=r"index 2: 'abc'"):
+        fmt.parse_many(strings, errors="raise")
+    assert fmt.parse_many(strings[:2], errors="raise").tolist() == [1234.5, -7.0]
+
+    assert len(fmt.parse_many([])) == 0
+
+    with pytest.raises(ValueError, match="errors must be"):
+        fmt.parse_many(strings, errors="ignore")
+
+
+def test_parse_many_int64() -> None:
+    fmt = icu.NumberFormat.create_instance(icu.Locale("en"))
+    strings = ["9,007,199,254,740,993", "-7", "1.5", "abc", "9,223,372,036,854,775,808"]
+
+    result = fmt.parse_many(strings, dtype="q")
+    assert isinstance(result, array.array)
+    assert result.typecode == "q"
+    assert result.tolist() == [2**53 + 1, -7, -(2**63), -(2**63), -(2**63)]
+
+    values, mask = fmt.parse_many(strings, errors="mask", dtype="q")
+    assert values == result
+    assert mask.tolist() == [1, 1, 0, 0, 0]
+
+    with pytest.raises(ValueError, match=r"index 2: '1.5'"):
+        fmt.parse_many(strings, errors="raise", dtype="q")
+
+    with pytest.raises(ValueError, match="dtype must be"):
+        fmt.parse_many(strings, dtype="i")
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 8])
+def test_parse_many_workers(workers: int) -> None:
+    fmt = icu.NumberFormat.create_instance(icu.Locale("en"))
+    values = [
+        f"{sign}{n:,}.{d}"
+        for sign, n, d in itertools.product(["", "-"], range(0, 10**6, 997), range(3))
+    ]
+    expected = [float(x.replace(",", "")) for x in values]
+    assert fmt.parse_many(values, workers=workers).tolist() == expected
+
+    with pytest.raises(ValueError, match="workers must be"):
+        fmt.parse_many(values, workers=0)
+
+
 def test_create_percent_instance() -> None:
     default_locale = icu.Locale.get_default()
 
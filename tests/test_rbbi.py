@@ -1,3 +1,4 @@
+import array
 import copy
 
 import pytest
@@ -23,6 +24,25 @@ def test_adopt_text() -> None:
     # assert bi.next() == icu.UBRK_DONE
 
 
+def test_boundaries() -> None:
+    bi = icu.BreakIterator.create_word_instance(icu.ULOC_US)
+    src = icu.UnicodeString("foo bar baz.")
+    bi.set_text(src)
+    assert bi.next() == 3
+
+    result = bi.boundaries("Hello, \U0001f338 world!")
+    assert isinstance(result, array.array)
+    assert result.typecode == "i"
+    assert list(result) == [0, 5, 6, 7, 9, 10, 15, 16]
+
+    # The break iterator's text and position are not changed
+    assert bi.current() == 3
+    assert bi.next() == 4
+
+    assert list(bi.boundaries(src)) == [0, 3, 4, 7, 8, 11, 12]
+    assert list(bi.boundaries("")) == [0]
+
+
 def test_clone() -> None:
     bi1 = icu.BreakIterator.create_word_instance(icu.Locale.get_us())
     src = icu.UnicodeString("foo bar baz.")
@@ -669,6 +689,30 @@ def test_rule_based_break_iterator() -> None:
     # NotImplemented
 
 
+@pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 52, reason="ICU4C<52")
+def test_split() -> None:
+    bi = icu.BreakIterator.create_word_instance(icu.ULOC_US)
+    text = "Hello, \U0001f338 world 42!"
+    result = bi.split(text)
+    assert isinstance(result, list)
+    assert result == ["Hello", ",", " ", "\U0001f338", " ", "world", " ", "42", "!"]
+    assert "".join(result) == text
+
+    result = bi.split(text, (icu.UBRK_WORD_NUMBER, icu.UBRK_WORD_IDEO_LIMIT))
+    assert result == ["Hello", "world", "42"]
+
+    result = bi.split(
+        icu.UnicodeString(text), (icu.UBRK_WORD_NUMBER, icu.UBRK_WORD_NUMBER_LIMIT)
+    )
+    assert result == ["42"]
+
+    assert bi.split("") == []
+
+    bi = icu.BreakIterator.create_sentence_instance(icu.ULOC_US)
+    result = bi.split("She had nothing to do. The book had no pictures.")
+    assert result == ["She had nothing to do. ", "The book had no pictures."]
+
+
 def test_set_text() -> None:
     bi = icu.BreakIterator.create_word_instance(icu.Locale.get_us())
     src1 = icu.UnicodeString("foo bar baz.")
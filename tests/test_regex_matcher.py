@@ -1,4 +1,5 @@
 import string
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -799,6 +800,27 @@ def test_set_match_callback() -> None:
     assert callback3a is None
 
 
+def test_set_match_callback_in_thread() -> None:
+    result: list[int] = []
+
+    def _match_callback(_context: object, _steps: int) -> bool:
+        _ = _context
+        result.append(_steps)
+        return True
+
+    regexp = icu.UnicodeString("((.)+\\2)+x")
+    matcher = icu.RegexMatcher(regexp, 0)
+    src = icu.UnicodeString("aaaaaaaaaaaaaaaaaaaaaaab")
+    callback = icu.URegexMatchCallback(_match_callback)
+    matcher.set_match_callback(callback)
+    matcher.reset(src)
+
+    # The callback must reacquire the GIL released by matches()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(matcher.matches).result() is False
+    assert result == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16]
+
+
 def test_split() -> None:
     regexp = icu.UnicodeString("\\s+")
     matcher = icu.RegexMatcher(regexp, 0)
@@ -1,4 +1,7 @@
+import array
 import copy
+import mmap
+from pathlib import Path
 
 import pytest
 
@@ -124,6 +127,25 @@ def test_compile() -> None:
     icu.utext_close(regex6)
 
 
+def test_finditer_offsets() -> None:
+    pattern = icu.RegexPattern.compile(r"(\w)(\d)?", 0)
+    result = pattern.finditer_offsets("a1 b")
+    assert isinstance(result, array.array)
+    assert result.typecode == "i"
+    assert result.tolist() == [0, 2, 0, 1, 1, 2, 3, 4, 3, 4, -1, -1]
+
+    # Offsets are in UTF-16 code units
+    pattern = icu.RegexPattern.compile(r"\p{L}+", 0)
+    assert pattern.finditer_offsets("\U0001d400b c").tolist() == [0, 3, 4, 5]
+    assert pattern.finditer_offsets(icu.UnicodeString("x")).tolist() == [0, 1]
+    assert pattern.finditer_offsets("123").tolist() == []
+
+    text = "foo " * 10000
+    result = pattern.finditer_offsets(text)
+    assert len(result) == 20000
+    assert result[-2:].tolist() == [len(text) - 4, len(text) - 1]
+
+
 @pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 55, reason="ICU4C<55")
 def test_group_number_from_name() -> None:
     regex = icu.UnicodeString("01(?<A>23(?<B>45)67)(?<C>.*)")
@@ -268,6 +290,75 @@ def test_regex_pattern() -> None:
     assert test2.pattern() == "\\w+"
 
 
+def test_scan_file(tmp_path: Path) -> None:
+    path = tmp_path / "test.log"
+    data = "a1 b22\n\u3042\U0001f338 333\n".encode()
+    path.write_bytes(data)
+    pattern = icu.RegexPattern.compile("\\d+", 0)
+
+    it = pattern.scan_file(path)
+    assert isinstance(it, icu.RegexScanner)
+    assert iter(it) is it
+    result = list(it)
+    assert result == [array.array("q", [1, 2, 4, 6, 15, 18])]
+    assert [data[i:j] for i, j in zip(result[0][::2], result[0][1::2], strict=True)] == [
+        b"1",
+        b"22",
+        b"333",
+    ]
+
+    assert list(pattern.scan_file(str(path), chunk_hint=2)) == [
+        array.array("q", [1, 2, 4, 6]),
+        array.array("q", [15, 18]),
+    ]
+    assert list(pattern.scan_file(data, chunk_hint=3)) == result
+
+    with mmap.mmap(-1, len(data)) as m:
+        m.write(data)
+        it = pattern.scan_file(m)
+        assert next(it) == result[0]
+        with pytest.raises(StopIteration):
+            next(it)
+        del it
+
+    assert list(pattern.scan_file(b"abc")) == []
+
+    # The matches found before an error are yielded first
+    pattern2 = icu.RegexPattern.compile("\\d|(?:a|b)+", 0)
+    it = pattern2.scan_file(b"1 2 " + b"ab" * 2_000_000)
+    assert next(it) == array.array("q", [0, 1, 2, 3])
+    with pytest.raises(icu.ICUError) as exc_info:
+        next(it)
+    assert exc_info.value.args[0] == icu.UErrorCode.U_REGEX_STACK_OVERFLOW
+    with pytest.raises(StopIteration):
+        next(it)
+
+    with pytest.raises(FileNotFoundError):
+        pattern.scan_file(tmp_path / "nonexistent.log")
+
+    with pytest.raises(ValueError, match="chunk_hint"):
+        pattern.scan_file(data, chunk_hint=0)
+
+
+@pytest.mark.parametrize("workers", [None, 1, 2, 8])
+def test_search_many(workers: int | None) -> None:
+    pattern = icu.RegexPattern.compile(r"\d+", 0)
+    strings = ["abc123", "", "no digits", icu.UnicodeString("4"), "\U0001f600 56"]
+    result = pattern.search_many(strings, workers=workers)
+    assert isinstance(result, array.array)
+    assert result.typecode == "i"
+    assert result.tolist() == [3, 6, -1, -1, -1, -1, 0, 1, 3, 5]
+
+    strings = [f"line {n}: {'error' if n % 3 == 0 else 'ok'}" for n in range(5000)]
+    pattern = icu.RegexPattern.compile("ERROR", icu.URegexpFlag.UREGEX_CASE_INSENSITIVE)
+    result = pattern.search_many(strings, workers=workers)
+    starts = result[::2].tolist()
+    assert [n for n, x in enumerate(starts) if x >= 0] == list(range(0, 5000, 3))
+
+    with pytest.raises(ValueError, match="workers must be"):
+        pattern.search_many(strings, workers=0)
+
+
 def test_split() -> None:
     regex = icu.UnicodeString("\\s+")
     pattern = icu.RegexPattern.compile(regex, 0)
@@ -327,3 +418,20 @@ def test_split() -> None:
     assert exc_info.value.args[0] == icu.UErrorCode.U_ILLEGAL_ARGUMENT_ERROR
 
     icu.utext_close(src2)
+
+
+@pytest.mark.parametrize("workers", [None, 1, 2, 8])
+def test_sub_many(workers: int | None) -> None:
+    pattern = icu.RegexPattern.compile(r"(\w+)@(\w+)", 0)
+    strings = ["a@b c@d", "", "none", icu.UnicodeString("x@y")]
+    result = pattern.sub_many(strings, "$2 at $1", workers=workers)
+    assert result == ["b at a d at c", "", "none", "y at x"]
+    assert all(isinstance(x, str) for x in result)
+
+    strings = [f"user{n}@host{n}" for n in range(3000)]
+    expected = [f"host{n} at user{n}" for n in range(3000)]
+    assert pattern.sub_many(strings, "$2 at $1", workers=workers) == expected
+
+    with pytest.raises(icu.ICUError) as exc_info:
+        pattern.sub_many(strings, "$3", workers=workers)
+    assert exc_info.value.args[0] == icu.UErrorCode.U_INDEX_OUTOFBOUNDS_ERROR
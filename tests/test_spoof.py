@@ -0,0 +1,43 @@
+from icupy import icu
+from icupy.spoof import ConfusableIndex
+from icupy.utils import gc
+
+
+def test_confusable_index() -> None:
+    index = ConfusableIndex(["paypal", "example", "p\u0430ypal"])
+    assert len(index) == 3
+    assert list(index) == ["paypal", "p\u0430ypal", "example"]
+
+    assert index.find("paypa1") == ["paypal", "p\u0430ypal"]
+    assert index.find(icu.UnicodeString("exarnple")) == ["example"]
+    assert index.find("other") == []
+
+    assert "PAYPAL" not in index
+    assert "paypal" in index
+    assert "\u0440aypal" in index  # CYRILLIC SMALL LETTER ER
+    assert 1 not in index
+
+    assert list(index.groups()) == [["paypal", "p\u0430ypal"]]
+    assert list(index.groups(1)) == [["paypal", "p\u0430ypal"], ["example"]]
+
+    index.add("exarnple")
+    index.add("example")  # Duplicates are ignored
+    assert len(index) == 4
+    assert index.find("example") == ["example", "exarnple"]
+
+    index.update([icu.UnicodeString("PAYPAL"), "paypal"], workers=2)
+    assert len(index) == 5
+    assert index.skeleton("PAYPAL") == "PAYPAL"
+    assert index.find("PAYPAL") == ["PAYPAL"]
+
+
+def test_confusable_index_checker() -> None:
+    with gc(icu.uspoof_open(), icu.uspoof_close) as sc:
+        index = ConfusableIndex(checker=sc)
+        assert len(index) == 0
+        index.update(["l0l"])
+        assert index.find("lOl") == ["l0l"]
+        del index
+
+        # The checker is not closed by the index
+        assert icu.uspoof_are_confusable_unicode_string(sc, "l0l", "lOl")
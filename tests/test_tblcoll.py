@@ -561,6 +561,31 @@ def test_get_sort_key() -> None:
     assert result1 > result2
 
 
+def test_get_sort_keys() -> None:
+    coll = icu.Collator.create_instance(icu.Locale.get_japanese())
+    data = ["ABC", icu.UnicodeString("abc"), "", "あ" * 100]
+
+    result1 = coll.get_sort_keys(data)
+    assert isinstance(result1, list)
+    assert len(result1) == len(data)
+    assert all(isinstance(x, bytes) for x in result1)
+    assert result1 == [coll.get_sort_key(x) for x in data]
+
+    result2 = coll.get_sort_keys(tuple(data))
+    assert result2 == result1
+
+    result3 = coll.get_sort_keys(x for x in data)
+    assert result3 == result1
+
+    assert coll.get_sort_keys([]) == []
+
+    with pytest.raises(TypeError):
+        coll.get_sort_keys([1, 2, 3])
+
+    with pytest.raises(TypeError):
+        coll.get_sort_keys("abc")
+
+
 def test_get_tailored_set() -> None:
     coll1 = icu.Collator.create_instance(icu.Locale.get_english())
 
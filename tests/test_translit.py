@@ -504,6 +504,47 @@ def test_register_instance() -> None:
     assert "Any-MyRule3" in ids
 
 
+def test_stream() -> None:
+    trans = icu.Transliterator.create_instance(
+        "Latin-Katakana", icu.UTransDirection.UTRANS_FORWARD
+    )
+    text = "kyakkyo toukyou sanpo nippon " * 8
+    expected = icu.UnicodeString(text)
+    trans.transliterate(expected)
+
+    # Rules that span chunk boundaries are applied
+    chunks = ["k", "y", "a", "", icu.UnicodeString("kk"), "yo"]
+    assert "".join(trans.stream(chunks)) == "\u30ad\u30e3\u30c3\u30ad\u30e7"
+
+    for size in (1, 2, 3, 7, 64):
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        result = list(trans.stream(iter(chunks)))
+        assert all(isinstance(x, str) and x for x in result)
+        assert "".join(result) == expected
+        if size < 64:
+            # Finalized text is yielded before the end of the input
+            assert len(result) > 1
+
+    assert list(trans.stream([])) == []
+
+    with pytest.raises(TypeError):
+        list(trans.stream(["a", 1]))
+
+
+def test_stream_any_latin() -> None:
+    # getMaximumContextLength() is 0 for compound transliterators, but their
+    # rules look back at the preceding text
+    trans = icu.Transliterator.create_instance("Any-Latin", icu.UTransDirection.UTRANS_FORWARD)
+    text = "\u4e16\u754c\u4f60\u597d abc \u3042\u308a\u304c\u3068\u3046"
+    expected = icu.UnicodeString(text)
+    trans.transliterate(expected)
+
+    assert "".join(trans.stream(["\u4e16", "\u754c"])) == "sh\u00ec ji\u00e8"
+    for i in range(len(text) + 1):
+        assert "".join(trans.stream([text[:i], text[i:]])) == expected, i
+    assert "".join(trans.stream(text)) == expected
+
+
 def test_subclass_filtered_transliterate() -> None:
     tid = "Halfwidth-Fullwidth; Lower; Hiragana-Katakana; Katakana-Latin"
     filter_set = icu.UnicodeSet("[^0-9]")
@@ -694,3 +735,27 @@ def test_transliterate() -> None:
 
     # UTransPosition.__repr__() -> str
     assert repr(index) == ("UTransPosition(context_start=0, context_limit=5, start=4, limit=4)")
+
+
+def test_transliterate_many() -> None:
+    trans = icu.Transliterator.create_instance(
+        "Any-Latin; Latin-ASCII", icu.UTransDirection.UTRANS_FORWARD
+    )
+    strings = ["\u3042\u3044\u3046", "", icu.UnicodeString("\u00e9t\u00e9"), "abc"]
+    result = trans.transliterate_many(strings)
+    assert result == ["aiu", "", "ete", "abc"]
+    assert all(isinstance(x, str) for x in result)
+    assert strings[2] == "\u00e9t\u00e9"
+
+    strings = [f"\u3042{n}\u3044" for n in range(1000)]
+    expected = [f"a{n}i" for n in range(1000)]
+    for workers in (1, 2, 3, 8):
+        assert trans.transliterate_many(strings, workers=workers) == expected
+
+    with pytest.raises(ValueError, match="workers must be"):
+        trans.transliterate_many(strings, workers=0)
+
+    # Transliterators implemented in Python
+    t = _TestTrans("Seoridf-Sweorie")
+    assert t.transliterate_many(["abc", "de"], workers=4) == ["abc", "de"]
+    assert t.num_calls == 2
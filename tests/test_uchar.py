@@ -1,3 +1,5 @@
+import array
+
 import pytest
 
 from icupy import icu
@@ -189,6 +191,47 @@ def test_u_char_age() -> None:
     assert version_array[3] == 0
 
 
+def test_u_char_digit_value_many() -> None:
+    text = "A1\u0662\U0001d7ce"
+    result = icu.u_char_digit_value_many(text)
+    assert isinstance(result, array.array)
+    assert result.typecode == "i"
+    assert result.tolist() == [-1, 1, 2, 0]
+
+
+def test_u_char_direction_many() -> None:
+    text = "A1\u05d0 "
+    result = icu.u_char_direction_many([ord(c) for c in text])
+    assert result.typecode == "b"
+    assert result.tolist() == [icu.u_char_direction(ord(c)) for c in text]
+    assert result[2] == icu.UCharDirection.U_RIGHT_TO_LEFT
+
+
+def test_u_char_type_many() -> None:
+    text = "A1 \u0301"
+    result = icu.u_char_type_many(text)
+    assert isinstance(result, array.array)
+    assert result.typecode == "b"
+    assert result.tolist() == [
+        icu.UCharCategory.U_UPPERCASE_LETTER,
+        icu.UCharCategory.U_DECIMAL_DIGIT_NUMBER,
+        icu.UCharCategory.U_SPACE_SEPARATOR,
+        icu.UCharCategory.U_NON_SPACING_MARK,
+    ]
+    assert icu.u_char_type_many(array.array("I", [ord(c) for c in text])) == result
+    assert icu.u_char_type_many(array.array("b", [0x41])) == result[:1]
+    assert icu.u_char_type_many([]) == array.array("b")
+
+    with pytest.raises(TypeError):
+        icu.u_char_type_many(["A"])
+
+    with pytest.raises(TypeError):
+        icu.u_char_type_many(array.array("d", [65.5]))
+
+    with pytest.raises(ValueError, match="out of range"):
+        icu.u_char_type_many(array.array("Q", [1 << 40]))
+
+
 @pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 63, reason="ICU4C<63")
 def test_u_get_binary_property_set() -> None:
     # const USet *u_getBinaryPropertySet(UProperty property,
@@ -202,6 +245,18 @@ def test_u_get_binary_property_set() -> None:
     assert uniset.contains(0x3000)  # U+3000: Ideographic Space
 
 
+def test_u_get_combining_class_many() -> None:
+    result = icu.u_get_combining_class_many("a\u0301\u0327")
+    assert result.typecode == "B"
+    assert result.tolist() == [0, 230, 202]
+
+
+def test_u_get_gc_mask_many() -> None:
+    result = icu.u_get_gc_mask_many("A1")
+    assert result.typecode == "I"
+    assert result.tolist() == [icu.U_GC_LU_MASK, icu.U_GC_ND_MASK]
+
+
 @pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 75, reason="ICU4C<75")
 def test_u_get_id_types() -> None:
     c = 0x1D1DE
@@ -323,6 +378,108 @@ def test_u_get_int_property_map() -> None:
     assert value == icu.UEastAsianWidth.U_EA_FULLWIDTH
 
 
+def test_u_get_int_property_value_many() -> None:
+    text = "1\uff11\u00b1"
+    which = icu.UProperty.UCHAR_EAST_ASIAN_WIDTH
+    result = icu.u_get_int_property_value_many(text, which)
+    assert result.typecode == "i"
+    assert result.tolist() == [
+        icu.UEastAsianWidth.U_EA_NARROW,
+        icu.UEastAsianWidth.U_EA_FULLWIDTH,
+        icu.UEastAsianWidth.U_EA_AMBIGUOUS,
+    ]
+
+
+def test_u_get_numeric_value_many() -> None:
+    result = icu.u_get_numeric_value_many("1\u00bdA")
+    assert result.typecode == "d"
+    assert result.tolist() == [1.0, 0.5, icu.U_NO_NUMERIC_VALUE]
+
+
+def test_u_has_binary_property_many() -> None:
+    which = icu.UProperty.UCHAR_ALPHABETIC
+    result = icu.u_has_binary_property_many("A1 \u00e9", which)
+    assert result.typecode == "B"
+    assert result.tolist() == [1, 0, 0, 1]
+
+
+def test_u_tolower_many() -> None:
+    result = icu.u_tolower_many("A\u00c9z1")
+    assert result.typecode == "i"
+    assert result.tolist() == [ord(c) for c in "a\u00e9z1"]
+
+
+def test_u_totitle_many() -> None:
+    result = icu.u_totitle_many("a\u01c6")
+    assert result.typecode == "i"
+    assert result.tolist() == [ord("A"), 0x1C5]
+
+
+def test_u_toupper_many() -> None:
+    result = icu.u_toupper_many("a\u00e9Z1")
+    assert result.typecode == "i"
+    assert result.tolist() == [ord(c) for c in "A\u00c9Z1"]
+
+
+@pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 63, reason="ICU4C<63")
+def test_ucpmap_lookup() -> None:
+    ucpmap = icu.u_get_int_property_map(icu.UProperty.UCHAR_EAST_ASIAN_WIDTH)
+    text = "1\uff11\u00b1"
+    result = ucpmap.lookup(text)
+    assert isinstance(result, array.array)
+    assert result.typecode == "I"
+    assert result.tolist() == [
+        icu.UEastAsianWidth.U_EA_NARROW,
+        icu.UEastAsianWidth.U_EA_FULLWIDTH,
+        icu.UEastAsianWidth.U_EA_AMBIGUOUS,
+    ]
+    assert ucpmap.lookup(array.array("I", [ord(c) for c in text])) == result
+    assert ucpmap.lookup([]) == array.array("I")
+
+
+@pytest.mark.skipif(icu.U_ICU_VERSION_MAJOR_NUM < 63, reason="ICU4C<63")
+def test_ucpmap_to_arrays() -> None:
+    ucpmap = icu.u_get_int_property_map(icu.UProperty.UCHAR_EAST_ASIAN_WIDTH)
+    starts, ends, values = ucpmap.to_arrays()
+    assert isinstance(starts, array.array)
+    assert starts.typecode == ends.typecode == "i"
+    assert values.typecode == "I"
+    assert len(starts) == len(ends) == len(values) > 1
+    assert starts[0] == 0
+    assert ends[-1] == 0x10FFFF
+    assert all(starts[i + 1] == ends[i] + 1 for i in range(len(starts) - 1))
+    for start, end, value in zip(starts, ends, values, strict=True):
+        assert icu.ucpmap_get_range(
+            ucpmap, start, icu.UCPMapRangeOption.UCPMAP_RANGE_NORMAL, 0
+        ) == (end, value)
+
+    def _filter(_context: object, _value: int) -> int:
+        return _value | 0x1000
+
+    action = icu.UCPMapValueFilter(_filter)
+    _, _, values2 = ucpmap.to_arrays(icu.UCPMapRangeOption.UCPMAP_RANGE_NORMAL, 0, action)
+    assert all(value & 0x1000 for value in values2)
+
+    # An exception raised by the filter stops the iteration
+    calls = []
+
+    def _raising_filter(_context: object, _value: int) -> int:
+        calls.append(_value)
+        if len(calls) == 3:
+            raise KeyError(_value)
+        return _value
+
+    action2 = icu.UCPMapValueFilter(_raising_filter)
+    with pytest.raises(KeyError):
+        ucpmap.to_arrays(icu.UCPMapRangeOption.UCPMAP_RANGE_NORMAL, 0, action2)
+    assert len(calls) == 3
+
+    calls[:] = [0, 0]
+    with pytest.raises(KeyError):
+        icu.ucpmap_get_range(ucpmap, 0, icu.UCPMapRangeOption.UCPMAP_RANGE_NORMAL, 0, action2)
+    assert len(calls) == 3
+
+
 def test_u_get_unicode_version() -> None:
     # void u_getUnicodeVersion(UVersionInfo versionArray)
     version_array = icu.u_get_unicode_version()
@@ -332,3 +489,12 @@ def test_u_get_unicode_version() -> None:
     assert version_array[1] >= 0
     assert version_array[2] >= 0
     assert version_array[3] >= 0
+
+
+def test_ublock_get_code_many() -> None:
+    result = icu.ublock_get_code_many("A\u3042")
+    assert result.typecode == "i"
+    assert result.tolist() == [
+        icu.UBlockCode.UBLOCK_BASIC_LATIN,
+        icu.UBlockCode.UBLOCK_HIRAGANA,
+    ]
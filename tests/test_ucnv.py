@@ -1016,3 +1016,69 @@ def test_set_to_u_call_back_substitute() -> None:
         with pytest.raises(icu.ICUError) as exc_info:
             _ = icu.UnicodeString(src, -1, cnv)
         assert exc_info.value.error_code == icu.U_ILLEGAL_CHAR_FOUND
+
+
+def test_to_unicode() -> None:
+    with gc(icu.ucnv_open("Shift_JIS"), icu.ucnv_close) as cnv:
+        # str ucnv_to_unicode(UConverter *converter, buffer source, bool flush=True)
+        result = icu.ucnv_to_unicode(cnv, b"a\x82\xa0b")
+        assert isinstance(result, str)
+        assert result == "aあb"
+
+        # A multibyte sequence split across chunks
+        result = icu.ucnv_to_unicode(cnv, b"a\x82", False)
+        assert result == "a"
+        assert icu.ucnv_to_u_count_pending(cnv) == 1
+        result = icu.ucnv_to_unicode(cnv, bytearray(b"\xa0b"), False)
+        assert result == "あb"
+        assert icu.ucnv_to_u_count_pending(cnv) == 0
+        result = icu.ucnv_to_unicode(cnv, memoryview(b""), True)
+        assert result == ""
+
+        result = icu.ucnv_to_unicode(cnv, b"x" * 10000)
+        assert result == "x" * 10000
+
+        with pytest.raises(ValueError, match="C-contiguous"):
+            _ = icu.ucnv_to_unicode(cnv, memoryview(b"a\x82\xa0b")[::2])
+
+        action = icu.UConverterToUCallbackStop()
+        icu.ucnv_set_to_u_call_back(cnv, action)
+        with pytest.raises(icu.ICUError) as exc_info:
+            _ = icu.ucnv_to_unicode(cnv, b"a\x82")
+        assert exc_info.value.args[0] == icu.UErrorCode.U_TRUNCATED_CHAR_FOUND
+
+    with gc(icu.ucnv_open("utf-8"), icu.ucnv_close) as cnv:
+        result = icu.ucnv_to_unicode(cnv, b"\xf0\x9f\x8c\xb8")
+        assert result == "\U0001f338"
+
+
+def test_from_unicode() -> None:
+    with gc(icu.ucnv_open("ISO-2022-JP"), icu.ucnv_close) as cnv:
+        # bytes ucnv_from_unicode(UConverter *converter, str source, bool flush=True)
+        result = icu.ucnv_from_unicode(cnv, "aあb")
+        assert isinstance(result, bytes)
+        assert result == b'a\x1b$B$"\x1b(Bb'
+
+        result = icu.ucnv_from_unicode(cnv, "あ", False)
+        assert result == b'\x1b$B$"'
+        result = icu.ucnv_from_unicode(cnv, "", True)
+        assert result == b"\x1b(B"
+
+    with gc(icu.ucnv_open("utf-8"), icu.ucnv_close) as cnv:
+        result = icu.ucnv_from_unicode(cnv, "\U0001f338" * 1000)
+        assert result == b"\xf0\x9f\x8c\xb8" * 1000
+
+        # A surrogate pair split across chunks
+        result = icu.ucnv_from_unicode(cnv, "a\ud83c", False)
+        assert result == b"a"
+        assert icu.ucnv_from_u_count_pending(cnv) == 1
+        result = icu.ucnv_from_unicode(cnv, "\udf38", True)
+        assert result == b"\xf0\x9f\x8c\xb8"
+        assert icu.ucnv_from_u_count_pending(cnv) == 0
+
+    with gc(icu.ucnv_open("iso8859-1"), icu.ucnv_close) as cnv:
+        action = icu.UConverterFromUCallbackStop()
+        icu.ucnv_set_from_u_call_back(cnv, action)
+        with pytest.raises(icu.ICUError) as exc_info:
+            _ = icu.ucnv_from_unicode(cnv, "aあ")
+        assert exc_info.value.args[0] == icu.UErrorCode.U_INVALID_CHAR_FOUND
@@ -1,6 +1,8 @@
 from collections.abc import Iterable
 from functools import partial
 
+import pytest
+
 from icupy import icu
 from icupy.utils import gc
 
@@ -64,3 +66,60 @@ def test_api() -> None:
         assert icu.ucsdet_is_input_filter_enabled(ucsd) is True
 
         icu.ucsdet_set_declared_encoding(ucsd, "UTF-8", -1)
+
+
+@pytest.mark.parametrize("workers", [None, 1, 3])
+def test_detect_many(workers: int | None) -> None:
+    text = (
+        "\u3042\u308b\u65e5\u306e\u66ae\u65b9\u306e\u4e8b\u3067\u3042"
+        "\u308b\u3002\u4e00\u4eba\u306e\u4e0b\u4eba\u304c\u3001\u7f85"
+        "\u751f\u9580\u306e\u4e0b\u3067\u96e8\u3084\u307f\u3092\u5f85"
+        "\u3063\u3066\u3044\u305f\u3002"
+    ) * 4
+    buffers = [
+        text.encode(),
+        text.encode("shift_jis"),
+        memoryview(text.encode("euc-jp")),
+    ] * 20
+    result = icu.ucsdet_detect_many(buffers, workers=workers)
+    assert isinstance(result, list)
+    assert len(result) == len(buffers)
+    assert result[:3] == [
+        ("UTF-8", 100, ""),
+        ("Shift_JIS", 100, "ja"),
+        ("EUC-JP", 100, "ja"),
+    ]
+    with gc(icu.ucsdet_open(), icu.ucsdet_close) as ucsd:
+        for buffer, (name, confidence, language) in zip(buffers[:3], result[:3], strict=True):
+            icu.ucsdet_set_text(ucsd, bytes(buffer), -1)
+            ucsm = icu.ucsdet_detect(ucsd)
+            assert icu.ucsdet_get_name(ucsm) == name
+            assert icu.ucsdet_get_confidence(ucsm) == confidence
+            assert icu.ucsdet_get_language(ucsm) == language
+
+    # Only the first max_bytes bytes are examined
+    prefix = b"Hello, world. " * 4
+    buffer = prefix + text.encode("shift_jis")
+    assert icu.ucsdet_detect_many([buffer], workers=workers) == [("Shift_JIS", 100, "ja")]
+    result2 = icu.ucsdet_detect_many([buffer], workers=workers, max_bytes=len(prefix))
+    assert result2 == [("ISO-8859-1", 24, "it")]
+    assert icu.ucsdet_detect_many([prefix]) == result2
+
+    result3 = icu.ucsdet_detect_many(buffers[:3], workers=workers, max_bytes=10)
+    assert result3 == icu.ucsdet_detect_many([bytes(x[:10]) for x in buffers[:3]])
+
+    html = b"<html><body>" + text.encode("shift_jis") + b"</body></html>"
+    assert icu.ucsdet_detect_many([html], max_bytes=None, input_filter=True) == [
+        ("Shift_JIS", 100, "ja")
+    ]
+
+    assert icu.ucsdet_detect_many([]) == []
+
+    with pytest.raises(TypeError):
+        icu.ucsdet_detect_many([text])
+
+    with pytest.raises(ValueError, match="max_bytes must be greater than 0"):
+        icu.ucsdet_detect_many(buffers, max_bytes=0)
+
+    with pytest.raises(ValueError, match="workers must be greater than 0"):
+        icu.ucsdet_detect_many(buffers, workers=0)
@@ -1,4 +1,6 @@
+import array
 import copy
+import mmap
 
 import pytest
 
@@ -538,6 +540,22 @@ def test_contains() -> None:
     assert test1.contains(0x61, 0x61) is False
 
 
+def test_contains_many() -> None:
+    test1 = icu.UnicodeSet("[:Nd:]").freeze()
+    result = test1.contains_many("a1\uff12\U0001d7ce")
+    assert isinstance(result, array.array)
+    assert result == array.array("B", [0, 1, 1, 1])
+
+    assert test1.contains_many(array.array("I", [0x31, 0x41, 0x10FFFF])) == array.array(
+        "B", [1, 0, 0]
+    )
+    assert test1.contains_many([0x30, 0x61]) == array.array("B", [1, 0])
+    assert test1.contains_many([]) == array.array("B")
+
+    with pytest.raises(TypeError):
+        test1.contains_many(["1"])
+
+
 def test_contains_all() -> None:
     test1 = icu.UnicodeSet(0x30, 0x39)
 
@@ -1008,6 +1026,63 @@ def test_span() -> None:
     assert test1.span_utf8(b, 1, icu.USetSpanCondition.USET_SPAN_CONTAINED) == 0
 
 
+def test_span_runs() -> None:
+    test1 = icu.UnicodeSet("[:Nd:]")
+    result = test1.span_runs("ab12c3")
+    assert isinstance(result, array.array)
+    assert result == array.array("i", [2, 4, 5, 6])
+    assert not test1.is_frozen()
+
+    test1.freeze()
+    assert test1.span_runs(
+        icu.UnicodeString("ab12c3"), icu.USetSpanCondition.USET_SPAN_NOT_CONTAINED
+    ) == array.array("i", [0, 2, 4, 5])
+    assert test1.span_runs("") == array.array("i")
+
+    # UTF-16 offsets
+    assert test1.span_runs("\U0001d7ce1a") == array.array("i", [0, 3])
+
+    # Empty text and text that ends on a set boundary
+    for condition in [
+        icu.USetSpanCondition.USET_SPAN_NOT_CONTAINED,
+        icu.USetSpanCondition.USET_SPAN_CONTAINED,
+        icu.USetSpanCondition.USET_SPAN_SIMPLE,
+    ]:
+        assert test1.span_runs("", condition) == array.array("i")
+    assert test1.span_runs("ab12") == array.array("i", [2, 4])
+    assert test1.span_runs("12ab") == array.array("i", [0, 2])
+    assert test1.span_runs(
+        "ab12", icu.USetSpanCondition.USET_SPAN_NOT_CONTAINED
+    ) == array.array("i", [0, 2])
+
+    test2 = icu.UnicodeSet("[c{ab}]").freeze()
+    assert test2.span_runs("abcxab", icu.USetSpanCondition.USET_SPAN_CONTAINED) == array.array(
+        "i", [0, 3, 4, 6]
+    )
+    assert test2.span_runs("xa", icu.USetSpanCondition.USET_SPAN_CONTAINED) == array.array("i")
+
+
+def test_span_runs_utf8() -> None:
+    test1 = icu.UnicodeSet("[:Nd:]").freeze()
+    b = "\u3042\uff11\uff12b3".encode()
+    result = test1.span_runs_utf8(b)
+    assert isinstance(result, array.array)
+    assert result == array.array("q", [3, 9, 10, 11])
+    assert test1.span_runs_utf8(
+        bytearray(b), icu.USetSpanCondition.USET_SPAN_NOT_CONTAINED
+    ) == array.array("q", [0, 3, 9, 10])
+    assert test1.span_runs_utf8(memoryview(b)[3:]) == array.array("q", [0, 6, 7, 8])
+    assert test1.span_runs_utf8(b"") == array.array("q")
+    assert test1.span_runs_utf8("b\uff11".encode()) == array.array("q", [1, 4])
+
+    with mmap.mmap(-1, len(b)) as m:
+        m.write(b)
+        assert test1.span_runs_utf8(m) == array.array("q", [3, 9, 10, 11])
+
+    with pytest.raises(ValueError, match="one-dimensional"):
+        test1.span_runs_utf8(array.array("i", [0x31]))
+
+
 def test_span_back() -> None:
     test1 = icu.UnicodeSet(icu.UnicodeString("[0-9\u00df{ab}]"))
 
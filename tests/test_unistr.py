@@ -1980,6 +1980,49 @@ def test_starts_with() -> None:
     assert test1.starts_with(s3, -1) is False
 
 
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "abc",  # ASCII
+        "caf\xe9" * 100,  # UCS-1
+        "\u3042\u3044\u3046" * 100,  # UCS-2
+        "a\U0001f338b" * 100,  # UCS-4
+        "\U0001f338\u3042\xe9a",
+        "a\x00b",
+    ],
+)
+def test_str_to_unicode_string(text: str) -> None:
+    n16 = len(text.encode("utf-16-le")) // 2
+
+    # icu::UnicodeString icu::UnicodeString::operator+(const UnicodeString &s2)
+    test1 = icu.UnicodeString() + text
+    assert len(test1) == n16
+    assert str(test1) == text
+    assert test1 == text
+
+    # The result must not refer to the str object
+    text2 = "".join(list(text))
+    test2 = icu.UnicodeString("x") + text2
+    del text2
+    assert str(test2) == "x" + text
+
+    test3 = icu.UnicodeString(text, -1)
+    assert str(test3) == text.split("\x00", maxsplit=1)[0]
+
+
+def test_str_to_unicode_string_surrogates() -> None:
+    # Lone surrogates are kept as they are
+    test1 = icu.UnicodeString() + "a\ud800b"
+    assert len(test1) == 3
+    assert test1.char_at(1) == 0xD800
+
+    test2 = icu.UnicodeString() + "\U0001f338\udc00"
+    assert len(test2) == 3
+    assert test2.char32_at(0) == 0x1F338
+    assert test2.char_at(2) == 0xDC00
+
+
 def test_swap() -> None:
     test1 = icu.UnicodeString("abcd", 4, icu.US_INV)
     test2 = icu.UnicodeString(100, 0x7A, 100)
@@ -1,3 +1,6 @@
+import array
+import itertools
+
 import pytest
 
 from icupy import icu
@@ -21,6 +24,58 @@ def test_clear() -> None:
     assert list(usl) == []
 
 
+def test_collation_sort() -> None:
+    coll = icu.Collator.create_instance(icu.Locale("de"))
+    items = ["Zebra", "\xe4pfel", "Apfel", "apfel", "zebra"]
+
+    result = icu.collation_sort(items, coll)
+    assert result == ["apfel", "Apfel", "\xe4pfel", "zebra", "Zebra"]
+    assert result[0] is items[3]
+    assert items[0] == "Zebra"
+
+    result = icu.collation_sort(items, coll, reverse=True)
+    assert result == ["Zebra", "zebra", "\xe4pfel", "Apfel", "apfel"]
+
+    indices = icu.collation_sort(items, coll, return_indices=True)
+    assert isinstance(indices, array.array)
+    assert indices.typecode == "q"
+    assert list(indices) == [3, 2, 1, 4, 0]
+
+    # Sort is stable
+    records = [(1, "b"), (2, "a"), (3, "B"), (4, "a")]
+    result = icu.collation_sort(records, coll, key=lambda x: x[1])
+    assert result == [(2, "a"), (4, "a"), (1, "b"), (3, "B")]
+    result = icu.collation_sort(records, coll, key=lambda x: x[1], reverse=True)
+    assert result == [(3, "B"), (1, "b"), (2, "a"), (4, "a")]
+
+    # Any iterable, including UnicodeString items
+    result = icu.collation_sort(iter([icu.UnicodeString("b"), "a"]), coll)
+    assert result[0] == "a"
+    assert isinstance(result[1], icu.UnicodeString)
+    assert icu.collation_sort(icu.UnicodeStringList(["b", "a"]), coll) == ["a", "b"]
+    assert icu.collation_sort([], coll) == []
+
+    with pytest.raises(TypeError):
+        _ = icu.collation_sort([1, 2], coll)
+
+    with pytest.raises(ValueError, match="workers"):
+        _ = icu.collation_sort(items, coll, workers=0)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 8])
+def test_collation_sort_workers(workers: int) -> None:
+    coll = icu.Collator.create_instance(icu.Locale("en"))
+    items = ["".join(x) for x in itertools.product("aA\xe9\u3042 -", repeat=5)]
+    items.reverse()
+    expected = sorted(items, key=coll.get_sort_key)
+
+    result = icu.collation_sort(items, coll, workers=workers)
+    assert result == expected
+
+    result = icu.collation_sort(items, coll, reverse=True, workers=workers)
+    assert result == sorted(items, key=coll.get_sort_key, reverse=True)
+
+
 def test_count() -> None:
     # UnicodeStringList.count(value: UnicodeString | str) -> int
     usl = icu.UnicodeStringList(["a", "b", "c", "a"])
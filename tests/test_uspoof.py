@@ -1,3 +1,4 @@
+import array
 from pathlib import Path
 
 import pytest
@@ -568,6 +569,26 @@ def test_get_bidi_skeleton() -> None:
         assert dest.decode() == "Al<ש\u0307"
 
 
+@pytest.mark.parametrize("workers", [None, 1, 3])
+def test_check_many(workers: int | None) -> None:
+    strings = ["paypal", "p\u0430ypal", icu.UnicodeString("abc")] * 1000
+    with gc(icu.uspoof_open(), icu.uspoof_close) as sc:
+        result = sc.check_many(strings, workers=workers)
+        assert isinstance(result, array.array)
+        assert result.typecode == "i"
+        assert len(result) == len(strings)
+        assert result[:3] == array.array(
+            "i", [icu.uspoof_check_unicode_string(sc, s) for s in strings[:3]]
+        )
+        assert result[0] == result[2] == 0
+        assert result[1] != 0
+
+        assert sc.check_many([]) == array.array("i")
+
+        with pytest.raises(ValueError, match="workers must be greater than 0"):
+            sc.check_many(strings, workers=0)
+
+
 def test_open_from_serialized() -> None:
     with gc(icu.uspoof_open(), icu.uspoof_close) as sc:
         # int32_t uspoof_serialize(
@@ -663,6 +684,25 @@ def test_open_from_source() -> None:
         )
 
 
+@pytest.mark.parametrize("workers", [None, 1, 3])
+def test_skeletons_many(workers: int | None) -> None:
+    strings = ["paypal", "p\u0430ypal", icu.UnicodeString("l0l")] * 1000
+    with gc(icu.uspoof_open(), icu.uspoof_close) as sc:
+        result = sc.skeletons_many(strings, workers=workers)
+        assert isinstance(result, list)
+        assert len(result) == len(strings)
+        assert result[:3] == [
+            icu.uspoof_get_skeleton_unicode_string(sc, 0, s, icu.UnicodeString())
+            for s in strings[:3]
+        ]
+        assert result[0] == result[1] == "paypal"
+
+        assert sc.skeletons_many([]) == []
+
+        with pytest.raises(ValueError, match="workers must be greater than 0"):
+            sc.skeletons_many(strings, workers=0)
+
+
 def test_set_allowed_chars() -> None:
     with gc(icu.uspoof_open(), icu.uspoof_close) as sc:
         # void uspoof_setAllowedChars(
@@ -1,3 +1,7 @@
+import array
+import mmap
+from pathlib import Path
+
 import pytest
 
 from icupy import icu
@@ -227,6 +231,31 @@ def test_freeze() -> None:
         assert not icu.utext_is_writable(ut)
 
 
+def test_from_file(tmp_path: Path) -> None:
+    path = tmp_path / "test.txt"
+    path.write_bytes("foo 12\n\u3042\U0001f338 345\n".encode())
+    with gc(icu.UText.from_file(path), icu.utext_close) as ut:
+        assert not icu.utext_is_writable(ut)
+        assert icu.utext_native_length(ut) == 19
+        dest = icu.utext_extract(ut, 0, icu.utext_native_length(ut))
+        assert dest == "foo 12\n\u3042\U0001f338 345\n"
+
+        matcher = icu.RegexMatcher("\\d+", 0)
+        matcher.reset(ut)
+        result = []
+        while matcher.find():
+            result.append((matcher.start64(), matcher.end64()))
+        assert result == [(4, 6), (15, 18)]
+
+    path = tmp_path / "empty.txt"
+    path.touch()
+    with gc(icu.UText.from_file(str(path)), icu.utext_close) as ut:
+        assert icu.utext_native_length(ut) == 0
+
+    with pytest.raises(FileNotFoundError):
+        icu.UText.from_file(tmp_path / "nonexistent.txt")
+
+
 def test_open_character_iterator() -> None:
     src1 = icu.UnicodeString("\x41\U0001f338\x42")
     src2 = icu.UnicodeString("\x61\U0001f338\x62")
@@ -334,6 +363,28 @@ def test_open_uchars() -> None:
         # assert len(dest1) == 0
 
 
+def test_open_uchars_buffer() -> None:
+    b1 = array.array("H", [0x41, 0xD83C, 0xDF38, 0x42])
+    with gc(icu.utext_open_uchars(None, b1, -1), icu.utext_close) as ut1:
+        dest1 = icu.utext_extract(ut1, 0, icu.utext_native_length(ut1))
+        assert dest1 == "A\U0001f338B"
+
+        # The buffer is not copied
+        b1[0] = 0x61
+        dest1 = icu.utext_extract(ut1, 0, icu.utext_native_length(ut1))
+        assert dest1 == "a\U0001f338B"
+
+        icu.utext_open_uchars(ut1, memoryview(b1)[:3])
+        dest1 = icu.utext_extract(ut1, 0, icu.utext_native_length(ut1))
+        assert dest1 == "a\U0001f338"
+
+    with pytest.raises(ValueError, match="2-byte items"):
+        icu.utext_open_uchars(None, b"AB")
+
+    with pytest.raises(ValueError, match="length out of range"):
+        icu.utext_open_uchars(None, b1, 5)
+
+
 def test_open_unicode_string() -> None:
     s1 = icu.UnicodeString("\x41\U0001f338\x42")
     s2 = icu.UnicodeString("\x61\U0001f338\x62")
@@ -400,6 +451,37 @@ def test_open_utf8() -> None:
         assert dest1 == "a\U0001f338b"
 
 
+def test_open_utf8_buffer() -> None:
+    b = "\x41\U0001f338\x42".encode()
+    with gc(icu.utext_open_utf8(None, memoryview(b)[1:]), icu.utext_close) as ut1:
+        dest1 = icu.utext_extract(ut1, 0, icu.utext_native_length(ut1))
+        assert dest1 == "\U0001f338B"
+
+    with mmap.mmap(-1, len(b)) as m:
+        m.write(b)
+        ut1 = icu.utext_open_utf8(None, m)
+        dest1 = icu.utext_extract(ut1, 0, icu.utext_native_length(ut1))
+        assert dest1 == "A\U0001f338B"
+
+        # The map cannot be closed while the UText holds it
+        with pytest.raises(BufferError):
+            m.close()
+        icu.utext_close(ut1)
+        del ut1
+
+    ba = bytearray(b)
+    with gc(icu.utext_open_utf8(None, ba), icu.utext_close) as ut1:
+        ba[0] = 0x61
+        dest1 = icu.utext_extract(ut1, 0, icu.utext_native_length(ut1))
+        assert dest1 == "a\U0001f338B"
+
+    with pytest.raises(ValueError, match="1-byte items"):
+        icu.utext_open_utf8(None, array.array("H", [0x41]))
+
+    with pytest.raises(ValueError, match="length out of range"):
+        icu.utext_open_utf8(None, b, len(b) + 1)
+
+
 def test_replace() -> None:
     s1 = "ABC"
     with gc(icu.utext_open_uchars(None, s1, -1), icu.utext_close) as ut1:
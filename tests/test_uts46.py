@@ -1,3 +1,5 @@
+import array
+
 import pytest
 
 from icupy import icu
@@ -740,6 +742,65 @@ def test_api() -> None:
     assert result == b"\x61\x73\x73"
 
 
+@pytest.mark.parametrize("workers", [None, 1, 3])
+def test_names_to_ascii_many(workers: int | None) -> None:
+    names = ["www.B\u00fccher.de", "a..b", icu.UnicodeString("\u4f8b\u3048.jp")] * 1000
+    result, errors = _nontrans.names_to_ascii_many(names, workers=workers)
+    assert isinstance(result, list)
+    assert isinstance(errors, array.array)
+    assert errors.typecode == "I"
+    assert result[:3] == ["www.xn--bcher-kva.de", "a..b", "xn--r8jz45g.jp"]
+    assert errors[:3] == array.array("I", [0, icu.UIDNA_ERROR_EMPTY_LABEL, 0])
+    assert len(result) == len(errors) == 3000
+
+    expected = []
+    for name in names[:3]:
+        info = icu.IDNAInfo()
+        dest = icu.UnicodeString()
+        _nontrans.name_to_ascii(name, dest, info)
+        expected.append((str(dest), info.get_errors()))
+    assert list(zip(result[:3], errors[:3], strict=True)) == expected
+
+    # Newline-delimited UTF-8 names
+    data = "www.B\u00fccher.de\r\na..b\n\u4f8b\u3048.jp\n".encode()
+    assert _nontrans.names_to_ascii_many(data, workers=workers) == (
+        b"www.xn--bcher-kva.de\na..b\nxn--r8jz45g.jp\n",
+        errors[:3],
+    )
+    assert _nontrans.names_to_ascii_many(memoryview(data)[:-1], errors="keep") == (
+        b"www.xn--bcher-kva.de\na..b\nxn--r8jz45g.jp\n"
+    )
+    assert _nontrans.names_to_ascii_many(b"") == (b"", array.array("I"))
+    assert _nontrans.names_to_ascii_many([], errors="keep") == []
+
+    with pytest.raises(ValueError, match=r"name at index 1: 'a\.\.b' \(errors=0x1\)"):
+        _nontrans.names_to_ascii_many(names, errors="raise")
+    assert _nontrans.names_to_ascii_many(["example.com"], errors="raise") == ["example.com"]
+
+    with pytest.raises(ValueError, match="errors must be"):
+        _nontrans.names_to_ascii_many(names, errors="ignore")
+
+    with pytest.raises(ValueError, match="workers must be greater than 0"):
+        _nontrans.names_to_ascii_many(names, workers=0)
+
+    with pytest.raises(TypeError, match="not str"):
+        _nontrans.names_to_ascii_many("example.com")
+
+
+def test_names_to_unicode_many() -> None:
+    names = ["www.xn--bcher-kva.de", "xn--a.com", "example.com"]
+    result, errors = _nontrans.names_to_unicode_many(names)
+    assert result[0] == "www.b\u00fccher.de"
+    assert result[2] == "example.com"
+    assert errors[0] == errors[2] == 0
+    assert errors[1] == icu.UIDNA_ERROR_INVALID_ACE_LABEL
+
+    assert _nontrans.names_to_unicode_many(b"www.xn--bcher-kva.de\nexample.com") == (
+        "www.b\u00fccher.de\nexample.com\n".encode(),
+        array.array("I", [0, 0]),
+    )
+
+
 def test_not_std3() -> None:
     not3 = icu.IDNA.create_uts46_instance(icu.IDNA.CHECK_BIDI)
 